@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Serialization micro-benchmark for A2A payloads.
+
+Compares the previous path (``dataclasses.asdict`` deep copy + stdlib json)
+with the codec layer (shallow ``to_dict`` + each available codec) on
+representative payloads: a process_task request with conversation context
+and state snapshot, and a response carrying a large CRM record set.
+
+Usage:
+    python benchmark_a2a_codec.py --records 500 --messages 5 --iterations 200
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from dataclasses import asdict
+from typing import Any, Callable, Dict, List, Tuple
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from src.a2a.codec import JSONCodec, MsgPackCodec, _has_msgpack, _has_orjson
+from src.a2a.protocol import A2AArtifact, A2ARequest, A2AResponse, A2ATask
+from src.utils.agents.message_processing.unified_serialization import serialize_messages_for_json
+
+
+def make_task(messages: int) -> A2ATask:
+    """process_task request as built by the orchestrator's agent caller tools."""
+    conversation = []
+    for i in range(messages):
+        conversation.append(HumanMessage(content=f"Show me the open opportunities for account {i} " * 4))
+        conversation.append(AIMessage(content=f"Account {i} has 3 open opportunities worth $120,000. " * 6))
+    recent = serialize_messages_for_json(conversation, limit=messages)
+
+    context = {
+        "recent_messages": recent,
+        "memory": {"accounts": [{"id": f"001{i:012d}", "name": f"Account {i}"} for i in range(20)]},
+        "conversation_summary": "User is reviewing the Q3 pipeline across enterprise accounts. " * 5,
+        "user_id": "user-123",
+        "thread_id": "orchestrator-thread-1",
+        "schema_knowledge": {
+            obj: {"fields": [{"name": f"Field{i}__c", "type": "string", "label": f"Field {i}"} for i in range(40)]}
+            for obj in ["Account", "Contact", "Opportunity", "Lead", "Case", "Task"]
+        }
+    }
+    state_snapshot = {
+        "messages": recent,
+        "summary": context["conversation_summary"],
+        "memory": context["memory"]
+    }
+    return A2ATask(id="task-1", instruction="Get all open opportunities for Acme Corp",
+                   context=context, state_snapshot=state_snapshot)
+
+
+def make_result(records: int) -> Dict[str, Any]:
+    """process_task result carrying a large Salesforce record set."""
+    rows = [
+        {
+            "Id": f"006{i:012d}",
+            "Name": f"Opportunity {i}",
+            "StageName": "Negotiation/Review",
+            "Amount": 12500.0 + i,
+            "CloseDate": "2025-09-30",
+            "Account": {"Id": f"001{i % 50:012d}", "Name": f"Account {i % 50}"},
+            "Description": "Renewal with expansion into two new business units. " * 3
+        }
+        for i in range(records)
+    ]
+    artifact = A2AArtifact(id="artifact-1", task_id="task-1", content={"records": rows},
+                           content_type="application/json")
+    return {"status": "completed", "artifacts": [artifact]}
+
+
+def time_call(func: Callable[[], Any], iterations: int) -> float:
+    """Median microseconds per call."""
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1e6
+
+
+def baseline_request(task: A2ATask) -> bytes:
+    return json.dumps(A2ARequest("process_task", {"task": asdict(task)}).to_dict()).encode("utf-8")
+
+
+def baseline_response(result: Dict[str, Any]) -> bytes:
+    copied = {**result, "artifacts": [asdict(a) for a in result["artifacts"]]}
+    return json.dumps(A2AResponse(result=copied, request_id="1").to_dict()).encode("utf-8")
+
+
+def run(records: int, messages: int, iterations: int):
+    task = make_task(messages)
+    result = make_result(records)
+
+    codecs: List[Tuple[str, Any]] = [("json (stdlib)", JSONCodec(use_orjson=False))]
+    if _has_orjson:
+        codecs.append(("json (orjson)", JSONCodec(use_orjson=True)))
+    if _has_msgpack:
+        codecs.append(("msgpack", MsgPackCodec()))
+
+    payloads = {
+        "request": (
+            lambda: baseline_request(task),
+            lambda codec: codec.encode(A2ARequest("process_task", {"task": task.to_dict()}).to_dict())
+        ),
+        "response": (
+            lambda: baseline_response(result),
+            lambda codec: codec.encode(A2AResponse(result=result, request_id="1").to_dict())
+        )
+    }
+
+    print(f"records={records} messages={messages} iterations={iterations}")
+    print(f"{'payload':<10} {'path':<26} {'encode us':>10} {'decode us':>10} {'bytes':>9}")
+    for name, (baseline, encode) in payloads.items():
+        body = baseline()
+        encode_us = time_call(baseline, iterations)
+        decode_us = time_call(lambda: json.loads(body), iterations)
+        print(f"{name:<10} {'asdict + json (before)':<26} {encode_us:>10.0f} {decode_us:>10.0f} {len(body):>9}")
+
+        for label, codec in codecs:
+            body = encode(codec)
+            encode_us = time_call(lambda: encode(codec), iterations)
+            decode_us = time_call(lambda: codec.decode(body), iterations)
+            print(f"{name:<10} {'to_dict + ' + label:<26} {encode_us:>10.0f} {decode_us:>10.0f} {len(body):>9}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="A2A serialization benchmark")
+    parser.add_argument("--records", type=int, default=500, help="Records in the response payload")
+    parser.add_argument("--messages", type=int, default=5, help="Recent messages in the task context")
+    parser.add_argument("--iterations", type=int, default=200, help="Timed runs per measurement")
+    args = parser.parse_args()
+
+    run(args.records, args.messages, args.iterations)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Concurrency benchmark for the orchestrator graph.
+
+Runs N simultaneous OrchestratorA2AHandler.process_task calls against the real
+orchestrator graph, with the LLM and agent tool replaced by simulated-latency
+stand-ins (no Azure OpenAI or downstream agents needed). With native async
+nodes the concurrent wall time should stay close to a single task's latency;
+a graph that blocks the event loop degrades to the serial time.
+
+Usage:
+    python benchmark_orchestrator_concurrency.py --tasks 20 --llm-latency 0.2 --tool-latency 0.3
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import Any, List, Optional
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.tools import tool
+from langgraph.graph import StateGraph, END
+
+from src.orchestrator.a2a.handler import OrchestratorA2AHandler
+from src.orchestrator.a2a.orchestrator_graph import build_orchestrator_graph, OrchestratorGraphState
+
+
+class SimulatedLatencyLLM(BaseChatModel):
+    """Chat model that waits like a remote LLM, then calls one tool and answers."""
+
+    latency: float = 0.2
+
+    @property
+    def _llm_type(self) -> str:
+        return "simulated-latency"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _respond(self, messages: List[BaseMessage]) -> ChatResult:
+        if isinstance(messages[-1], ToolMessage):
+            message = AIMessage(content=f"Done: {messages[-1].content}")
+        else:
+            message = AIMessage(content="", tool_calls=[{
+                "name": "simulated_agent",
+                "args": {"instruction": str(messages[-1].content)},
+                "id": f"call_{time.monotonic_ns()}"
+            }])
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Optional[CallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        time.sleep(self.latency)
+        return self._respond(messages)
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+                         **kwargs: Any) -> ChatResult:
+        await asyncio.sleep(self.latency)
+        return self._respond(messages)
+
+
+def make_agent_tool(latency: float):
+    @tool
+    async def simulated_agent(instruction: str) -> str:
+        """Simulated downstream agent call."""
+        await asyncio.sleep(latency)
+        return f"handled '{instruction[:30]}'"
+    return simulated_agent
+
+
+def make_plan_execute_stub():
+    """Minimal subgraph so build_orchestrator_graph does not construct the real one."""
+    builder = StateGraph(OrchestratorGraphState)
+    builder.add_node("noop", lambda state: {})
+    builder.set_entry_point("noop")
+    builder.add_edge("noop", END)
+    return builder.compile()
+
+
+async def run_task(handler: OrchestratorA2AHandler, index: int) -> float:
+    started = time.perf_counter()
+    result = await handler.process_task({
+        "task": {
+            "id": f"bench-{index}",
+            "instruction": f"Benchmark request {index}",
+            "context": {"thread_id": f"bench-thread-{index}", "user_id": f"bench-user-{index}"}
+        }
+    })
+    if result.get("status") == "failed":
+        raise RuntimeError(f"task {index} failed: {result}")
+    return time.perf_counter() - started
+
+
+async def main(tasks: int, llm_latency: float, tool_latency: float):
+    handler = OrchestratorA2AHandler()
+    handler._graph = await build_orchestrator_graph(
+        tools=[make_agent_tool(tool_latency)],
+        llm=SimulatedLatencyLLM(latency=llm_latency),
+        system_prompt="You are a benchmark orchestrator.",
+        plan_execute_subgraph=make_plan_execute_stub()
+    )
+
+    # Warm up imports and lazy initialization outside the timed runs
+    await run_task(handler, -1)
+
+    started = time.perf_counter()
+    serial = [await run_task(handler, i) for i in range(tasks)]
+    serial_wall = time.perf_counter() - started
+
+    started = time.perf_counter()
+    concurrent = await asyncio.gather(*(run_task(handler, tasks + i) for i in range(tasks)))
+    concurrent_wall = time.perf_counter() - started
+
+    expected = 2 * llm_latency + tool_latency
+    print(f"tasks={tasks} simulated latency per task={expected:.2f}s")
+    print(f"serial:     wall={serial_wall:.2f}s  p50={statistics.median(serial):.2f}s")
+    print(f"concurrent: wall={concurrent_wall:.2f}s  p50={statistics.median(concurrent):.2f}s  "
+          f"max={max(concurrent):.2f}s")
+    print(f"speedup:    {serial_wall / concurrent_wall:.1f}x (ideal {tasks}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Orchestrator concurrency benchmark")
+    parser.add_argument("--tasks", type=int, default=20, help="Simultaneous process_task calls")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="Simulated seconds per LLM call")
+    parser.add_argument("--tool-latency", type=float, default=0.3, help="Simulated seconds per agent call")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.tasks, args.llm_latency, args.tool_latency))
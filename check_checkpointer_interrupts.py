@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Regression check: PrunedSQLiteSaver keeps pending writes across interrupts.
+
+LangGraph saves a superstep's pending writes (finished parallel nodes and
+the ``__interrupt__`` write) before the checkpoint they belong to is stored.
+If pruning dropped those writes, resuming an interrupt would lose the
+interrupt and run the finished sibling nodes again; with parallel plan
+steps that repeats Salesforce or Jira writes.
+
+The graph below fans out to a side-effecting node and a node that asks the
+user, for many turns on one thread with a small checkpoint limit, and checks
+that every turn reports its interrupt and runs the side effect exactly once.
+The same run on MemorySaver gives the reference count.
+
+Usage:
+    python check_checkpointer_interrupts.py --turns 20 --max-checkpoints 3
+"""
+
+import argparse
+import asyncio
+import operator
+import os
+import sys
+import tempfile
+from typing import Annotated, Dict, List, TypedDict
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, START, StateGraph
+from langgraph.types import Command, interrupt
+
+from src.utils.storage.checkpointer import PrunedSQLiteSaver
+
+
+class TurnState(TypedDict):
+    results: Annotated[List[str], operator.add]
+
+
+def build_graph(checkpointer: BaseCheckpointSaver, side_effects: Dict[str, int]):
+    """Fan out to a write that must run once and a step that waits for the user."""
+
+    async def write_record(state: TurnState) -> Dict[str, List[str]]:
+        side_effects["count"] += 1
+        return {"results": ["written"]}
+
+    async def ask_user(state: TurnState) -> Dict[str, List[str]]:
+        answer = interrupt("Confirm?")
+        return {"results": [f"answer:{answer}"]}
+
+    graph = StateGraph(TurnState)
+    graph.add_node("write_record", write_record)
+    graph.add_node("ask_user", ask_user)
+    graph.add_edge(START, "write_record")
+    graph.add_edge(START, "ask_user")
+    graph.add_edge("write_record", END)
+    graph.add_edge("ask_user", END)
+    return graph.compile(checkpointer=checkpointer)
+
+
+async def run_turns(checkpointer: BaseCheckpointSaver, turns: int) -> Dict[str, int]:
+    side_effects = {"count": 0}
+    app = build_graph(checkpointer, side_effects)
+    config = {"configurable": {"thread_id": "interrupt-check"}}
+    missing_interrupts = 0
+    for turn in range(turns):
+        await app.ainvoke({"results": []}, config)
+        state = await app.aget_state(config)
+        if not any(task.interrupts for task in state.tasks):
+            missing_interrupts += 1
+        await app.ainvoke(Command(resume=f"yes-{turn}"), config)
+    return {"side_effects": side_effects["count"], "missing_interrupts": missing_interrupts}
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--max-checkpoints", type=int, default=3)
+    args = parser.parse_args()
+
+    reference = await run_turns(MemorySaver(), args.turns)
+    with tempfile.TemporaryDirectory() as directory:
+        saver = PrunedSQLiteSaver(os.path.join(directory, "check.db"), max_checkpoints=args.max_checkpoints)
+        try:
+            pruned = await run_turns(saver, args.turns)
+        finally:
+            await saver.pool.close_all()
+
+    print(f"turns={args.turns} max_checkpoints={args.max_checkpoints}")
+    print(f"MemorySaver         side effects={reference['side_effects']:3d} "
+          f"missing interrupts={reference['missing_interrupts']}")
+    print(f"PrunedSQLiteSaver   side effects={pruned['side_effects']:3d} "
+          f"missing interrupts={pruned['missing_interrupts']}")
+
+    ok = pruned == reference and pruned["side_effects"] == args.turns and not pruned["missing_interrupts"]
+    print("OK" if ok else "FAILED: pending writes were lost")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
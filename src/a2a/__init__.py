@@ -9,8 +9,13 @@ from .protocol import (
     A2AResponse,
     A2AClient,
     A2AServer,
-    A2AException
+    A2AException,
+    A2AMethodNotFound,
+    A2AOverloaded,
+    A2AStateCacheMiss,
+    A2AStreamInterrupted
 )
+from .streaming import emit_task_event, is_streaming
 
 __all__ = [
     "AgentCard",
@@ -21,5 +26,11 @@ __all__ = [
     "A2AResponse",
     "A2AClient",
     "A2AServer",
-    "A2AException"
+    "A2AException",
+    "A2AMethodNotFound",
+    "A2AOverloaded",
+    "A2AStateCacheMiss",
+    "A2AStreamInterrupted",
+    "emit_task_event",
+    "is_streaming"
 ]
\ No newline at end of file
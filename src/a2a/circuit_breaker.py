@@ -1,10 +1,13 @@
 """Circuit breaker pattern for resilient agent-to-agent communication."""
 
 import asyncio
+import functools
 import time
-from typing import Dict, Any, Optional, Callable
+from collections import deque
+from typing import AsyncContextManager, Deque, Dict, Any, Optional, Callable
 from enum import Enum
 from dataclasses import dataclass
+from src.utils.config import config as app_config
 from src.utils.logging.framework import SmartLogger, log_execution
 
 logger = SmartLogger("a2a")
@@ -18,17 +21,85 @@ class CircuitBreakerState(Enum):
 @dataclass
 class CircuitBreakerConfig:
     """Configuration for circuit breaker"""
-    failure_threshold: int = 5
+    failure_threshold: int = 5  # consecutive failures that trip the breaker
     timeout: int = 30  # seconds
     half_open_max_calls: int = 3
     reset_timeout: int = 60  # seconds to wait before trying again
+    window_seconds: float = 60.0  # span of the sliding window
+    window_buckets: int = 12  # ring buffer slots; one slot spans window/buckets
+    minimum_calls: int = 10  # calls in the window before rates are judged
+    failure_rate_threshold: float = 0.5
+    slow_call_duration: float = 20.0  # seconds; slower successes count as slow
+    slow_call_rate_threshold: float = 0.8
+    
+    @classmethod
+    def from_config(cls) -> "CircuitBreakerConfig":
+        return cls(
+            failure_threshold=app_config.get('a2a.circuit_breaker_threshold', 5),
+            timeout=app_config.get('a2a.circuit_breaker_timeout', 30),
+            window_seconds=app_config.get('a2a.circuit_breaker_window', 60.0),
+            minimum_calls=app_config.get('a2a.circuit_breaker_min_calls', 10),
+            failure_rate_threshold=app_config.get('a2a.circuit_breaker_failure_rate', 0.5),
+            slow_call_duration=app_config.get('a2a.circuit_breaker_slow_call_duration', 20.0),
+            slow_call_rate_threshold=app_config.get('a2a.circuit_breaker_slow_call_rate', 0.8)
+        )
 
 class CircuitBreakerException(Exception):
     """Exception raised when circuit breaker is open"""
     pass
 
+class NonRetryableError(Exception):
+    """Definitive answer from a healthy peer.
+    
+    Raised through the breaker without counting as a failure, and never
+    retried: repeating the same call would get the same answer.
+    """
+    pass
+
+class SlidingWindow:
+    """Call outcomes over the last N seconds, in a ring buffer of time buckets"""
+    
+    def __init__(self, window_seconds: float, buckets: int):
+        self.buckets = max(1, buckets)
+        self.bucket_seconds = max(window_seconds, 0.001) / self.buckets
+        # Per slot: [bucket number, calls, failures, slow calls]
+        self._slots = [[-1, 0, 0, 0] for _ in range(self.buckets)]
+    
+    def _bucket(self, now: float) -> int:
+        return int(now / self.bucket_seconds)
+    
+    def record(self, failed: bool, slow: bool, now: Optional[float] = None):
+        bucket = self._bucket(time.monotonic() if now is None else now)
+        slot = self._slots[bucket % self.buckets]
+        if slot[0] != bucket:
+            # Slot last used a full window ago; start it over
+            slot[:] = [bucket, 0, 0, 0]
+        slot[1] += 1
+        slot[2] += failed
+        slot[3] += slow
+    
+    def totals(self, now: Optional[float] = None) -> Dict[str, int]:
+        oldest = self._bucket(time.monotonic() if now is None else now) - self.buckets
+        calls = failures = slow = 0
+        for bucket, slot_calls, slot_failures, slot_slow in self._slots:
+            if bucket > oldest:
+                calls += slot_calls
+                failures += slot_failures
+                slow += slot_slow
+        return {"calls": calls, "failures": failures, "slow_calls": slow}
+    
+    def reset(self):
+        for slot in self._slots:
+            slot[:] = [-1, 0, 0, 0]
+
 class CircuitBreaker:
-    """Circuit breaker implementation for protecting against cascading failures"""
+    """Circuit breaker implementation for protecting against cascading failures
+    
+    Trips (CLOSED -> OPEN) when, within the sliding window and once
+    ``minimum_calls`` calls have been seen, the failure rate or the rate of
+    slow calls reaches its threshold. A run of ``failure_threshold``
+    consecutive failures also trips it, so low-traffic calls are covered.
+    """
     
     @log_execution
     def __init__(self, name: str, config: CircuitBreakerConfig):
@@ -39,6 +110,7 @@ class CircuitBreaker:
         self.success_count = 0
         self.last_failure_time = 0
         self.half_open_calls = 0
+        self.window = SlidingWindow(config.window_seconds, config.window_buckets)
         self._lock = asyncio.Lock()
     
     @log_execution
@@ -85,36 +157,82 @@ class CircuitBreaker:
                     limit=self.config.half_open_max_calls
                 )
                 raise CircuitBreakerException(f"Circuit breaker {self.name} half-open limit exceeded")
+            
+            if self.state == CircuitBreakerState.HALF_OPEN:
+                self.half_open_calls += 1
         
         # Execute the function
+        started = time.monotonic()
         try:
-            if self.state == CircuitBreakerState.HALF_OPEN:
-                self.half_open_calls += 1
-            
             result = await func(*args, **kwargs)
             
             # Handle success
             async with self._lock:
-                await self._on_success()
+                await self._on_success(time.monotonic() - started)
             
             return result
             
+        except NonRetryableError:
+            # The peer answered; it is not failing
+            async with self._lock:
+                await self._on_success(time.monotonic() - started)
+            raise
+            
         except Exception:
             # Handle failure
             async with self._lock:
                 await self._on_failure()
             raise
     
+    def _open(self, from_state: CircuitBreakerState, reason: str, **details):
+        self.state = CircuitBreakerState.OPEN
+        self.last_failure_time = time.time()
+        self.success_count = 0
+        logger.warning("circuit_breaker_state_change",
+            operation="state_transition",
+            circuit_name=self.name,
+            from_state=from_state.name,
+            to_state="OPEN",
+            reason=reason,
+            **details
+        )
+    
+    def _check_window(self):
+        """Trip the closed breaker if the window's failure or slow-call rate is too high"""
+        totals = self.window.totals()
+        calls = totals["calls"]
+        if calls < self.config.minimum_calls:
+            return
+        failure_rate = totals["failures"] / calls
+        slow_call_rate = totals["slow_calls"] / calls
+        if failure_rate >= self.config.failure_rate_threshold:
+            self._open(CircuitBreakerState.CLOSED, "failure_rate_exceeded",
+                       failure_rate=round(failure_rate, 2),
+                       failure_rate_threshold=self.config.failure_rate_threshold,
+                       window_calls=calls)
+        elif slow_call_rate >= self.config.slow_call_rate_threshold:
+            self._open(CircuitBreakerState.CLOSED, "slow_call_rate_exceeded",
+                       slow_call_rate=round(slow_call_rate, 2),
+                       slow_call_rate_threshold=self.config.slow_call_rate_threshold,
+                       slow_call_duration=self.config.slow_call_duration,
+                       window_calls=calls)
+    
     @log_execution
-    async def _on_success(self):
+    async def _on_success(self, duration: float = 0.0):
         """Handle successful call"""
+        slow = duration >= self.config.slow_call_duration
+        self.window.record(failed=False, slow=slow)
+        
         if self.state == CircuitBreakerState.HALF_OPEN:
+            if slow:
+                # Still too slow to take full traffic again
+                self._open(CircuitBreakerState.HALF_OPEN, "slow_call_in_half_open",
+                           duration=round(duration, 2))
+                return
             self.success_count += 1
             # If we've had enough successes in half-open, close the circuit
             if self.success_count >= self.config.half_open_max_calls:
                 self.state = CircuitBreakerState.CLOSED
-                self.failure_count = 0
-                self.success_count = 0
                 logger.info("circuit_breaker_state_change",
                     operation="state_transition",
                     circuit_name=self.name,
@@ -123,51 +241,52 @@ class CircuitBreaker:
                     success_count=self.success_count,
                     reason="success_threshold_reached"
                 )
+                self.failure_count = 0
+                self.success_count = 0
+                # Judge the recovered agent on fresh calls only
+                self.window.reset()
         elif self.state == CircuitBreakerState.CLOSED:
             # Reset failure count on success in closed state
             self.failure_count = 0
+            self._check_window()
     
     @log_execution
     async def _on_failure(self):
         """Handle failed call"""
         self.failure_count += 1
         self.last_failure_time = time.time()
+        self.window.record(failed=True, slow=False)
         
         if self.state == CircuitBreakerState.CLOSED:
             if self.failure_count >= self.config.failure_threshold:
-                self.state = CircuitBreakerState.OPEN
-                logger.warning("circuit_breaker_state_change",
-                    operation="state_transition",
-                    circuit_name=self.name,
-                    from_state="CLOSED",
-                    to_state="OPEN",
-                    failure_count=self.failure_count,
-                    failure_threshold=self.config.failure_threshold,
-                    reason="failure_threshold_exceeded"
-                )
+                self._open(CircuitBreakerState.CLOSED, "failure_threshold_exceeded",
+                           failure_count=self.failure_count,
+                           failure_threshold=self.config.failure_threshold)
+            else:
+                self._check_window()
         
         elif self.state == CircuitBreakerState.HALF_OPEN:
             # Any failure in half-open goes back to open
-            self.state = CircuitBreakerState.OPEN
-            self.success_count = 0
-            logger.warning("circuit_breaker_state_change",
-                operation="state_transition",
-                circuit_name=self.name,
-                from_state="HALF_OPEN",
-                to_state="OPEN",
-                success_count_before_failure=self.success_count,
-                reason="failure_in_half_open"
-            )
+            self._open(CircuitBreakerState.HALF_OPEN, "failure_in_half_open",
+                       success_count_before_failure=self.success_count)
     
     def get_state(self) -> Dict[str, Any]:
-        """Get current circuit breaker state"""
+        """Get current circuit breaker state, with the sliding window statistics"""
+        totals = self.window.totals()
+        calls = totals["calls"]
         return {
             "name": self.name,
             "state": self.state.value,
             "failure_count": self.failure_count,
             "success_count": self.success_count,
             "last_failure_time": self.last_failure_time,
-            "half_open_calls": self.half_open_calls
+            "half_open_calls": self.half_open_calls,
+            "window": {
+                "seconds": self.config.window_seconds,
+                **totals,
+                "failure_rate": round(totals["failures"] / calls, 3) if calls else 0.0,
+                "slow_call_rate": round(totals["slow_calls"] / calls, 3) if calls else 0.0
+            }
         }
 
 class CircuitBreakerRegistry:
@@ -175,13 +294,20 @@ class CircuitBreakerRegistry:
     
     def __init__(self):
         self._breakers: Dict[str, CircuitBreaker] = {}
-        self._default_config = CircuitBreakerConfig()
+        self._default_config: Optional[CircuitBreakerConfig] = None
+    
+    @property
+    def default_config(self) -> CircuitBreakerConfig:
+        """Breaker config from the a2a settings, built once and shared"""
+        if self._default_config is None:
+            self._default_config = CircuitBreakerConfig.from_config()
+        return self._default_config
     
     @log_execution
     def get_breaker(self, name: str, config: Optional[CircuitBreakerConfig] = None) -> CircuitBreaker:
         """Get or create a circuit breaker"""
         if name not in self._breakers:
-            breaker_config = config or self._default_config
+            breaker_config = config or self.default_config
             self._breakers[name] = CircuitBreaker(name, breaker_config)
         return self._breakers[name]
     
@@ -192,7 +318,7 @@ class CircuitBreakerRegistry:
             del self._breakers[name]
     
     def get_all_states(self) -> Dict[str, Dict[str, Any]]:
-        """Get states of all circuit breakers"""
+        """Get states and window statistics of all circuit breakers"""
         return {name: breaker.get_state() for name, breaker in self._breakers.items()}
     
     @log_execution
@@ -204,6 +330,7 @@ class CircuitBreakerRegistry:
             breaker.failure_count = 0
             breaker.success_count = 0
             breaker.half_open_calls = 0
+            breaker.window.reset()
 
 # Global circuit breaker registry
 _registry: Optional[CircuitBreakerRegistry] = None
@@ -230,6 +357,14 @@ class RetryConfig:
         self.max_delay = max_delay
         self.exponential_base = exponential_base
         self.jitter = jitter
+    
+    @classmethod
+    def from_config(cls) -> "RetryConfig":
+        return cls(
+            max_attempts=app_config.get('a2a.retry_attempts', 3),
+            base_delay=app_config.get('a2a.retry_delay', 1.0),
+            max_delay=30.0
+        )
 
 @log_execution
 async def retry_with_exponential_backoff(func: Callable, config: RetryConfig, 
@@ -247,8 +382,8 @@ async def retry_with_exponential_backoff(func: Callable, config: RetryConfig,
             else:
                 return await func(*args, **kwargs)
                 
-        except CircuitBreakerException:
-            # Don't retry if circuit breaker is open
+        except (CircuitBreakerException, NonRetryableError):
+            # Don't retry if circuit breaker is open or the answer is final
             raise
             
         except Exception as e:
@@ -274,17 +409,146 @@ async def retry_with_exponential_backoff(func: Callable, config: RetryConfig,
     pass
     raise last_exception
 
+@dataclass
+class HedgeConfig:
+    """Configuration for hedged requests"""
+    percentile: float = 95.0  # hedge once the call is slower than this percentile
+    min_delay: float = 0.05  # seconds; never hedge earlier than this
+    budget_ratio: float = 0.1  # at most this many extra calls per call
+    min_samples: int = 10  # latency samples needed before hedging starts
+    window_size: int = 100  # latency samples kept per call type
+    
+    @classmethod
+    def from_config(cls) -> "HedgeConfig":
+        return cls(
+            percentile=app_config.get('a2a.hedge_percentile', 95.0),
+            min_delay=app_config.get('a2a.hedge_min_delay', 0.05),
+            budget_ratio=app_config.get('a2a.hedge_budget_ratio', 0.1),
+            min_samples=app_config.get('a2a.hedge_min_samples', 10)
+        )
+
+class HedgeState:
+    """Recent latencies and hedge budget for one agent+method"""
+    
+    def __init__(self, config: HedgeConfig):
+        self.config = config
+        self.latencies: Deque[float] = deque(maxlen=config.window_size)
+        # Token bucket: every call earns budget_ratio tokens, a hedge spends one
+        self.tokens = 1.0
+        self.hedges = 0
+        self.hedge_wins = 0
+    
+    def hedge_delay(self) -> Optional[float]:
+        """Latency percentile after which to hedge, None while warming up"""
+        if len(self.latencies) < self.config.min_samples:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.config.percentile / 100))
+        return max(self.config.min_delay, ordered[index])
+    
+    def earn(self):
+        self.tokens = min(self.tokens + self.config.budget_ratio, max(1.0, 10 * self.config.budget_ratio))
+    
+    def spend(self) -> bool:
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        self.hedges += 1
+        return True
+    
+    def get_state(self) -> Dict[str, Any]:
+        return {
+            "samples": len(self.latencies),
+            "hedge_delay": self.hedge_delay(),
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "tokens": round(self.tokens, 2)
+        }
+
+_hedge_states: Dict[str, HedgeState] = {}
+
+def get_hedge_states() -> Dict[str, Dict[str, Any]]:
+    """Latency and hedging statistics per agent+method"""
+    return {name: state.get_state() for name, state in _hedge_states.items()}
+
+async def hedged_call(func: Callable, name: str, config: HedgeConfig, *args,
+                      hedge_slot: Optional[Callable[[], AsyncContextManager]] = None, **kwargs) -> Any:
+    """Run an idempotent call, racing a second copy if the first is slow.
+    
+    The second copy starts once the first has run longer than the tracked
+    latency percentile for ``name``, budget permitting. The first successful
+    result wins and the other call is cancelled; if both fail, the first
+    call's error is raised.
+    
+    With ``hedge_slot``, the second copy runs inside the context it returns,
+    e.g. a concurrency limiter slot, so hedges count as load like any call.
+    """
+    state = _hedge_states.get(name)
+    if state is None:
+        state = _hedge_states[name] = HedgeState(config)
+    state.earn()
+    
+    started = time.monotonic()
+    primary = asyncio.ensure_future(func(*args, **kwargs))
+    tasks = [primary]
+    try:
+        delay = state.hedge_delay()
+        if delay is not None:
+            await asyncio.wait({primary}, timeout=delay)
+            if not primary.done() and state.spend():
+                logger.info("hedged_request_started",
+                    operation="hedge",
+                    call_name=name,
+                    hedge_delay=round(delay, 3)
+                )
+                tasks.append(asyncio.ensure_future(_second_copy(func, hedge_slot, *args, **kwargs)))
+        
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in tasks:
+                if task not in done:
+                    continue
+                if isinstance(task.exception(), NonRetryableError):
+                    # A definitive answer; the other copy would say the same
+                    return task.result()
+                if task.exception() is None:
+                    state.latencies.append(time.monotonic() - started)
+                    if task is not primary:
+                        state.hedge_wins += 1
+                    return task.result()
+        return primary.result()
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+async def _second_copy(func: Callable, hedge_slot: Optional[Callable[[], AsyncContextManager]],
+                       *args, **kwargs) -> Any:
+    if hedge_slot is None:
+        return await func(*args, **kwargs)
+    async with hedge_slot():
+        return await func(*args, **kwargs)
+
 @log_execution
 async def resilient_call(func: Callable, circuit_breaker_name: str,
                         retry_config: Optional[RetryConfig] = None,
                         circuit_config: Optional[CircuitBreakerConfig] = None,
-                        *args, **kwargs) -> Any:
-    """Make a resilient call with both circuit breaker and retry"""
+                        *args, hedge_config: Optional[HedgeConfig] = None,
+                        hedge_slot: Optional[Callable[[], AsyncContextManager]] = None, **kwargs) -> Any:
+    """Make a resilient call with both circuit breaker and retry
+    
+    With ``hedge_config`` (idempotent calls only), each attempt is hedged:
+    see hedged_call.
+    """
     circuit_breaker = get_circuit_breaker(circuit_breaker_name, circuit_config)
     
     if retry_config is None:
         retry_config = RetryConfig()
     
+    if hedge_config is not None:
+        func = functools.partial(hedged_call, func, circuit_breaker_name, hedge_config, hedge_slot=hedge_slot)
+    
     return await retry_with_exponential_backoff(
         func, retry_config, circuit_breaker, *args, **kwargs
     )
\ No newline at end of file
@@ -1,9 +1,9 @@
 """A2A client for making JSON-RPC calls to other agents."""
 
-import json
 import uuid
 from typing import Dict, Any, Optional
 import aiohttp
+from src.a2a.codec import encode_request, note_peer_capabilities, read_message
 from src.utils.logging.framework import SmartLogger
 
 logger = SmartLogger("a2a.client")
@@ -58,8 +58,10 @@ class A2AClient:
         
         try:
             session = await self._get_session()
-            async with session.post(self.base_url, json=payload) as response:
-                response_data = await response.json()
+            body, headers = encode_request(self.base_url, payload)
+            async with session.post(self.base_url, data=body, headers=headers) as response:
+                note_peer_capabilities(self.base_url, response.headers)
+                response_data = await read_message(response)
                 
                 # Check for JSON-RPC error
                 if "error" in response_data:
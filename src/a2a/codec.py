@@ -0,0 +1,224 @@
+"""Wire codecs for A2A JSON-RPC messages.
+
+Every request and response used to go through stdlib ``json`` on both
+sides. Serialization now goes through a codec chosen per message:
+
+- ``application/json``: orjson when installed, stdlib json otherwise.
+  Both produce the same JSON, so peers need not agree on the library.
+- ``application/msgpack``: MessagePack via ormsgpack (also required by
+  langgraph's checkpoint serializer); smaller and faster to parse for
+  large record sets.
+
+Negotiation mirrors compression:
+
+- Responses: clients list the media types they can decode in ``Accept``;
+  the server answers with the first one it supports.
+- Requests: servers list the media types they accept for request bodies in
+  the ``Accept-Post`` header of their responses. A client switches a host to
+  MessagePack only after seeing it there, so older agents keep getting JSON.
+
+Codecs serialize dataclasses (A2AArtifact, AgentCard, ...) and LangChain
+messages directly, so callers can pass shallow dicts instead of deep copies.
+"""
+
+import dataclasses
+import json
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from langchain_core.messages import BaseMessage
+
+from src.utils.agents.message_processing.unified_serialization import serialize_messages_for_json
+from src.utils.config import config
+from .compression import (
+    accept_encoding_header,
+    choose_encoding,
+    compress,
+    decompress,
+    note_peer_encodings,
+    request_encoding
+)
+
+try:
+    import orjson
+    _has_orjson = True
+except ImportError:
+    _has_orjson = False
+
+try:
+    import ormsgpack
+    _has_msgpack = True
+except ImportError:
+    _has_msgpack = False
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+# Host -> media types the server there accepts for request bodies
+_peer_content_types: Dict[str, List[str]] = {}
+
+
+def _default(obj: Any) -> Any:
+    """Serialize values the codecs do not handle natively."""
+    if isinstance(obj, BaseMessage):
+        return serialize_messages_for_json(obj)[0]
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
+class JSONCodec:
+    """JSON, encoded with orjson when available."""
+
+    content_type = JSON_CONTENT_TYPE
+
+    def __init__(self, use_orjson: Optional[bool] = None):
+        self.use_orjson = _has_orjson if use_orjson is None else (use_orjson and _has_orjson)
+
+    def encode(self, payload: Any) -> bytes:
+        if self.use_orjson:
+            return orjson.dumps(payload, default=_default, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(payload, default=_default).encode("utf-8")
+
+    def decode(self, body: bytes) -> Any:
+        if self.use_orjson:
+            return orjson.loads(body)
+        return json.loads(body)
+
+    def canonical(self, payload: Any) -> bytes:
+        """Deterministic encoding (sorted keys) for content hashing."""
+        if self.use_orjson:
+            try:
+                return orjson.dumps(payload, default=str,
+                                    option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                # Mixed-type keys cannot be sorted by orjson; fall through
+                pass
+        return json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+
+
+class MsgPackCodec:
+    """MessagePack, encoded with ormsgpack."""
+
+    content_type = MSGPACK_CONTENT_TYPE
+
+    def encode(self, payload: Any) -> bytes:
+        return ormsgpack.packb(payload, default=_default, option=ormsgpack.OPT_NON_STR_KEYS)
+
+    def decode(self, body: bytes) -> Any:
+        return ormsgpack.unpackb(body, option=ormsgpack.OPT_NON_STR_KEYS)
+
+
+JSON_CODEC = JSONCodec()
+_CODECS = {JSON_CONTENT_TYPE: JSON_CODEC}
+if _has_msgpack:
+    _CODECS[MSGPACK_CONTENT_TYPE] = MsgPackCodec()
+
+
+def supported_content_types() -> List[str]:
+    """Media types this process can encode and decode, in preference order."""
+    preferred = config.get('a2a.codecs', [MSGPACK_CONTENT_TYPE, JSON_CONTENT_TYPE])
+    types = [t for t in preferred if t in _CODECS]
+    if JSON_CONTENT_TYPE not in types:
+        # JSON is always understood; it is the protocol's baseline
+        types.append(JSON_CONTENT_TYPE)
+    return types
+
+
+def accept_header() -> str:
+    return ", ".join(supported_content_types())
+
+
+def _media_types(header: str) -> List[str]:
+    return [part.split(";")[0].strip().lower() for part in (header or "").split(",") if part.strip()]
+
+
+def get_codec(content_type: Optional[str]):
+    """Codec for a Content-Type header value; JSON for anything unknown."""
+    media_types = _media_types(content_type or "")
+    return _CODECS.get(media_types[0] if media_types else JSON_CONTENT_TYPE, JSON_CODEC)
+
+
+def response_codec(accept: Optional[str]):
+    """Codec for a response, from the request's Accept header."""
+    accepted = _media_types(accept or "")
+    for content_type in supported_content_types():
+        if content_type in accepted:
+            return _CODECS[content_type]
+    return JSON_CODEC
+
+
+def _host(endpoint: str) -> str:
+    return urlparse(endpoint).netloc
+
+
+def request_codec(endpoint: str):
+    """Codec for request bodies to an endpoint, per what its server advertised."""
+    accepted = _peer_content_types.get(_host(endpoint), [])
+    for content_type in supported_content_types():
+        if content_type in accepted:
+            return _CODECS[content_type]
+    return JSON_CODEC
+
+
+def note_peer_capabilities(endpoint: str, headers: Any):
+    """Remember the request codecs and encodings the server at an endpoint accepts."""
+    if headers is None:
+        return
+    accept_post = headers.get("Accept-Post")
+    if accept_post is not None:
+        _peer_content_types[_host(endpoint)] = _media_types(accept_post)
+    note_peer_encodings(endpoint, headers)
+
+
+def server_headers() -> Dict[str, str]:
+    """Headers advertising what a server accepts in request bodies."""
+    return {"Accept-Encoding": accept_encoding_header(), "Accept-Post": accept_header()}
+
+
+def encode_request(endpoint: str, payload: Any,
+                   headers: Optional[Dict[str, str]] = None) -> Tuple[bytes, Dict[str, str]]:
+    """Serialize a request body with the negotiated codec and compression.
+
+    Returns:
+        (body, headers) for session.post(data=..., headers=...)
+    """
+    codec = request_codec(endpoint)
+    request_headers = {
+        "Content-Type": codec.content_type,
+        "Accept": accept_header(),
+        "Accept-Encoding": accept_encoding_header(),
+        **(headers or {})
+    }
+    body, content_encoding = compress(codec.encode(payload), request_encoding(endpoint),
+                                      "request", endpoint=endpoint)
+    if content_encoding:
+        request_headers["Content-Encoding"] = content_encoding
+    return body, request_headers
+
+
+def encode_response(payload: Any, accept: Optional[str],
+                    accept_encoding: Optional[str]) -> Tuple[bytes, Dict[str, str]]:
+    """Serialize a response body for the client's Accept headers.
+
+    Returns:
+        (body, headers) including Content-Type and the server advertisement
+    """
+    codec = response_codec(accept)
+    headers = {"Content-Type": codec.content_type, **server_headers()}
+    body, content_encoding = compress(codec.encode(payload), choose_encoding(accept_encoding or ""),
+                                      "response")
+    if content_encoding:
+        headers["Content-Encoding"] = content_encoding
+    return body, headers
+
+
+async def read_message(message: Any) -> Any:
+    """Read and decode the body of an aiohttp request or client response."""
+    body = decompress(await message.read(), message.headers.get("Content-Encoding"))
+    return get_codec(message.headers.get("Content-Type")).decode(body)
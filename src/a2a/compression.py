@@ -0,0 +1,134 @@
+"""Payload compression for A2A traffic.
+
+State snapshots, tool results with full CRM/ITSM records and event batches
+are large, repetitive JSON, which compresses well. Compression is negotiated
+with standard HTTP headers and only applied above a size threshold:
+
+- Responses: the client lists the encodings it can decode in
+  ``Accept-Encoding``; the server compresses with the first one it supports.
+- Requests: servers advertise the encodings they accept in the
+  ``Accept-Encoding`` header of their responses. A client compresses request
+  bodies for a host only after seeing that header, so agents that predate
+  compression keep receiving plain JSON.
+
+gzip is always available; zstd is used when the optional ``zstandard``
+package is installed. aiohttp already decodes gzip bodies transparently on
+both sides, so only zstd needs explicit decoding here. Streaming (NDJSON)
+responses are never compressed, to keep events flowing line by line.
+
+Bodies are serialized and compressed together by the codec module.
+"""
+
+import gzip
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from src.utils.config import config
+from src.utils.logging.framework import SmartLogger
+
+try:
+    import zstandard
+    _has_zstd = True
+except ImportError:
+    _has_zstd = False
+
+logger = SmartLogger("a2a")
+
+GZIP = "gzip"
+ZSTD = "zstd"
+
+# Host -> encodings the server there accepts for request bodies
+_peer_encodings: Dict[str, List[str]] = {}
+
+
+def supported_encodings() -> List[str]:
+    """Encodings enabled by config and available here, in preference order."""
+    if not config.get('a2a.compression_enabled', True):
+        return []
+    available = {GZIP, ZSTD} if _has_zstd else {GZIP}
+    return [e for e in config.get('a2a.compression_encodings', [ZSTD, GZIP]) if e in available]
+
+
+def accept_encoding_header() -> str:
+    """Value of the Accept-Encoding header for A2A requests and responses."""
+    return ", ".join(supported_encodings()) or "identity"
+
+
+def _parse_encodings(header: str) -> List[str]:
+    encodings = []
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        if params.replace(" ", "") in ("q=0", "q=0.0"):
+            continue
+        if name:
+            encodings.append(name.strip().lower())
+    return encodings
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick the preferred encoding that the peer accepts."""
+    accepted = _parse_encodings(accept_encoding or "")
+    for encoding in supported_encodings():
+        if encoding in accepted:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: Optional[str], direction: str,
+             **log_context) -> Tuple[bytes, Optional[str]]:
+    """Compress a body if it is large enough and worth it.
+
+    Args:
+        body: Serialized payload
+        encoding: Negotiated encoding, or None
+        direction: "request" or "response", for the log
+        log_context: Extra fields for the compression log entry
+
+    Returns:
+        (body to send, Content-Encoding or None when sent uncompressed)
+    """
+    if encoding is None or len(body) < config.get('a2a.compression_min_bytes', 1024):
+        return body, None
+
+    if encoding == ZSTD:
+        compressed = zstandard.ZstdCompressor(level=config.get('a2a.zstd_level', 3)).compress(body)
+    else:
+        compressed = gzip.compress(body, compresslevel=config.get('a2a.gzip_level', 6))
+
+    if len(compressed) >= len(body):
+        return body, None
+
+    logger.info("a2a_payload_compressed",
+                direction=direction,
+                encoding=encoding,
+                original_bytes=len(body),
+                compressed_bytes=len(compressed),
+                ratio=round(len(body) / len(compressed), 2),
+                **log_context)
+    return compressed, encoding
+
+
+def decompress(body: bytes, content_encoding: Optional[str]) -> bytes:
+    """Decode a body aiohttp left encoded (zstd)."""
+    if (content_encoding or "").strip().lower() == ZSTD:
+        if not _has_zstd:
+            raise ValueError("zstd-encoded body but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompressobj().decompress(body)
+    return body
+
+
+def _host(endpoint: str) -> str:
+    return urlparse(endpoint).netloc
+
+
+def note_peer_encodings(endpoint: str, headers: Any):
+    """Remember which request encodings the server at an endpoint accepts."""
+    header = headers.get("Accept-Encoding") if headers is not None else None
+    if header is not None:
+        _peer_encodings[_host(endpoint)] = _parse_encodings(header)
+
+
+def request_encoding(endpoint: str) -> Optional[str]:
+    """Encoding for request bodies to an endpoint, per what its server advertised."""
+    accepted = _peer_encodings.get(_host(endpoint), [])
+    return next((e for e in supported_encodings() if e in accepted), None)
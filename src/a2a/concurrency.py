@@ -0,0 +1,247 @@
+"""Adaptive per-agent concurrency limits for A2A calls.
+
+Parallel plan steps can fire many calls at one agent at once. Past the
+agent's capacity, extra calls only queue up inside it, time out, and trip
+the circuit breaker for every caller. Each agent endpoint (host) therefore
+gets a limiter that admits a bounded number of calls and queues the rest,
+with a deadline.
+
+The limit adapts with AIMD (additive increase, multiplicative decrease):
+
+- A successful call made while the limiter was saturated raises the limit
+  by about one per limit's worth of calls, up to ``a2a.concurrency_max_limit``.
+- A failed call, or a call made while saturated that was much slower than
+  the baseline latency of the same method on that agent
+  (``a2a.concurrency_latency_tolerance`` times), multiplies the limit by
+  ``a2a.concurrency_backoff_ratio``. This happens at most once per baseline
+  round trip, so one burst of failures counts once.
+
+Baselines are kept per method because methods share the slots but not
+their cost: a task that takes seconds is not slow next to an agent card
+fetch, only next to other tasks.
+
+The initial limit is ``a2a.max_concurrent_calls``.
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+from urllib.parse import urlparse
+
+from src.utils.config import config
+from src.utils.logging.framework import SmartLogger
+from .circuit_breaker import NonRetryableError
+
+logger = SmartLogger("a2a")
+
+
+class ConcurrencyLimitExceeded(Exception):
+    """A call waited longer than the queue timeout for a free slot."""
+    pass
+
+
+@dataclass
+class ConcurrencyLimiterConfig:
+    """Configuration for adaptive concurrency limiting"""
+    initial_limit: int = 10
+    min_limit: int = 1
+    max_limit: int = 20  # matches the per-host connection pool size
+    queue_timeout: float = 30.0  # seconds a call may wait for a slot
+    backoff_ratio: float = 0.7
+    latency_tolerance: float = 2.0  # slow-call threshold, as a multiple of baseline
+
+    @classmethod
+    def from_config(cls) -> "ConcurrencyLimiterConfig":
+        return cls(
+            initial_limit=config.get('a2a.max_concurrent_calls', 10),
+            min_limit=config.get('a2a.concurrency_min_limit', 1),
+            max_limit=config.get('a2a.concurrency_max_limit', 20),
+            queue_timeout=config.get('a2a.concurrency_queue_timeout', 30.0),
+            backoff_ratio=config.get('a2a.concurrency_backoff_ratio', 0.7),
+            latency_tolerance=config.get('a2a.concurrency_latency_tolerance', 2.0)
+        )
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limiter with a deadline-bounded FIFO queue."""
+
+    def __init__(self, name: str, limiter_config: ConcurrencyLimiterConfig):
+        self.name = name
+        self.config = limiter_config
+        self.limit = float(max(limiter_config.min_limit,
+                               min(limiter_config.initial_limit, limiter_config.max_limit)))
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._baseline_latency: Dict[str, float] = {}
+        self._avg_latency: Dict[str, float] = {}
+        self._last_decrease = 0.0
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    def _has_capacity(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    async def acquire(self, timeout: Optional[float] = None, wait: bool = True):
+        """Wait for a slot, first come first served.
+
+        Args:
+            timeout: Seconds to wait in the queue (default: the configured queue timeout)
+            wait: Queue for a slot; False takes a free slot or fails at once
+
+        Raises:
+            ConcurrencyLimitExceeded: If no slot frees up within the timeout
+        """
+        if self._has_capacity() and not self.queued:
+            self.in_flight += 1
+            return
+        if not wait:
+            raise ConcurrencyLimitExceeded(
+                f"No free slot for {self.name} (limit {int(self.limit)}, in flight {self.in_flight})"
+            )
+
+        timeout = self.config.queue_timeout if timeout is None else timeout
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we gave up; pass it on
+                self._release_slot()
+            else:
+                waiter.cancel()
+            if isinstance(e, asyncio.TimeoutError):
+                logger.warning("a2a_concurrency_queue_timeout",
+                               agent=self.name,
+                               timeout=timeout,
+                               **self.get_stats())
+                raise ConcurrencyLimitExceeded(
+                    f"No free slot for {self.name} within {timeout}s "
+                    f"(limit {int(self.limit)}, in flight {self.in_flight})"
+                ) from None
+            raise
+
+    def _release_slot(self):
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self):
+        """Hand free slots to queued calls, in order."""
+        while self._waiters and self._has_capacity():
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def _on_success(self, method: str, latency: float, saturated: bool):
+        baseline = self._baseline_latency.get(method)
+        if baseline is None:
+            baseline = self._baseline_latency[method] = latency
+            self._avg_latency[method] = latency
+        else:
+            # Baseline follows new lows at once and drifts slowly upwards
+            baseline = self._baseline_latency[method] = min(latency, baseline + 0.05 * (latency - baseline))
+            self._avg_latency[method] = 0.8 * self._avg_latency[method] + 0.2 * latency
+
+        if not saturated:
+            # Below the limit, latency swings are the agent's own, not our load
+            return
+        if latency > baseline * self.config.latency_tolerance:
+            self._decrease("slow_call", method, latency)
+        elif self.limit < self.config.max_limit:
+            self.limit = min(self.config.max_limit, self.limit + 1.0 / self.limit)
+            self._wake()
+
+    def _decrease(self, reason: str, method: str, latency: float):
+        now = time.monotonic()
+        cooldown = min(max(self._baseline_latency.get(method, 0.0), 0.1), 5.0)
+        if now - self._last_decrease < cooldown:
+            return
+        self._last_decrease = now
+        previous = self.limit
+        self.limit = max(float(self.config.min_limit), self.limit * self.config.backoff_ratio)
+        if int(self.limit) != int(previous):
+            logger.info("a2a_concurrency_limit_decreased",
+                        agent=self.name,
+                        method=method,
+                        reason=reason,
+                        latency=round(latency, 3),
+                        previous_limit=int(previous),
+                        **self.get_stats())
+
+    @asynccontextmanager
+    async def slot(self, method: str, timeout: Optional[float] = None,
+                   wait: bool = True) -> AsyncIterator[None]:
+        """Hold a slot for one call of ``method`` and feed its outcome back into the limit."""
+        await self.acquire(timeout, wait)
+        saturated = self.in_flight >= int(self.limit)
+        started = time.monotonic()
+        try:
+            yield
+        except (NonRetryableError, asyncio.CancelledError):
+            # Definitive answers and cancellations say nothing about load
+            raise
+        except Exception:
+            self._decrease("failure", method, time.monotonic() - started)
+            raise
+        else:
+            self._on_success(method, time.monotonic() - started, saturated)
+        finally:
+            self._release_slot()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Current limit, load and latency estimates"""
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "baseline_latency": {method: round(value, 3) for method, value in self._baseline_latency.items()},
+            "avg_latency": {method: round(value, 3) for method, value in self._avg_latency.items()}
+        }
+
+
+class ConcurrencyLimiterRegistry:
+    """Registry of limiters, one per agent host"""
+
+    def __init__(self):
+        self._limiters: Dict[str, AdaptiveConcurrencyLimiter] = {}
+        self._loops: Dict[str, asyncio.AbstractEventLoop] = {}
+        self._config: Optional[ConcurrencyLimiterConfig] = None
+
+    def get_limiter(self, endpoint: str) -> AdaptiveConcurrencyLimiter:
+        """Get or create the limiter for an endpoint's host"""
+        name = urlparse(endpoint).netloc or endpoint
+        loop = asyncio.get_running_loop()
+        if name not in self._limiters or self._loops[name] is not loop:
+            # Queued futures belong to one event loop
+            if self._config is None:
+                self._config = ConcurrencyLimiterConfig.from_config()
+            self._limiters[name] = AdaptiveConcurrencyLimiter(name, self._config)
+            self._loops[name] = loop
+        return self._limiters[name]
+
+    def get_all_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Limit, in-flight and queued calls per agent"""
+        return {name: limiter.get_stats() for name, limiter in self._limiters.items()}
+
+
+# Global limiter registry
+_registry: Optional[ConcurrencyLimiterRegistry] = None
+
+
+def get_concurrency_limiter_registry() -> ConcurrencyLimiterRegistry:
+    """Get the global concurrency limiter registry"""
+    global _registry
+    if _registry is None:
+        _registry = ConcurrencyLimiterRegistry()
+    return _registry
+
+
+def get_concurrency_limiter(endpoint: str) -> AdaptiveConcurrencyLimiter:
+    """Get the concurrency limiter for an agent endpoint"""
+    return get_concurrency_limiter_registry().get_limiter(endpoint)
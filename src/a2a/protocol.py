@@ -4,29 +4,93 @@ Provides resilient inter-agent communication with connection pooling,
 circuit breakers, and retry logic.
 """
 
-import json
 import uuid
 import asyncio
 import time
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, asdict
+import functools
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional, List, AsyncIterator, Awaitable, Callable, Set, Tuple
+from dataclasses import dataclass, fields, replace
+from urllib.parse import urlparse
 from datetime import datetime, timezone
 import aiohttp
 from aiohttp import web
+from langchain_core.messages import BaseMessage
 from src.utils.config import (
+    A2A_STATUS_COMPLETED,
     A2A_STATUS_PENDING,
-    DEFAULT_A2A_PORT, DEFAULT_HOST
+    DEFAULT_A2A_PORT, DEFAULT_HOST,
+    JSONRPC_STATE_CACHE_MISS
 )
 
 from src.utils.logging.framework import SmartLogger, log_execution
 # No input validation needed - trust agent-generated content
 from src.utils.agents.message_processing.unified_serialization import serialize_messages_for_json
-from .circuit_breaker import CircuitBreakerConfig, RetryConfig, resilient_call
+from .codec import (
+    encode_request,
+    encode_response,
+    note_peer_capabilities,
+    read_message,
+    server_headers
+)
+from .concurrency import ConcurrencyLimitExceeded, get_concurrency_limiter
+from .circuit_breaker import CircuitBreakerConfig, HedgeConfig, NonRetryableError, RetryConfig, resilient_call
+from .state_delta import StateCache, StateCacheMiss, content_hash, get_state_delta_encoder
+from .task_store import (
+    FINISHED_STATUSES,
+    SUBMIT_TASK_METHOD,
+    TASK_STATUS_METHOD,
+    TASK_STATUS_NOT_FOUND,
+    TaskResultStore
+)
+from .streaming import (
+    ARTIFACT_EVENT,
+    NDJSON_CONTENT_TYPE,
+    TASK_EVENT_METHOD,
+    emit_task_event,
+    encode_line,
+    is_streaming,
+    iter_ndjson,
+    stream_handler,
+    task_event_notification
+)
 from src.utils.config import config
 
 # Initialize structured logger
 logger = SmartLogger("a2a")
 
+# Hosts whose agents answered submit_task with "method not found"
+_sync_only_hosts: Set[str] = set()
+
+# Limiter method name for a background task, held from submit to result
+RUN_TASK_SLOT = "run_task"
+
+
+@functools.lru_cache(maxsize=1)
+def _long_poll_circuit_config() -> CircuitBreakerConfig:
+    """Breaker config for long polls, which are slow on purpose."""
+    return replace(CircuitBreakerConfig.from_config(), slow_call_duration=float("inf"))
+
+
+@functools.lru_cache(maxsize=4)
+def _task_circuit_config(timeout: float) -> CircuitBreakerConfig:
+    """Breaker config for process_task, whose calls run whole workflows.
+    
+    Tasks routinely take longer than ``a2a.circuit_breaker_slow_call_duration``;
+    one only counts as slow once it nears the request timeout.
+    """
+    base = CircuitBreakerConfig.from_config()
+    return replace(base, slow_call_duration=max(base.slow_call_duration, 0.8 * timeout))
+
+
+def _shallow_dict(instance: Any) -> Dict[str, Any]:
+    """Dataclass fields as a dict, without asdict's recursive deep copy.
+    
+    Nested values are shared with the instance; the wire codecs serialize
+    them (including nested dataclasses) directly.
+    """
+    return {f.name: getattr(instance, f.name) for f in fields(instance)}
+
 @dataclass  
 class TimestampedBase:
     """Base class for dataclasses that need automatic timestamp initialization."""
@@ -50,8 +114,8 @@ class AgentCard:
     metadata: Optional[Dict[str, Any]] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        """Convert to dictionary for serialization (shallow, see _shallow_dict)."""
+        return _shallow_dict(self)
 
 @dataclass
 class A2ATask:
@@ -69,39 +133,38 @@ class A2ATask:
             self.created_at = datetime.now(timezone.utc).isoformat()
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization.
+        """Convert to dictionary for serialization.
         
-        Uses centralized message serialization utility for LangChain objects.
+        Shallow: context and state are shared with the task rather than deep
+        copied. LangChain messages still present in them are serialized
+        using the centralized message serialization utility.
         """
-        try:
-            # Try standard asdict first - should work if all objects are serialized
-            return asdict(self)
-        except (TypeError, ValueError):
-            # Fallback: manually serialize any LangChain objects using centralized utility
-            result = {
-                "id": self.id,
-                "instruction": self.instruction,
-                "status": self.status,
-                "created_at": self.created_at,
-                "context": self._serialize_dict_with_messages(self.context),
-                "state_snapshot": self._serialize_dict_with_messages(self.state_snapshot)
-            }
-            return result
+        return {
+            "id": self.id,
+            "instruction": self.instruction,
+            "context": self._serialize_dict_with_messages(self.context),
+            "state_snapshot": self._serialize_dict_with_messages(self.state_snapshot),
+            "status": self.status,
+            "created_at": self.created_at
+        }
     
     def _serialize_dict_with_messages(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Helper to serialize dictionaries using centralized message serialization."""
         if not isinstance(data, dict):
             return data
         
-        result = data.copy()
-        
-        # Handle recent_messages using centralized utility
-        if "recent_messages" in result and isinstance(result["recent_messages"], list):
-            result["recent_messages"] = [serialize_messages_for_json(msg)[0] for msg in result["recent_messages"]]
+        result = data
         
-        # Handle messages field (for state_snapshot) using centralized utility
-        if "messages" in result and isinstance(result["messages"], list):
-            result["messages"] = [serialize_messages_for_json(msg)[0] for msg in result["messages"]]
+        # Handle recent_messages (context) and messages (state_snapshot)
+        for key in ("recent_messages", "messages"):
+            messages = data.get(key)
+            if isinstance(messages, list) and any(isinstance(msg, BaseMessage) for msg in messages):
+                if result is data:
+                    result = data.copy()
+                result[key] = [
+                    serialize_messages_for_json(msg)[0] if isinstance(msg, BaseMessage) else msg
+                    for msg in messages
+                ]
         
         return result
 
@@ -135,8 +198,8 @@ class A2AArtifact:
             self.created_at = datetime.now(timezone.utc).isoformat()
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        """Convert to dictionary for serialization (shallow, see _shallow_dict)."""
+        return _shallow_dict(self)
 
 @dataclass
 class A2AMessage:
@@ -172,8 +235,8 @@ class A2AMessage:
             self.created_at = datetime.now(timezone.utc).isoformat()
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        """Convert to dictionary for serialization (shallow, see _shallow_dict)."""
+        return _shallow_dict(self)
 
 class A2ARequest:
     """JSON-RPC 2.0 request wrapper.
@@ -483,6 +546,7 @@ class A2AClient:
         self.session = None
         self._closed = False
         self._pool = get_connection_pool() if use_pool else None
+        self._retry_config = RetryConfig.from_config()
     
     async def __aenter__(self):
         if not self.use_pool:
@@ -521,6 +585,45 @@ class A2AClient:
                 self._closed = True
                 self.session = None
     
+    async def _get_session(self, endpoint: str) -> aiohttp.ClientSession:
+        """Return the pooled session for the endpoint, or the dedicated one."""
+        # Session management with pooling optimization
+        if self.use_pool:
+            # Pooled mode: efficient connection reuse
+            return await self._pool.get_session(endpoint, self.timeout)
+        
+        # Dedicated mode: isolated session for testing
+        if not self.session or self._closed:
+            logger.error("Client session not initialized or already closed")
+            raise RuntimeError("Client must be used as async context manager and not closed")
+        return self.session
+    
+    @asynccontextmanager
+    async def _call_slot(self, endpoint: str, method: str, wait: bool = True) -> AsyncIterator[None]:
+        """Admit one call through the agent's adaptive concurrency limiter.
+        
+        Calls beyond the agent's current limit wait in a queue; the outcome
+        and latency of each call adjust the limit. Latency is compared with
+        earlier calls of the same method.
+        
+        Args:
+            endpoint: Full URL of the agent endpoint
+            method: JSON-RPC method of the call
+            wait: Queue for a slot; False fails at once if none is free
+                (hedges, which are only worth sending to an idle agent)
+        
+        Raises:
+            A2AOverloaded: If no slot frees up within the queue timeout
+        """
+        if not config.get('a2a.adaptive_concurrency_enabled', True):
+            yield
+            return
+        try:
+            async with get_concurrency_limiter(endpoint).slot(method, wait=wait):
+                yield
+        except ConcurrencyLimitExceeded as e:
+            raise A2AOverloaded(str(e)) from None
+    
     async def _make_raw_call(self, endpoint: str, method: str, params: Dict[str, Any], request_id: Optional[str] = None) -> Dict[str, Any]:
         """Make a raw JSON-RPC call without resilience patterns.
         
@@ -556,20 +659,14 @@ class A2AClient:
         # External logging with safe fallback
         try:
 
-            # Session management with pooling optimization
-            if self.use_pool:
-                # Pooled mode: efficient connection reuse
-                session = await self._pool.get_session(endpoint, self.timeout)
-            else:
-                # Dedicated mode: isolated session for testing
-                if not self.session or self._closed:
-                    logger.error("Client session not initialized or already closed")
-                    raise RuntimeError("Client must be used as async context manager and not closed")
-                session = self.session
+            session = await self._get_session(endpoint)
 
             request = A2ARequest(method, params, request_id)
             request_dict = request.to_dict()
 
+            # Compressed when the agent has advertised support
+            body, headers = encode_request(endpoint, request_dict)
+
             start_time = time.time()
             
             # Make HTTP POST request
@@ -577,15 +674,20 @@ class A2AClient:
             # Avoid duplicate timeout parameter to prevent Python 3.13 compatibility issues
             async with session.post(
                 endpoint,
-                json=request_dict,
-                headers={"Content-Type": "application/json"}
+                data=body,
+                headers=headers
             ) as response:
                 elapsed = time.time() - start_time
+                note_peer_capabilities(endpoint, response.headers)
+                if response.status == 409:
+                    raise A2AStateCacheMiss(await response.text())
+                if response.status == 404:
+                    raise A2AMethodNotFound(f"HTTP 404: {await response.text()}")
                 if response.status != 200:
                     error_text = await response.text()
                     raise A2AException(f"HTTP {response.status}: {error_text}")
 
-                result = await response.json()
+                result = await read_message(response)
 
                 # Check for JSON-RPC error response
                 if "error" in result:
@@ -626,7 +728,8 @@ class A2AClient:
             raise
     
     @log_execution("a2a", "call_agent", include_args=False, include_result=False)  # Sensitive data
-    async def call_agent(self, endpoint: str, method: str, params: Dict[str, Any], request_id: Optional[str] = None) -> Dict[str, Any]:
+    async def call_agent(self, endpoint: str, method: str, params: Dict[str, Any], request_id: Optional[str] = None,
+                         idempotent: bool = False) -> Dict[str, Any]:
         """Make a JSON-RPC call with circuit breaker and retry logic.
         
         Args:
@@ -634,6 +737,8 @@ class A2AClient:
             method: JSON-RPC method name to invoke
             params: Method parameters as dictionary
             request_id: Optional correlation ID
+            idempotent: The call is safe to send twice, so slow attempts may
+                be hedged (methods in ``a2a.hedged_methods`` always are)
             
         Returns:
             Dictionary containing the agent's response
@@ -641,63 +746,435 @@ class A2AClient:
         Raises:
             A2AException: After all retry attempts are exhausted
         """
+        # Retries keep the slot: an overloaded agent should not see more load
+        async with self._call_slot(endpoint, method):
+            return await self._resilient_call(endpoint, method, params, request_id, idempotent)
+    
+    async def _resilient_call(self, endpoint: str, method: str, params: Dict[str, Any],
+                              request_id: Optional[str] = None, idempotent: bool = False) -> Dict[str, Any]:
+        """call_agent without the concurrency slot, for callers that already hold one."""
         a2a_config = config
         
-        # Configure circuit breaker for fast failure detection
-        circuit_config = CircuitBreakerConfig(
-            failure_threshold=a2a_config.get('a2a.circuit_breaker_threshold', 5),
-            timeout=a2a_config.get('a2a.circuit_breaker_timeout', 30),
-            half_open_max_calls=3
-        )
-        
-        # Configure retry for transient failure recovery
-        retry_config = RetryConfig(
-            max_attempts=a2a_config.get('a2a.retry_attempts', 3),
-            base_delay=a2a_config.get('a2a.retry_delay', 1.0),
-            max_delay=30.0
-        )
-        
         # Create unique circuit breaker per agent+method combination
         # This prevents one broken method from affecting others
         agent_name = endpoint.split('/')[2].replace(':', '_')  # Convert host:port to host_port
         circuit_breaker_name = f"a2a_{agent_name}_{method}"
         
+        # Idempotent calls stuck behind a slow attempt race a second copy,
+        # which takes a slot of its own if one is free
+        hedge_config = None
+        if a2a_config.get('a2a.hedging_enabled', True) and (
+                idempotent or method in a2a_config.get('a2a.hedged_methods', ["get_agent_card"])):
+            hedge_config = HedgeConfig.from_config()
+        
+        # Other breakers share the registry's config from a2a settings
+        circuit_config = _task_circuit_config(self.timeout) if method == "process_task" else None
+        
+        return await resilient_call(
+            self._make_raw_call,
+            circuit_breaker_name,
+            self._retry_config,
+            circuit_config,
+            endpoint, method, params, request_id,
+            hedge_config=hedge_config,
+            hedge_slot=lambda: self._call_slot(endpoint, method, wait=False)
+        )
+    
+    async def _make_raw_batch(self, endpoint: str, payload: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """POST a JSON-RPC batch and return the raw response objects.
+        
+        Returns None when the agent does not accept batches, so the caller
+        can fall back without going through retries.
+        """
+        session = await self._get_session(endpoint)
+        body, headers = encode_request(endpoint, payload)
+        start_time = time.time()
         try:
-            return await resilient_call(
-                self._make_raw_call,
-                circuit_breaker_name,
-                retry_config,
-                circuit_config,
-                endpoint, method, params, request_id
+            async with session.post(
+                endpoint,
+                data=body,
+                headers=headers
+            ) as response:
+                note_peer_capabilities(endpoint, response.headers)
+                if response.status == 204:
+                    return []
+                if response.status != 200:
+                    error_text = await response.text()
+                    if response.status == 400 and "must be object" in error_text:
+                        return None
+                    raise A2AException(f"HTTP {response.status}: {error_text}")
+                
+                result = await read_message(response)
+                if not isinstance(result, list):
+                    # A whole-batch error is returned as a single object
+                    raise A2AException(f"Agent error: {result.get('error', result)}")
+                return result
+        
+        except asyncio.TimeoutError:
+            raise A2AException(f"Batch request timed out after {time.time() - start_time:.2f}s")
+        except aiohttp.ClientError as e:
+            raise A2AException(f"Network error: {str(e)}")
+    
+    @log_execution("a2a", "call_batch", include_args=False, include_result=False)
+    async def call_batch(self, endpoint: str, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """Make several JSON-RPC calls to one agent in a single round-trip.
+        
+        The agent dispatches the calls concurrently. The batch as a whole
+        goes through the same circuit breaker and retry policy as
+        call_agent. Agents that do not accept batches are called one by
+        one, concurrently.
+        
+        Args:
+            endpoint: Full URL of the agent endpoint
+            calls: (method, params) pairs
+            
+        Returns:
+            One entry per call, in call order: the call's result, or an
+            A2AException for calls that failed
+        """
+        if not calls:
+            return []
+        
+        requests = [A2ARequest(method, params) for method, params in calls]
+        payload = [request.to_dict() for request in requests]
+        
+        agent_name = endpoint.split('/')[2].replace(':', '_')
+        
+        async with self._call_slot(endpoint, "batch"):
+            responses = await resilient_call(
+                self._make_raw_batch,
+                f"a2a_{agent_name}_batch",
+                self._retry_config,
+                None,
+                endpoint, payload
             )
-        except Exception:
-            raise
+        if responses is None:
+            logger.warning("a2a_batch_unsupported", endpoint=endpoint)
+            return await asyncio.gather(
+                *(self.call_agent(endpoint, method, params) for method, params in calls),
+                return_exceptions=True
+            )
+        
+        # Correlate by id; the server may answer in any order
+        by_id = {response.get("id"): response for response in responses if isinstance(response, dict)}
+        results: List[Any] = []
+        for request in requests:
+            response = by_id.get(request.id)
+            if response is None:
+                results.append(A2AException(f"No response for {request.method} (id {request.id})"))
+            elif "error" in response:
+                results.append(A2AException(f"Agent error: {response['error']}"))
+            else:
+                results.append(response.get("result", {}))
+        
+        logger.info("a2a_batch_success",
+                   endpoint=endpoint,
+                   call_count=len(calls),
+                   failed=sum(1 for r in results if isinstance(r, Exception)))
+        return results
+    
+    async def stream_call(self, endpoint: str, method: str, params: Dict[str, Any],
+                          request_id: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Make a JSON-RPC call in streaming (NDJSON) mode.
+        
+        Yields task events ({"event", "data", "timestamp"}) as the agent
+        produces them, then {"event": "result", "data": result}. Servers
+        that answer with a plain JSON response yield just the result.
+        
+        There is no retry layer: a partially consumed stream cannot be
+        replayed. Errors after the response started raise
+        A2AStreamInterrupted so callers know the task may have run.
+        
+        Args:
+            endpoint: Full URL of the agent endpoint
+            method: JSON-RPC method name to invoke
+            params: Method parameters as dictionary
+            request_id: Optional correlation ID
+            
+        Raises:
+            A2AException: For HTTP, protocol and network errors
+        """
+        operation_id = f"a2a_stream_{uuid.uuid4().hex[:8]}"
+        logger.info("a2a_stream_start", component="a2a", operation_id=operation_id,
+                    endpoint=endpoint,
+                    method=method)
+        
+        session = await self._get_session(endpoint)
+        request_dict = A2ARequest(method, params, request_id).to_dict()
+        body, headers = encode_request(endpoint, request_dict, {"Accept": NDJSON_CONTENT_TYPE})
+        started = False
+        event_count = 0
+        
+        try:
+            async with session.post(
+                endpoint,
+                data=body,
+                headers=headers
+            ) as response:
+                note_peer_capabilities(endpoint, response.headers)
+                if response.status == 409:
+                    raise A2AStateCacheMiss(await response.text())
+                if response.status == 404:
+                    raise A2AMethodNotFound(f"HTTP 404: {await response.text()}")
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise A2AException(f"HTTP {response.status}: {error_text}")
+                started = True
+                
+                if NDJSON_CONTENT_TYPE not in response.headers.get("Content-Type", ""):
+                    # Server without streaming support: one-shot response
+                    yield {"event": "result", "data": self._unwrap_response(await read_message(response))}
+                    return
+                
+                async for message in iter_ndjson(response.content.iter_any()):
+                    if message.get("method") == TASK_EVENT_METHOD:
+                        event_count += 1
+                        yield message.get("params", {})
+                        continue
+                    
+                    result = self._unwrap_response(message)
+                    logger.info("a2a_stream_success", component="a2a", operation_id=operation_id,
+                                endpoint=endpoint,
+                                method=method,
+                                event_count=event_count)
+                    yield {"event": "result", "data": result}
+                    return
+                
+                raise A2AStreamInterrupted("Stream ended without a result")
+        
+        except asyncio.TimeoutError:
+            error_cls = A2AStreamInterrupted if started else A2AException
+            raise error_cls("Streaming request timed out")
+        except aiohttp.ClientError as e:
+            error_cls = A2AStreamInterrupted if started else A2AException
+            raise error_cls(f"Network error: {str(e)}")
     
-    async def process_task(self, endpoint: str, task: A2ATask) -> Dict[str, Any]:
+    @staticmethod
+    def _unwrap_response(message: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the result of a JSON-RPC response, raising on errors."""
+        if "error" in message:
+            raise A2AException(f"Agent error: {message['error']}")
+        return message.get("result", {})
+    
+    async def process_task(self, endpoint: str, task: A2ATask,
+                           on_event: Optional[Callable[[Dict[str, Any]], Any]] = None) -> Dict[str, Any]:
         """Process a task with another agent.
         
         This is the primary method for agent-to-agent task delegation.
         It serializes the task and sends it to the target agent for processing.
         
+        Tasks with a thread id are delta encoded: context and state values
+        the agent already received for the thread are sent as hashes (see
+        state_delta). If the agent no longer has them, the task is resent
+        once with full values.
+        
+        With ``on_event``, the task is streamed and the callback (sync or
+        async) receives each progress event as it happens. If the streaming
+        request fails before the agent responds, the one-shot call (with
+        retries and circuit breaker) is used instead.
+        
         Args:
             endpoint: Full URL of the agent endpoint
             task: A2ATask object containing instruction and context
+            on_event: Optional callback for streamed task events
             
         Returns:
             Dictionary with task results and artifacts
         """
+        return await self._send_with_state_delta(
+            endpoint, task,
+            lambda params: self._send_task(endpoint, params, task.id, on_event)
+        )
+    
+    async def _send_with_state_delta(self, endpoint: str, task: A2ATask,
+                                     send: Callable[[Dict[str, Any]], Awaitable[Any]]) -> Any:
+        """Call ``send`` with the task's params, delta encoded when possible."""
+        task_dict = task.to_dict()
         
+        if config.get('a2a.state_delta_enabled', True):
+            encoder = get_state_delta_encoder()
+            for full in (False, True):
+                encoded = encoder.encode(endpoint, task_dict, full=full)
+                if encoded is None:
+                    break
+                try:
+                    result = await send({"task": encoded.task})
+                except A2AStateCacheMiss:
+                    encoded.reject()
+                    if full:
+                        raise
+                    logger.info("a2a_state_cache_miss",
+                               endpoint=endpoint,
+                               task_id=task.id)
+                    continue
+                except Exception:
+                    encoded.reject()
+                    raise
+                encoded.commit()
+                logger.debug("a2a_state_delta_sent",
+                            endpoint=endpoint,
+                            task_id=task.id,
+                            full_bytes=encoded.full_size,
+                            sent_bytes=encoded.sent_size)
+                return result
+        
+        return await send({"task": task_dict})
+    
+    async def _send_task(self, endpoint: str, params: Dict[str, Any], task_id: str,
+                         on_event: Optional[Callable[[Dict[str, Any]], Any]]) -> Dict[str, Any]:
+        """Send process_task, streamed when there is an event callback."""
+        if on_event is not None and config.get('a2a.streaming_enabled', True):
+            try:
+                async with self._call_slot(endpoint, "process_task"):
+                    async for event in self.stream_call(endpoint, "process_task", params):
+                        if event.get("event") == "result":
+                            return event["data"]
+                        await self._deliver_event(on_event, event)
+            except (A2AStreamInterrupted, A2AStateCacheMiss, A2AOverloaded):
+                raise
+            except A2AException as e:
+                logger.warning("a2a_stream_fallback",
+                             endpoint=endpoint,
+                             task_id=task_id,
+                             error=str(e))
+        
+        return await self.call_agent(
+            endpoint=endpoint,
+            method="process_task",
+            params=params
+        )
+    
+    @staticmethod
+    async def _deliver_event(on_event: Callable[[Dict[str, Any]], Any], event: Dict[str, Any]):
+        """Pass a task event to a sync or async callback; callback errors are logged."""
         try:
-            result = await self.call_agent(
-                endpoint=endpoint,
-                method="process_task",
-                params={"task": task.to_dict()}
-            )
+            outcome = on_event(event)
+            if asyncio.iscoroutine(outcome):
+                await outcome
+        except Exception as e:
+            logger.warning("a2a_stream_event_callback_failed",
+                         event_type=event.get("event"),
+                         error=str(e))
+    
+    async def submit_task(self, endpoint: str, task: A2ATask) -> Dict[str, Any]:
+        """Start a task on an agent in the background.
+        
+        Submitting is idempotent per task id: a retried or repeated submit
+        returns the handle of the run already under way.
+        
+        Args:
+            endpoint: Full URL of the agent endpoint
+            task: A2ATask object containing instruction and context
+            
+        Returns:
+            Task handle with ``task_id`` and ``status``
+            
+        Raises:
+            A2AMethodNotFound: If the agent does not support background tasks
+        """
+        return await self._send_with_state_delta(
+            endpoint, task,
+            lambda params: self.call_agent(endpoint, SUBMIT_TASK_METHOD, params, idempotent=True)
+        )
+    
+    async def get_task_status(self, endpoint: str, task_id: str, wait: float = 0.0,
+                              since: int = 0) -> Dict[str, Any]:
+        """Get the status of a submitted task, long polling for up to ``wait`` seconds.
+        
+        Long polls take no concurrency slot and are never judged slow by the
+        circuit breaker: waiting is what they are for.
+        
+        Args:
+            endpoint: Full URL of the agent endpoint
+            task_id: Id of the submitted task
+            wait: Seconds the agent may hold the request until something changes
+            since: Event cursor from the previous status; only newer events are returned
+            
+        Returns:
+            Status with ``status``, ``events``, ``cursor``, ``artifacts`` and,
+            once finished, ``result`` or ``error``
+        """
+        # Leave the session timeout room to deliver the answer
+        wait = max(0.0, min(wait, self.timeout / 2))
+        agent_name = endpoint.split('/')[2].replace(':', '_')
+        return await resilient_call(
+            self._make_raw_call,
+            f"a2a_{agent_name}_{TASK_STATUS_METHOD}",
+            self._retry_config,
+            _long_poll_circuit_config(),
+            endpoint, TASK_STATUS_METHOD, {"task_id": task_id, "wait": wait, "since": since}
+        )
+    
+    async def run_task(self, endpoint: str, task: A2ATask,
+                       on_event: Optional[Callable[[Dict[str, Any]], Any]] = None) -> Dict[str, Any]:
+        """Run a task in the background on the agent and wait for its result.
+        
+        For long workflows: the task is submitted, then followed with long
+        polls, so no request stays open for the whole run and a failed poll
+        is simply repeated instead of re-executing the task. Events reach
+        ``on_event`` as they would when streaming. Agents without
+        ``submit_task`` get a regular process_task call.
+        
+        The task holds one of the agent's concurrency slots from submit
+        until it finishes, as a process_task call would for its whole run;
+        the polls themselves take none.
+        
+        Args:
+            endpoint: Full URL of the agent endpoint
+            task: A2ATask object containing instruction and context
+            on_event: Optional callback for task events
             
+        Returns:
+            Dictionary with task results and artifacts
             
+        Raises:
+            A2AException: If the task failed, was lost by the agent, or ran
+                past ``a2a.async_task_timeout``
+        """
+        host = urlparse(endpoint).netloc
+        if not config.get('a2a.async_tasks_enabled', True) or host in _sync_only_hosts:
+            return await self.process_task(endpoint, task, on_event)
+        
+        async with self._call_slot(endpoint, RUN_TASK_SLOT):
+            result = await self._run_submitted_task(endpoint, task, on_event)
+        if result is not None:
             return result
-        except Exception:
-            raise
+        
+        _sync_only_hosts.add(host)
+        logger.info("a2a_async_tasks_unsupported", endpoint=endpoint)
+        return await self.process_task(endpoint, task, on_event)
+    
+    async def _run_submitted_task(self, endpoint: str, task: A2ATask,
+                                  on_event: Optional[Callable[[Dict[str, Any]], Any]]) -> Optional[Dict[str, Any]]:
+        """Submit the task and poll until it finishes; None if the agent has no submit_task."""
+        try:
+            await self._send_with_state_delta(
+                endpoint, task,
+                lambda params: self._resilient_call(endpoint, SUBMIT_TASK_METHOD, params, idempotent=True)
+            )
+        except A2AMethodNotFound:
+            return None
+        
+        timeout = config.get('a2a.async_task_timeout', 1800)
+        poll_wait = config.get('a2a.task_poll_wait', 20)
+        deadline = time.monotonic() + timeout
+        cursor = 0
+        while True:
+            status = await self.get_task_status(endpoint, task.id, wait=poll_wait, since=cursor)
+            if on_event is not None:
+                for event in status.get("events") or []:
+                    await self._deliver_event(on_event, event)
+            cursor = status.get("cursor", cursor)
+            if status.get("status") in FINISHED_STATUSES or status.get("status") == TASK_STATUS_NOT_FOUND:
+                break
+            if time.monotonic() >= deadline:
+                raise A2AException(f"Task {task.id} still running on the agent after {timeout}s")
+        
+        if status.get("status") == A2A_STATUS_COMPLETED:
+            return status.get("result") or {}
+        if status.get("status") == TASK_STATUS_NOT_FOUND:
+            raise A2AException(f"Task {task.id} is unknown to the agent (result expired or agent restarted)")
+        raise A2AException(f"Task {task.id} failed: {status.get('error')}")
     
     async def get_agent_card(self, endpoint: str) -> AgentCard:
         """Retrieve agent capabilities for discovery.
@@ -745,6 +1222,10 @@ class A2AServer:
         self.agent_card = agent_card
         self.host = host
         self.port = port
+        # Values of delta-encoded tasks, per orchestrator thread
+        self.state_cache = StateCache()
+        # Tasks started with submit_task, polled with get_task_status
+        self.task_store = TaskResultStore()
         self.app = web.Application()
         self.handlers = {}
         self._setup_routes()
@@ -790,78 +1271,303 @@ class A2AServer:
         - -32603: Internal error
         """
         try:
-            data = await request.json()
+            data = await read_message(request)
             
-            # Type validation prevents processing non-dict payloads
-            if not isinstance(data, dict):
-                return web.json_response(
-                    A2AResponse(error={"code": -32600, "message": "Invalid Request - must be object"}).to_dict(),
-                    status=400
-                )
+            # Batch: array of request objects, dispatched concurrently
+            if isinstance(data, list):
+                return await self._handle_batch(request, data)
             
-            # Validate JSON-RPC 2.0 format
-            if data.get("jsonrpc") != "2.0":
-                return web.json_response(
-                    A2AResponse(error={"code": -32600, "message": "Invalid Request"}).to_dict(),
-                    status=400
-                )
+            invalid = self._validate_call(data)
+            if invalid:
+                error_response, status = invalid
+                return self._rpc_response(request, error_response, status=status)
             
-            method = data.get("method")
+            method = data["method"]
             params = data.get("params", {})
             request_id = data.get("id")
             
-            # Method name validation prevents excessive memory usage
-            if not isinstance(method, str) or len(method) > 100:
-                return web.json_response(
-                    A2AResponse(error={"code": -32600, "message": "Invalid method name"}, request_id=request_id).to_dict(),
-                    status=400
-                )
-            
-            # Params must be object (dict) per our A2A implementation
-            if not isinstance(params, dict):
-                return web.json_response(
-                    A2AResponse(error={"code": -32600, "message": "Invalid params - must be object"}, request_id=request_id).to_dict(),
-                    status=400
-                )
-            
-            # No validation needed - trust agent-generated task data
-            # Agents communicate with well-formed JSON-RPC messages
-            
-            if method not in self.handlers:
-                return web.json_response(
-                    A2AResponse(error={"code": -32601, "message": "Method not found"}, request_id=request_id).to_dict(),
-                    status=404
-                )
-            
-            # Dispatch to registered handler
             try:
-                result = await self.handlers[method](params)
-                response = A2AResponse(result=result, request_id=request_id)
-                return web.json_response(response.to_dict())
+                params = self._expand_params(params)
+            except StateCacheMiss as e:
+                return self._rpc_response(request, self._state_cache_miss_response(e, request_id), status=409)
             
-            except Exception as e:
-                # Handler exceptions are logged but sanitized in response
-                pass
-                response = A2AResponse(
-                    error={"code": -32603, "message": "Internal error", "data": str(e)},
-                    request_id=request_id
-                )
-                return web.json_response(response.to_dict(), status=500)
-        
-        except json.JSONDecodeError:
-            # Malformed JSON gets parse error response
-            return web.json_response(
+            # Clients that accept NDJSON get progress events before the result
+            if NDJSON_CONTENT_TYPE in request.headers.get("Accept", ""):
+                return await self._stream_response(request, method, params, request_id)
+            
+            response, status = await self._dispatch(method, params, request_id)
+            return self._rpc_response(request, response, status=status)
+        
+        except ValueError:
+            # Malformed JSON or MessagePack gets parse error response
+            # (decoder errors of every codec subclass ValueError)
+            return self._rpc_response(
+                request,
                 A2AResponse(error={"code": -32700, "message": "Parse error"}).to_dict(),
                 status=400
             )
         except Exception:
             # Catch-all for unexpected errors - log but don't leak details
             pass
-            return web.json_response(
+            return self._rpc_response(
+                request,
                 A2AResponse(error={"code": -32603, "message": "Internal error"}).to_dict(),
                 status=500
             )
     
+    def _validate_call(self, data: Any) -> Optional[Tuple[Dict[str, Any], int]]:
+        """Validate one JSON-RPC request object.
+        
+        Returns:
+            (error response, HTTP status) for invalid requests, None otherwise
+        """
+        # Type validation prevents processing non-dict payloads
+        if not isinstance(data, dict):
+            return A2AResponse(error={"code": -32600, "message": "Invalid Request - must be object"}).to_dict(), 400
+        
+        # Validate JSON-RPC 2.0 format
+        if data.get("jsonrpc") != "2.0":
+            return A2AResponse(error={"code": -32600, "message": "Invalid Request"}).to_dict(), 400
+        
+        method = data.get("method")
+        params = data.get("params", {})
+        request_id = data.get("id")
+        
+        # Method name validation prevents excessive memory usage
+        if not isinstance(method, str) or len(method) > 100:
+            return A2AResponse(error={"code": -32600, "message": "Invalid method name"}, request_id=request_id).to_dict(), 400
+        
+        # Params must be object (dict) per our A2A implementation
+        if not isinstance(params, dict):
+            return A2AResponse(error={"code": -32600, "message": "Invalid params - must be object"}, request_id=request_id).to_dict(), 400
+        
+        # No validation needed - trust agent-generated task data
+        # Agents communicate with well-formed JSON-RPC messages
+        
+        if self._handler_for(method, params) is None:
+            return A2AResponse(error={"code": -32601, "message": "Method not found"}, request_id=request_id).to_dict(), 404
+        
+        return None
+    
+    def _rpc_response(self, request: web.Request, payload: Any, status: int = 200) -> web.Response:
+        """Encode a JSON-RPC response for the client's Accept headers.
+        
+        Large bodies are compressed. Every response advertises the codecs
+        and encodings this server accepts for request bodies.
+        """
+        body, headers = encode_response(
+            payload,
+            request.headers.get("Accept"),
+            request.headers.get("Accept-Encoding")
+        )
+        return web.Response(body=body, status=status, headers=headers)
+    
+    def _expand_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace delta-encoded task state with full values.
+        
+        Raises:
+            StateCacheMiss: If the task references values not in the cache
+        """
+        task = params.get("task")
+        if not isinstance(task, dict) or "state_encoding" not in task:
+            return params
+        return {**params, "task": self.state_cache.expand(task)}
+    
+    @staticmethod
+    def _state_cache_miss_response(miss: StateCacheMiss, request_id: Optional[str]) -> Dict[str, Any]:
+        logger.info("a2a_state_cache_miss",
+                   thread_id=miss.thread_id,
+                   missing_count=len(miss.missing))
+        return A2AResponse(
+            error={"code": JSONRPC_STATE_CACHE_MISS, "message": "State cache miss",
+                   "data": {"missing": miss.missing}},
+            request_id=request_id
+        ).to_dict()
+    
+    def _handler_for(self, method: str, params: Dict[str, Any]) -> Optional[Callable]:
+        """Handler for a method: registered, or built in for background tasks.
+        
+        ``get_task_status`` answers for tasks started with ``submit_task``;
+        a registered ``get_task_status`` handler still gets other task ids.
+        """
+        if method == SUBMIT_TASK_METHOD and "process_task" in self.handlers:
+            return self._submit_task
+        if (method == "process_task" and method in self.handlers
+                and config.get('a2a.idempotency_enabled', True)):
+            return self._process_task_once
+        if method == TASK_STATUS_METHOD and (
+                method not in self.handlers or params.get("task_id") in self.task_store):
+            return self._get_task_status
+        return self.handlers.get(method)
+    
+    async def _submit_task(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Start process_task in the background and return its handle."""
+        task = params.get("task")
+        task_id = task.get("id") if isinstance(task, dict) else None
+        if not isinstance(task_id, str) or not task_id:
+            raise ValueError("submit_task requires a task with an id")
+        
+        record, started = self.task_store.submit(task_id, self.handlers["process_task"], params)
+        logger.info("a2a_task_submitted" if started else "a2a_task_resubmitted",
+                   task_id=task_id,
+                   status=record.status,
+                   stored_tasks=len(self.task_store))
+        return record.handle()
+    
+    async def _process_task_once(self, params: Dict[str, Any]) -> Any:
+        """Run process_task at most once per task id.
+        
+        The task id, with a fingerprint of the instruction and context, is
+        the idempotency key. A retry of a task that is still running
+        attaches to that run, and a retry of a completed task gets the
+        stored result (for ``a2a.task_result_ttl`` seconds), so client
+        retries after timeouts do not repeat the agent's work. Streamed
+        requests receive the run's events from the start. A request that
+        reuses the id with a new instruction or context (resuming an
+        interrupted task with the user's answer) runs.
+        """
+        task = params.get("task")
+        task_id = task.get("id") if isinstance(task, dict) else None
+        if not isinstance(task_id, str) or not task_id:
+            return await self.handlers["process_task"](params)
+        fingerprint = content_hash({"instruction": task.get("instruction"), "context": task.get("context")})
+        if fingerprint is None:
+            return await self.handlers["process_task"](params)
+        
+        key = f"{task_id}:{fingerprint[0]}"
+        record, started = self.task_store.submit(key, self.handlers["process_task"], params)
+        if not started:
+            logger.info("a2a_duplicate_task_attached",
+                       task_id=task_id,
+                       status=record.status)
+        
+        streaming = is_streaming()
+        cursor = 0
+        while True:
+            if streaming:
+                for event in record.events_since(cursor):
+                    # Artifacts are streamed from the result, as for any handler
+                    if event.get("event") != ARTIFACT_EVENT:
+                        emit_task_event(event["event"], event["data"])
+            cursor = record.cursor
+            if record.finished:
+                return record.outcome()
+            await record.wait(cursor)
+    
+    async def _get_task_status(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Status of a background task, long polling for up to ``wait`` seconds."""
+        task_id = params.get("task_id")
+        record = self.task_store.get(task_id)
+        if record is None:
+            return {"task_id": task_id, "status": TASK_STATUS_NOT_FOUND}
+        
+        since = int(params.get("since", 0))
+        wait = min(float(params.get("wait", 0)), config.get('a2a.task_status_max_wait', 30))
+        if wait > 0:
+            await record.wait(since, wait)
+        return record.snapshot(since)
+    
+    async def _dispatch(self, method: str, params: Dict[str, Any],
+                        request_id: Optional[str]) -> Tuple[Dict[str, Any], int]:
+        """Run a registered handler and build its JSON-RPC response."""
+        try:
+            result = await self._handler_for(method, params)(params)
+            return A2AResponse(result=result, request_id=request_id).to_dict(), 200
+        
+        except Exception as e:
+            # Handler exceptions are logged but sanitized in response
+            pass
+            response = A2AResponse(
+                error={"code": -32603, "message": "Internal error", "data": str(e)},
+                request_id=request_id
+            )
+            return response.to_dict(), 500
+    
+    async def _handle_batch(self, request: web.Request, batch: List[Any]) -> web.Response:
+        """Handle a JSON-RPC 2.0 batch.
+        
+        Calls run concurrently; the response array follows request order and
+        each entry carries its request's id. Entries without an id are
+        notifications and get no response entry. Batches are never streamed.
+        """
+        if not batch:
+            return self._rpc_response(
+                request,
+                A2AResponse(error={"code": -32600, "message": "Invalid Request - empty batch"}).to_dict(),
+                status=400
+            )
+        
+        max_batch_size = config.get('a2a.max_batch_size', 50)
+        if len(batch) > max_batch_size:
+            return self._rpc_response(
+                request,
+                A2AResponse(error={"code": -32600, "message": f"Invalid Request - batch exceeds {max_batch_size} calls"}).to_dict(),
+                status=400
+            )
+        
+        async def run_one(data: Any) -> Dict[str, Any]:
+            invalid = self._validate_call(data)
+            if invalid:
+                return invalid[0]
+            try:
+                params = self._expand_params(data.get("params", {}))
+            except StateCacheMiss as e:
+                return self._state_cache_miss_response(e, data.get("id"))
+            response, _ = await self._dispatch(data["method"], params, data.get("id"))
+            return response
+        
+        responses = await asyncio.gather(*(run_one(data) for data in batch))
+        responses = [
+            response for data, response in zip(batch, responses)
+            if not (isinstance(data, dict) and "id" not in data and "error" not in response)
+        ]
+        
+        logger.info("a2a_batch_handled",
+                   call_count=len(batch),
+                   methods=[data.get("method") for data in batch if isinstance(data, dict)])
+        
+        if not responses:
+            # Only notifications: nothing to return
+            return web.Response(status=204, headers=server_headers())
+        return self._rpc_response(request, responses)
+    
+    async def _stream_response(self, request: web.Request, method: str,
+                               params: Dict[str, Any], request_id: Optional[str]) -> web.StreamResponse:
+        """Stream task events as JSON-RPC notifications, then the response.
+        
+        Headers are sent before the handler starts, so a client that sees no
+        response can safely retry in one-shot mode.
+        """
+        response = web.StreamResponse(headers={"Content-Type": NDJSON_CONTENT_TYPE, **server_headers()})
+        await response.prepare(request)
+        
+        event_count = 0
+        try:
+            async for event in stream_handler(self._handler_for(method, params), params):
+                if event["event"] == "result":
+                    final = A2AResponse(result=event["data"], request_id=request_id)
+                else:
+                    event_count += 1
+                    await response.write(encode_line(task_event_notification(event)))
+                    continue
+                await response.write(encode_line(final.to_dict()))
+        except (ConnectionResetError, asyncio.CancelledError):
+            logger.info("a2a_stream_client_disconnected",
+                       method=method,
+                       events_sent=event_count)
+            raise
+        except Exception as e:
+            # Status is already 200; the error travels in the final line
+            final = A2AResponse(
+                error={"code": -32603, "message": "Internal error", "data": str(e)},
+                request_id=request_id
+            )
+            await response.write(encode_line(final.to_dict()))
+        
+        logger.info("a2a_stream_completed", method=method, events_sent=event_count)
+        await response.write_eof()
+        return response
+    
     async def start(self):
         """Start the A2A server.
         
@@ -891,4 +1597,37 @@ class A2AException(Exception):
     Used to distinguish protocol-level errors from other exceptions,
     enabling proper error handling and retry logic in the resilience layer.
     """
-    pass
\ No newline at end of file
+    pass
+
+
+class A2AMethodNotFound(A2AException, NonRetryableError):
+    """The agent does not implement the called method.
+    
+    A definitive answer, so it is not retried.
+    """
+    pass
+
+
+class A2AOverloaded(A2AException):
+    """The agent's concurrency limit stayed full for the whole queue timeout.
+    
+    Raised before anything is sent; the agent never saw the call.
+    """
+    pass
+
+
+class A2AStateCacheMiss(A2AException, NonRetryableError):
+    """The agent no longer has state values the task referenced by hash.
+    
+    Not retried as-is; process_task resends the task with full values.
+    """
+    pass
+
+
+class A2AStreamInterrupted(A2AException):
+    """A streamed call failed after the agent started responding.
+    
+    The task may have been partially or fully executed, so it must not be
+    retried blindly.
+    """
+    pass
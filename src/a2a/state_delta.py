@@ -0,0 +1,282 @@
+"""Content-addressed delta encoding of A2ATask state.
+
+Every agent call carries the orchestrator's conversation context and state
+snapshot (recent messages, memory, schema knowledge, summaries). Most of it
+is identical from one call to the next on the same thread, yet it was
+serialized and shipped in full on every hop.
+
+Large values are content-addressed instead. The first time a value is sent
+for a thread it travels as a definition, which the receiving server caches;
+later calls send only its hash::
+
+    {"$a2a_def": "<hash>", "value": {...}}   # value, cached by the server
+    {"$a2a_ref": "<hash>"}                    # value the server already has
+
+Message lists (``messages``, ``recent_messages``) are addressed per message,
+so a conversation that grew by one turn costs one message. Small values are
+sent as-is. Encoded tasks carry ``state_encoding`` so servers know to expand
+them before the handler sees the task.
+
+Servers keep a bounded LRU of threads, each holding a bounded LRU of values.
+A reference the server no longer has is answered with a state cache miss
+(HTTP 409); the client then forgets what it assumed about that thread and
+resends the task with full values.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.utils.config import config
+from .codec import JSON_CODEC
+
+ENCODING_KEY = "state_encoding"
+DELTA_SCHEME = "delta-v1"
+REF_KEY = "$a2a_ref"
+DEF_KEY = "$a2a_def"
+
+# Task sections that are delta encoded, and the keys in them addressed per item
+STATE_SECTIONS = ("context", "state_snapshot")
+MESSAGE_LIST_KEYS = frozenset({"messages", "recent_messages"})
+
+
+class StateCacheMiss(Exception):
+    """An encoded task references values the server does not have."""
+
+    def __init__(self, thread_id: str, missing: List[str]):
+        super().__init__(f"State cache miss for thread {thread_id}: {len(missing)} unknown value(s)")
+        self.thread_id = thread_id
+        self.missing = missing
+
+
+def content_hash(value: Any) -> Optional[Tuple[str, int]]:
+    """Hash a JSON value canonically.
+
+    Returns:
+        (hash, serialized size), or None if the value cannot be canonicalized
+    """
+    try:
+        payload = JSON_CODEC.canonical(value)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(payload).hexdigest()[:32], len(payload)
+
+
+class _LRU:
+    """Minimal bounded LRU mapping."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max(1, max_size)
+        self._items: "OrderedDict[Any, Any]" = OrderedDict()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if key not in self._items:
+            return default
+        self._items.move_to_end(key)
+        return self._items[key]
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._items
+
+    def put(self, key: Any, value: Any):
+        self._items[key] = value
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def pop(self, key: Any):
+        self._items.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class EncodedTask:
+    """A delta-encoded task dict, pending confirmation by the server."""
+
+    def __init__(self, encoder: "StateDeltaEncoder", key: Tuple[str, str],
+                 task: Dict[str, Any], hashes: List[str], full_size: int, sent_size: int):
+        self._encoder = encoder
+        self.key = key
+        self.task = task
+        self.hashes = hashes
+        self.full_size = full_size
+        self.sent_size = sent_size
+
+    def commit(self):
+        """Record that the server now holds every value of this task."""
+        self._encoder._remember(self.key, self.hashes)
+
+    def reject(self):
+        """Forget what was assumed about the server's cache for this thread."""
+        self._encoder._forget(self.key)
+
+
+class StateDeltaEncoder:
+    """Client side: tracks which values each endpoint has cached per thread."""
+
+    def __init__(self, max_threads: Optional[int] = None, max_entries: Optional[int] = None,
+                 min_bytes: Optional[int] = None):
+        self.max_entries = max_entries or config.get('a2a.state_cache_max_entries', 128)
+        self.min_bytes = min_bytes if min_bytes is not None else config.get('a2a.state_delta_min_bytes', 256)
+        self._known = _LRU(max_threads or config.get('a2a.state_cache_max_threads', 256))
+
+    def encode(self, endpoint: str, task: Dict[str, Any], full: bool = False) -> Optional[EncodedTask]:
+        """Delta encode a task dict for an endpoint.
+
+        Args:
+            endpoint: Agent endpoint the task is sent to
+            task: Output of A2ATask.to_dict()
+            full: Send every value in full (after a cache miss)
+
+        Returns:
+            EncodedTask, or None for tasks without a thread id
+        """
+        thread_id = (task.get("context") or {}).get("thread_id")
+        if not isinstance(thread_id, str) or not thread_id:
+            return None
+
+        key = (endpoint, thread_id)
+        known = None if full else self._known.get(key)
+        hashes: List[str] = []
+        sizes = [0, 0]  # full, sent
+
+        def encode_value(value: Any) -> Any:
+            addressed = content_hash(value)
+            if addressed is None:
+                return value
+            value_hash, size = addressed
+            sizes[0] += size
+            if size < self.min_bytes:
+                sizes[1] += size
+                return value
+            hashes.append(value_hash)
+            if known is not None and value_hash in known:
+                sizes[1] += len(value_hash)
+                return {REF_KEY: value_hash}
+            sizes[1] += size
+            return {DEF_KEY: value_hash, "value": value}
+
+        encoded = dict(task)
+        for section in STATE_SECTIONS:
+            data = task.get(section)
+            if not isinstance(data, dict):
+                continue
+            encoded[section] = {
+                name: [encode_value(item) for item in value]
+                if name in MESSAGE_LIST_KEYS and isinstance(value, list)
+                else encode_value(value)
+                for name, value in data.items()
+            }
+        encoded[ENCODING_KEY] = {"scheme": DELTA_SCHEME, "thread": thread_id}
+
+        return EncodedTask(self, key, encoded, hashes, sizes[0], sizes[1])
+
+    def _remember(self, key: Tuple[str, str], hashes: List[str]):
+        known = self._known.get(key)
+        if known is None:
+            known = _LRU(self.max_entries)
+            self._known.put(key, known)
+        for value_hash in hashes:
+            known.put(value_hash, None)
+
+    def _forget(self, key: Tuple[str, str]):
+        self._known.pop(key)
+
+
+class StateCache:
+    """Server side: values received per thread, used to expand references."""
+
+    def __init__(self, max_threads: Optional[int] = None, max_entries: Optional[int] = None):
+        self.max_entries = max_entries or config.get('a2a.state_cache_max_entries', 128)
+        self._threads = _LRU(max_threads or config.get('a2a.state_cache_max_threads', 256))
+
+    def expand(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the task with every definition and reference replaced by its value.
+
+        Tasks without ``state_encoding`` are returned unchanged.
+
+        Raises:
+            StateCacheMiss: If a reference is not cached; nothing is stored then
+        """
+        encoding = task.get(ENCODING_KEY)
+        if not isinstance(encoding, dict) or encoding.get("scheme") != DELTA_SCHEME:
+            return task
+
+        thread_id = str(encoding.get("thread", ""))
+        values = self._threads.get(thread_id)
+
+        def items():
+            for section in STATE_SECTIONS:
+                data = task.get(section)
+                if not isinstance(data, dict):
+                    continue
+                for name, value in data.items():
+                    if name in MESSAGE_LIST_KEYS and isinstance(value, list):
+                        yield from value
+                    else:
+                        yield value
+
+        # Look every value up before caching this task's definitions, which
+        # could otherwise evict a value a later reference needs
+        defined: Dict[str, Any] = {}
+        referenced: Dict[str, Any] = {}
+        missing = []
+        for item in items():
+            if _is_marker(item, DEF_KEY):
+                defined[item[DEF_KEY]] = item.get("value")
+            elif _is_marker(item, REF_KEY):
+                value_hash = item[REF_KEY]
+                if values is not None and value_hash in values:
+                    referenced[value_hash] = values.get(value_hash)
+                else:
+                    missing.append(value_hash)
+        # A reference may precede the definition it points to
+        missing = [value_hash for value_hash in missing if value_hash not in defined]
+        if missing:
+            raise StateCacheMiss(thread_id, missing)
+
+        if values is None:
+            values = _LRU(self.max_entries)
+            self._threads.put(thread_id, values)
+        for value_hash, value in defined.items():
+            values.put(value_hash, value)
+
+        def resolve(item: Any) -> Any:
+            if _is_marker(item, DEF_KEY):
+                return item.get("value")
+            if _is_marker(item, REF_KEY):
+                value_hash = item[REF_KEY]
+                return defined[value_hash] if value_hash in defined else referenced[value_hash]
+            return item
+
+        expanded = {k: v for k, v in task.items() if k != ENCODING_KEY}
+        for section in STATE_SECTIONS:
+            data = task.get(section)
+            if not isinstance(data, dict):
+                continue
+            expanded[section] = {
+                name: [resolve(item) for item in value]
+                if name in MESSAGE_LIST_KEYS and isinstance(value, list)
+                else resolve(value)
+                for name, value in data.items()
+            }
+        return expanded
+
+    def __len__(self) -> int:
+        return len(self._threads)
+
+
+def _is_marker(item: Any, marker: str) -> bool:
+    return isinstance(item, dict) and isinstance(item.get(marker), str)
+
+
+_encoder: Optional[StateDeltaEncoder] = None
+
+
+def get_state_delta_encoder() -> StateDeltaEncoder:
+    """Process-wide encoder shared by all A2AClient instances."""
+    global _encoder
+    if _encoder is None:
+        _encoder = StateDeltaEncoder()
+    return _encoder
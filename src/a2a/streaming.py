@@ -0,0 +1,162 @@
+"""Streaming JSON-RPC responses for the A2A protocol.
+
+A one-shot ``process_task`` returns nothing until the agent graph has
+finished, so tool progress only reached the orchestrator through the
+``forward_events`` side channel. In streaming mode the server answers with
+newline-delimited JSON (NDJSON): zero or more JSON-RPC notifications
+carrying task events, followed by the regular JSON-RPC response::
+
+    {"jsonrpc": "2.0", "method": "task_event", "params": {"event": "agent_call_started", "data": {...}}}
+    {"jsonrpc": "2.0", "method": "task_event", "params": {"event": "artifact", "data": {...}}}
+    {"jsonrpc": "2.0", "result": {...}, "id": "..."}
+
+Clients opt in with ``Accept: application/x-ndjson``. Any registered
+handler can be streamed: events are collected from whatever code the
+handler runs (tool base classes, agent nodes) through a context-scoped
+TaskEventStream, so handlers keep their one-shot signature.
+"""
+
+import asyncio
+import json
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+TASK_EVENT_METHOD = "task_event"
+
+# Event types emitted besides the agent_call_* tool events
+PARTIAL_TEXT_EVENT = "partial_text"
+ARTIFACT_EVENT = "artifact"
+
+_current_stream: ContextVar[Optional["TaskEventStream"]] = ContextVar("a2a_task_stream", default=None)
+
+
+class TaskEventStream:
+    """Queue of events produced while a streamed request is being handled."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+        self._queue: asyncio.Queue = asyncio.Queue()
+
+    def emit(self, event_type: str, data: Dict[str, Any]):
+        """Add an event; safe to call from worker threads."""
+        event = {
+            "event": event_type,
+            "data": data,
+            "timestamp": datetime.now().isoformat()
+        }
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is self._loop:
+            self._queue.put_nowait(event)
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, event)
+
+    async def get(self) -> Dict[str, Any]:
+        return await self._queue.get()
+
+    def empty(self) -> bool:
+        return self._queue.empty()
+
+    def get_nowait(self) -> Dict[str, Any]:
+        return self._queue.get_nowait()
+
+
+def emit_task_event(event_type: str, data: Dict[str, Any]) -> bool:
+    """Send an event to the client of the streamed request being handled.
+
+    Returns:
+        True if a stream consumed the event, False outside streamed requests
+        (callers then fall back to their usual delivery, e.g. EventForwarder)
+    """
+    stream = _current_stream.get()
+    if stream is None:
+        return False
+    stream.emit(event_type, data)
+    return True
+
+
+def emit_partial_text(agent_name: str, state: Dict[str, Any], message: Any) -> bool:
+    """Stream the text of an intermediate or final LLM turn of an agent."""
+    content = getattr(message, "content", None)
+    if not content or not is_streaming():
+        return False
+    return emit_task_event(PARTIAL_TEXT_EVENT, {
+        "agent_name": agent_name,
+        "task_id": state.get("task_context", {}).get("task_id", "unknown"),
+        "content": content,
+        "has_tool_calls": bool(getattr(message, "tool_calls", None))
+    })
+
+
+def is_streaming() -> bool:
+    """Whether the current request is being streamed."""
+    return _current_stream.get() is not None
+
+
+async def stream_handler(handler: Callable[[Dict[str, Any]], Awaitable[Any]],
+                         params: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+    """Run a one-shot handler and yield its events as they are produced.
+
+    Yields ``{"event": ..., "data": ...}`` dicts, one ``artifact`` event per
+    artifact of the result, and finally ``{"event": "result", "data": result}``.
+    Handler exceptions propagate after the already-produced events.
+    """
+    stream = TaskEventStream(asyncio.get_running_loop())
+
+    async def run():
+        # Set inside the task so only this request's context sees the stream
+        _current_stream.set(stream)
+        return await handler(params)
+
+    task = asyncio.ensure_future(run())
+    try:
+        while not task.done():
+            getter = asyncio.ensure_future(stream.get())
+            await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+            if getter.done():
+                yield getter.result()
+            else:
+                getter.cancel()
+
+        # Events emitted just before the handler returned
+        while not stream.empty():
+            yield stream.get_nowait()
+
+        result = task.result()
+        if isinstance(result, dict):
+            for artifact in result.get("artifacts") or []:
+                yield {"event": ARTIFACT_EVENT, "data": artifact,
+                       "timestamp": datetime.now().isoformat()}
+        yield {"event": "result", "data": result}
+    finally:
+        if not task.done():
+            # Client went away; stop the work it asked for
+            task.cancel()
+
+
+def encode_line(payload: Dict[str, Any]) -> bytes:
+    """Serialize one NDJSON line."""
+    return (json.dumps(payload, default=str) + "\n").encode("utf-8")
+
+
+def task_event_notification(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Wrap a task event as a JSON-RPC notification."""
+    return {"jsonrpc": "2.0", "method": TASK_EVENT_METHOD, "params": event}
+
+
+async def iter_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[Dict[str, Any]]:
+    """Decode NDJSON from a byte stream, without a per-line size limit."""
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        while b"\n" in buffer:
+            line, buffer = buffer.split(b"\n", 1)
+            if line.strip():
+                yield json.loads(line)
+    if buffer.strip():
+        yield json.loads(buffer)
@@ -0,0 +1,239 @@
+"""Asynchronous task execution for A2A servers.
+
+``process_task`` holds one HTTP request open for the whole agent run, so a
+long ServiceNow or Jira workflow runs into the client's ``a2a.timeout``, and
+the retry that follows executes the task again from the start. In
+asynchronous mode the work is decoupled from the request:
+
+- ``submit_task`` (same params as ``process_task``) starts the task in the
+  background and returns a handle (``task_id``, ``status``) at once.
+  Submitting a task id that is running or has completed returns the
+  existing handle, so a retried submit never starts a second run.
+- ``get_task_status`` (``task_id``, optional ``wait`` and ``since``) long
+  polls: it answers as soon as the task has new events or has finished,
+  or after ``wait`` seconds (capped by ``a2a.task_status_max_wait``). The
+  answer carries the events after cursor ``since``, the artifacts produced
+  so far and, once finished, the result or error.
+
+The same store makes ``process_task`` idempotent per task id: a retried
+request attaches to the run already under way, or gets its result.
+
+Runs that failed, or that stopped to ask the user (result status
+``interrupted``), are started again when the task id comes back: the
+orchestrator resumes an interrupted task under the same id with the user's
+answer, which must reach the handler.
+
+Events are collected from the handler exactly as for streamed requests.
+Finished tasks stay in a bounded store for ``a2a.task_result_ttl`` seconds.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from src.utils.config import (
+    A2A_STATUS_COMPLETED,
+    A2A_STATUS_FAILED,
+    A2A_STATUS_IN_PROGRESS,
+    A2A_STATUS_PENDING,
+    config
+)
+from src.utils.logging.framework import SmartLogger
+from .streaming import ARTIFACT_EVENT, stream_handler
+
+logger = SmartLogger("a2a")
+
+SUBMIT_TASK_METHOD = "submit_task"
+TASK_STATUS_METHOD = "get_task_status"
+TASK_STATUS_NOT_FOUND = "not_found"
+# Result status of a task that paused for human input
+TASK_STATUS_INTERRUPTED = "interrupted"
+
+FINISHED_STATUSES = frozenset({A2A_STATUS_COMPLETED, A2A_STATUS_FAILED})
+
+
+class TaskFailed(Exception):
+    """A background task raised; carries the task's error message."""
+    pass
+
+
+class TaskRecord:
+    """Progress and outcome of one background task."""
+
+    def __init__(self, task_id: str, max_events: int):
+        self.task_id = task_id
+        self.status = A2A_STATUS_PENDING
+        self.max_events = max_events
+        self.events: List[Dict[str, Any]] = []
+        self.first_cursor = 0  # cursor of events[0]; older events were dropped
+        self.artifacts: List[Any] = []
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.submitted_at = time.monotonic()
+        self.finished_at: Optional[float] = None
+        self._changed = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def cursor(self) -> int:
+        return self.first_cursor + len(self.events)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def _notify(self):
+        # Wake current long polls; later polls wait on a fresh event
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def add_event(self, event: Dict[str, Any]):
+        if event.get("event") == ARTIFACT_EVENT:
+            self.artifacts.append(event.get("data"))
+        self.events.append(event)
+        if len(self.events) > self.max_events:
+            dropped = len(self.events) - self.max_events
+            del self.events[:dropped]
+            self.first_cursor += dropped
+        self._notify()
+
+    @property
+    def reusable(self) -> bool:
+        """Whether a repeated submit may be answered by this run."""
+        if self.status == A2A_STATUS_FAILED:
+            return False
+        return not (isinstance(self.result, dict) and self.result.get("status") == TASK_STATUS_INTERRUPTED)
+
+    def finish(self, result: Any = None, error: Optional[str] = None):
+        self.status = A2A_STATUS_FAILED if error is not None else A2A_STATUS_COMPLETED
+        self.result = result
+        self.error = error
+        self.finished_at = time.monotonic()
+        self._notify()
+
+    def events_since(self, since: int) -> List[Dict[str, Any]]:
+        return self.events[max(0, since - self.first_cursor):]
+
+    async def wait(self, since: int, timeout: Optional[float] = None):
+        """Wait until there are events after ``since`` or the task finishes."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.finished and self.cursor <= since:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return
+            try:
+                await asyncio.wait_for(self._changed.wait(), remaining)
+            except asyncio.TimeoutError:
+                return
+
+    def outcome(self) -> Any:
+        """Result of the finished task.
+
+        Raises:
+            TaskFailed: If the task failed
+        """
+        if self.status == A2A_STATUS_FAILED:
+            raise TaskFailed(self.error)
+        return self.result
+
+    def handle(self) -> Dict[str, Any]:
+        return {"task_id": self.task_id, "status": self.status}
+
+    def snapshot(self, since: int = 0) -> Dict[str, Any]:
+        """Status answer with the events after cursor ``since``."""
+        snapshot = {
+            "task_id": self.task_id,
+            "status": self.status,
+            "events": self.events_since(since),
+            "cursor": self.cursor,
+            "artifacts": self.artifacts,
+            "elapsed": round((self.finished_at or time.monotonic()) - self.submitted_at, 3)
+        }
+        if self.status == A2A_STATUS_COMPLETED:
+            snapshot["result"] = self.result
+        elif self.status == A2A_STATUS_FAILED:
+            snapshot["error"] = self.error
+        return snapshot
+
+
+class TaskResultStore:
+    """Background tasks by id, with finished ones kept for a TTL."""
+
+    def __init__(self, max_tasks: Optional[int] = None, ttl: Optional[float] = None,
+                 max_events: Optional[int] = None):
+        self.max_tasks = max_tasks or config.get('a2a.task_store_max_tasks', 500)
+        self.ttl = ttl if ttl is not None else config.get('a2a.task_result_ttl', 600)
+        self.max_events = max_events or config.get('a2a.task_max_events', 1000)
+        self._tasks: "OrderedDict[str, TaskRecord]" = OrderedDict()
+
+    def __contains__(self, task_id: Any) -> bool:
+        return self.get(task_id) is not None
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def get(self, task_id: Any) -> Optional[TaskRecord]:
+        self._purge()
+        return self._tasks.get(task_id) if isinstance(task_id, str) else None
+
+    def submit(self, task_id: str, handler: Callable[[Dict[str, Any]], Awaitable[Any]],
+               params: Dict[str, Any]) -> Tuple[TaskRecord, bool]:
+        """Start a task in the background unless it is running or has completed.
+
+        Tasks that failed are started again: a retry is how callers recover.
+        So are interrupted ones, which the repeated submit resumes.
+
+        Returns:
+            (record, whether the task was started by this call)
+        """
+        record = self.get(task_id)
+        if record is not None and record.reusable:
+            return record, False
+        self._tasks.pop(task_id, None)
+
+        record = TaskRecord(task_id, self.max_events)
+        record._task = asyncio.ensure_future(self._run(record, handler, params))
+        self._tasks[task_id] = record
+        self._evict()
+        return record, True
+
+    async def _run(self, record: TaskRecord, handler: Callable[[Dict[str, Any]], Awaitable[Any]],
+                   params: Dict[str, Any]):
+        record.status = A2A_STATUS_IN_PROGRESS
+        try:
+            async for event in stream_handler(handler, params):
+                if event["event"] == "result":
+                    record.finish(result=event["data"])
+                else:
+                    record.add_event(event)
+        except asyncio.CancelledError:
+            record.finish(error="Task cancelled")
+            raise
+        except Exception as e:
+            record.finish(error=str(e))
+        logger.info("a2a_background_task_finished",
+                    task_id=record.task_id,
+                    status=record.status,
+                    events=record.cursor,
+                    duration=round(record.finished_at - record.submitted_at, 3))
+
+    def _purge(self):
+        """Drop finished tasks older than the TTL."""
+        now = time.monotonic()
+        expired = [
+            task_id for task_id, record in self._tasks.items()
+            if record.finished and now - record.finished_at > self.ttl
+        ]
+        for task_id in expired:
+            del self._tasks[task_id]
+
+    def _evict(self):
+        """Keep the store bounded, dropping the oldest finished tasks first."""
+        if len(self._tasks) <= self.max_tasks:
+            return
+        for task_id in [task_id for task_id, record in self._tasks.items() if record.finished]:
+            del self._tasks[task_id]
+            logger.warning("a2a_task_result_evicted", task_id=task_id, max_tasks=self.max_tasks)
+            if len(self._tasks) <= self.max_tasks:
+                return
@@ -10,13 +10,14 @@ from langchain_core.runnables import RunnableConfig
 from src.utils.cost_tracking_decorator import create_cost_tracking_azure_openai
 from langgraph.graph import StateGraph, END
 from langgraph.prebuilt import tools_condition
-from langgraph.checkpoint.memory import MemorySaver
 
 from src.agents.jira.tools.unified import UNIFIED_JIRA_TOOLS
 from src.a2a import A2AServer, A2AArtifact, AgentCard
+from src.a2a.streaming import emit_partial_text
 from src.agents.shared.memory_writer import write_tool_result_to_memory
 from src.agents.shared.entity_extracting_tool_node import create_entity_extracting_tool_node
 from src.utils.thread_utils import create_thread_id
+from src.utils.storage.checkpointer import get_checkpointer
 from src.utils.config import config
 from src.utils.logging.framework import SmartLogger, log_execution
 from src.utils.prompt_templates import create_jira_agent_prompt, ContextInjector
@@ -77,7 +78,7 @@ async def build_jira_agent():
     
     # Define agent node inside async function (like Salesforce pattern)
     @log_execution("jira", "agent_node", include_args=False, include_result=False)
-    def agent_node(state: JiraAgentState, config: RunnableConfig):
+    async def agent_node(state: JiraAgentState, config: RunnableConfig):
         """Main agent logic node that processes messages and generates responses.
         
         Args:
@@ -111,7 +112,8 @@ async def build_jira_agent():
             messages = formatted_prompt.to_messages()
             
             # Get response from LLM with tool bindings (uses module-level llm_with_tools)
-            response = llm_with_tools.invoke(messages)
+            response = await llm_with_tools.ainvoke(messages)
+            emit_partial_text("jira", state, response)
             
             return {"messages": [response]}
             
@@ -140,8 +142,8 @@ async def build_jira_agent():
     )
     graph_builder.add_edge("tools", "agent")
     
-    # Compile with MemorySaver for in-memory checkpointing
-    return graph_builder.compile(checkpointer=MemorySaver())
+    # Compile with the persistent, pruned checkpointer
+    return graph_builder.compile(checkpointer=get_checkpointer("jira"))
 
 # Global agent instance (will be created in main)
 jira_agent = None
@@ -443,6 +445,20 @@ async def main():
         )
         await server.stop(runner)
         
+        # Flush queued memory writes before the process exits
+        from src.memory.core.hybrid_memory_manager import shutdown_hybrid_memory_manager
+        await shutdown_hybrid_memory_manager()
+        
+        # Close pooled SQLite connections; their threads block exit
+        from src.utils.storage import close_checkpointers
+        await close_checkpointers()
+        from src.utils.llm_cache import close_llm_cache
+        await close_llm_cache()
+        
+        # Close pooled Jira API connections
+        from src.agents.jira.tools.base import JiraConnectionManager
+        JiraConnectionManager().close()
+        
         # Clean up the global connection pool
         from src.a2a.protocol import get_connection_pool
         pool = get_connection_pool()
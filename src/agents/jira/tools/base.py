@@ -15,6 +15,7 @@ import requests
 from requests.auth import HTTPBasicAuth
 
 from langchain.tools import BaseTool
+from src.agents.shared.http_session import PooledHTTPSession
 from src.utils.logging.framework import SmartLogger, log_execution
 from src.orchestrator.observers.direct_call_events import (
     emit_agent_call_event,
@@ -34,6 +35,7 @@ class JiraConnectionManager:
     """Singleton connection manager for Jira."""
     _instance = None
     _connection = None
+    _http = None
     
     def __new__(cls):
         if cls._instance is None:
@@ -47,6 +49,20 @@ class JiraConnectionManager:
             self._connection = self._create_connection()
         return self._connection
     
+    @property
+    def http(self) -> PooledHTTPSession:
+        """Keep-alive HTTP session shared by all Jira tools."""
+        if self._http is None:
+            connection = self.connection
+            self._http = PooledHTTPSession("jira", auth=connection["auth"],
+                                           headers=connection["headers"])
+        return self._http
+    
+    def close(self):
+        """Close pooled HTTP connections."""
+        if self._http is not None:
+            self._http.close()
+    
     def _create_connection(self) -> Dict[str, Any]:
         """Create Jira connection configuration."""
         logger.info("jira_connection_created",
@@ -201,8 +217,7 @@ class BaseJiraTool(BaseTool, ABC):
         if _has_event_forwarder:
             forwarder = get_event_forwarder()
             if forwarder:
-                import asyncio
-                asyncio.create_task(forwarder.queue_event(
+                forwarder.queue_event_threadsafe(
                     "agent_call_started",
                     {
                         "agent_name": f"jira_{self.name}",
@@ -214,7 +229,7 @@ class BaseJiraTool(BaseTool, ABC):
                             "tool_args": kwargs
                         }
                     }
-                ))
+                )
             else:
                 logger.debug("event_forwarder_not_initialized", tool_name=self.name)
         else:
@@ -245,7 +260,7 @@ class BaseJiraTool(BaseTool, ABC):
             if _has_event_forwarder:
                 forwarder = get_event_forwarder()
                 if forwarder:
-                    asyncio.create_task(forwarder.queue_event(
+                    forwarder.queue_event_threadsafe(
                         "agent_call_completed",
                         {
                             "agent_name": f"jira_{self.name}",
@@ -258,7 +273,7 @@ class BaseJiraTool(BaseTool, ABC):
                                 "result_preview": str(result)[:200] if result else ""
                             }
                         }
-                    ))
+                    )
             else:
                 # Fallback to direct event emission
                 emit_agent_call_event(
@@ -281,7 +296,7 @@ class BaseJiraTool(BaseTool, ABC):
             if _has_event_forwarder:
                 forwarder = get_event_forwarder()
                 if forwarder:
-                    asyncio.create_task(forwarder.queue_event(
+                    forwarder.queue_event_threadsafe(
                         "agent_call_failed",
                         {
                             "agent_name": f"jira_{self.name}",
@@ -294,7 +309,7 @@ class BaseJiraTool(BaseTool, ABC):
                                 "error_type": type(e).__name__
                             }
                         }
-                    ))
+                    )
             else:
                 # Fallback to direct event emission
                 emit_agent_call_event(
@@ -319,16 +334,14 @@ class BaseJiraTool(BaseTool, ABC):
     def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """Make HTTP request to Jira API."""
         url = f"{self.jira['base_url']}/rest/api/2{endpoint}"
-        
-        response = requests.request(
-            method=method,
-            url=url,
-            auth=self.jira['auth'],
-            headers=self.jira['headers'],
-            **kwargs
-        )
-        
-        # Check for errors and include response body in exception
+
+        # Pooled keep-alive session carries auth and default headers
+        response = self._connection_manager.http.request(method, url, **kwargs)
+        self._raise_for_status(response)
+        return response
+
+    def _raise_for_status(self, response):
+        """Check for errors and include response body in exception."""
         try:
             response.raise_for_status()
         except requests.HTTPError as e:
@@ -339,8 +352,6 @@ class BaseJiraTool(BaseTool, ABC):
             except (ValueError, TypeError, AttributeError):
                 error_msg = str(e)
             raise requests.HTTPError(error_msg, response=response)
-        
-        return response
     
     def _escape_jql(self, value: str) -> str:
         """Escape special characters in JQL strings."""
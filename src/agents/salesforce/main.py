@@ -11,7 +11,6 @@ from dotenv import load_dotenv
 from langgraph.graph import StateGraph, END
 from langgraph.graph.message import add_messages
 from langgraph.prebuilt import tools_condition
-from langgraph.checkpoint.memory import MemorySaver
 
 from langchain_core.messages import HumanMessage
 from langchain_core.runnables import RunnableConfig
@@ -20,8 +19,10 @@ from src.utils.cost_tracking_decorator import create_cost_tracking_azure_openai
 # Imports no longer need path manipulation
 
 from src.a2a import A2AServer, AgentCard
+from src.a2a.streaming import emit_partial_text
 from src.agents.shared.entity_extracting_tool_node import create_entity_extracting_tool_node
 from src.utils.thread_utils import create_thread_id
+from src.utils.storage.checkpointer import get_checkpointer
 
 # Import from the centralized tools directory
 # Using new unified tools for better performance and maintainability
@@ -122,7 +123,7 @@ async def build_salesforce_graph():
     
     # Simplified agent node following 2024 patterns
     @log_execution("salesforce", "salesforce_agent", include_args=False, include_result=False)
-    def salesforce_agent(state: SalesforceState, config: RunnableConfig):
+    async def salesforce_agent(state: SalesforceState, config: RunnableConfig):
         """Modern Salesforce agent node using LangChain prompt templates"""
         state.get("task_context", {}).get("task_id", "unknown")
         
@@ -145,7 +146,8 @@ async def build_salesforce_graph():
             messages = formatted_prompt.to_messages()
             
             # Invoke LLM with tools
-            response = llm_with_tools.invoke(messages)
+            response = await llm_with_tools.ainvoke(messages)
+            emit_partial_text("salesforce", state, response)
             
             # Cost tracking removed - activity logger no longer exists
             
@@ -176,8 +178,8 @@ async def build_salesforce_graph():
     )
     graph_builder.add_edge("tools", "agent")
     
-    # Compile with MemorySaver for in-memory checkpointing
-    return graph_builder.compile(checkpointer=MemorySaver())
+    # Compile with the persistent, pruned checkpointer
+    return graph_builder.compile(checkpointer=get_checkpointer("salesforce"))
 
 # Build the graph at module level
 salesforce_graph = None  # Will be created when needed
@@ -501,6 +503,16 @@ async def main():
             
         await server.stop(runner)
         
+        # Flush queued memory writes before the process exits
+        from src.memory.core.hybrid_memory_manager import shutdown_hybrid_memory_manager
+        await shutdown_hybrid_memory_manager()
+        
+        # Close pooled SQLite connections; their threads block exit
+        from src.utils.storage import close_checkpointers
+        await close_checkpointers()
+        from src.utils.llm_cache import close_llm_cache
+        await close_llm_cache()
+        
         # Clean up the global connection pool
         from src.a2a.protocol import get_connection_pool
         pool = get_connection_pool()
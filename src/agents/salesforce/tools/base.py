@@ -208,8 +208,7 @@ class BaseSalesforceTool(BaseTool, ABC):
         if _has_event_forwarder:
             forwarder = get_event_forwarder()
             if forwarder:
-                import asyncio
-                asyncio.create_task(forwarder.queue_event(
+                forwarder.queue_event_threadsafe(
                     "agent_call_started",
                     {
                         "agent_name": f"salesforce_{self.name}",
@@ -220,7 +219,7 @@ class BaseSalesforceTool(BaseTool, ABC):
                             "tool_args": kwargs
                         }
                     }
-                ))
+                )
             else:
                 logger.debug("event_forwarder_not_initialized", tool_name=self.name)
         
@@ -238,7 +237,7 @@ class BaseSalesforceTool(BaseTool, ABC):
             if _has_event_forwarder:
                 forwarder = get_event_forwarder()
                 if forwarder:
-                    asyncio.create_task(forwarder.queue_event(
+                    forwarder.queue_event_threadsafe(
                         "agent_call_completed",
                         {
                             "agent_name": f"salesforce_{self.name}",
@@ -250,7 +249,7 @@ class BaseSalesforceTool(BaseTool, ABC):
                                 "result_preview": str(result)[:200] if result else ""
                             }
                         }
-                    ))
+                    )
             
             return wrapped_response
             
@@ -261,7 +260,7 @@ class BaseSalesforceTool(BaseTool, ABC):
             if _has_event_forwarder:
                 forwarder = get_event_forwarder()
                 if forwarder:
-                    asyncio.create_task(forwarder.queue_event(
+                    forwarder.queue_event_threadsafe(
                         "agent_call_failed",
                         {
                             "agent_name": f"salesforce_{self.name}",
@@ -273,7 +272,7 @@ class BaseSalesforceTool(BaseTool, ABC):
                                 "error_type": type(e).__name__
                             }
                         }
-                    ))
+                    )
             
             return error_response
     
@@ -10,13 +10,14 @@ from langchain_core.runnables import RunnableConfig
 from src.utils.cost_tracking_decorator import create_cost_tracking_azure_openai
 from langgraph.graph import StateGraph, END
 from langgraph.prebuilt import tools_condition
-from langgraph.checkpoint.memory import MemorySaver
 
 from src.agents.servicenow.tools.unified import UNIFIED_SERVICENOW_TOOLS
 from src.a2a import A2AServer, AgentCard
+from src.a2a.streaming import emit_partial_text
 from src.agents.shared.memory_writer import write_tool_result_to_memory
 from src.agents.shared.entity_extracting_tool_node import create_entity_extracting_tool_node
 from src.utils.thread_utils import create_thread_id
+from src.utils.storage.checkpointer import get_checkpointer
 from src.utils.config import config
 from src.utils.logging.framework import SmartLogger, log_execution
 from src.utils.prompt_templates import create_servicenow_agent_prompt, ContextInjectorServiceNow
@@ -65,7 +66,7 @@ async def build_servicenow_graph():
     
     # Define agent function inside async function (like Salesforce)
     @log_execution("servicenow", "servicenow_agent", include_args=False, include_result=False)
-    def servicenow_agent(state: ServiceNowAgentState, config: RunnableConfig):
+    async def servicenow_agent(state: ServiceNowAgentState, config: RunnableConfig):
         """Main agent logic for ServiceNow operations using LangChain prompt templates."""
         task_id = state.get("task_context", {}).get("task_id", "unknown")
         
@@ -94,7 +95,8 @@ async def build_servicenow_graph():
             
             # Call LLM with tools (uses module-level llm_with_tools)
             logger.info("servicenow_agent_llm_call", task_id=task_id, message_count=len(messages))
-            response = llm_with_tools.invoke(messages)
+            response = await llm_with_tools.ainvoke(messages)
+            emit_partial_text("servicenow", state, response)
             
             logger.info("servicenow_agent_llm_response",
                        task_id=task_id,
@@ -130,8 +132,8 @@ async def build_servicenow_graph():
     )
     graph_builder.add_edge("tools", "agent")
     
-    # Compile with MemorySaver for in-memory checkpointing
-    return graph_builder.compile(checkpointer=MemorySaver())
+    # Compile with the persistent, pruned checkpointer
+    return graph_builder.compile(checkpointer=get_checkpointer("servicenow"))
 
 # Global agent instance (will be initialized in main)
 servicenow_agent = None
@@ -331,6 +333,20 @@ async def main(port: int = 8003):
     finally:
         await server.stop(runner)
         
+        # Flush queued memory writes before the process exits
+        from src.memory.core.hybrid_memory_manager import shutdown_hybrid_memory_manager
+        await shutdown_hybrid_memory_manager()
+        
+        # Close pooled SQLite connections; their threads block exit
+        from src.utils.storage import close_checkpointers
+        await close_checkpointers()
+        from src.utils.llm_cache import close_llm_cache
+        await close_llm_cache()
+        
+        # Close pooled ServiceNow API connections
+        from src.agents.servicenow.tools.base import ServiceNowConnectionManager
+        ServiceNowConnectionManager().close()
+        
         # Clean up the global connection pool
         from src.a2a.protocol import get_connection_pool
         pool = get_connection_pool()
@@ -15,6 +15,7 @@ import requests
 from requests.auth import HTTPBasicAuth
 
 from langchain.tools import BaseTool
+from src.agents.shared.http_session import PooledHTTPSession
 from src.utils.logging.framework import SmartLogger, log_execution
 from src.orchestrator.observers.direct_call_events import (
     emit_agent_call_event,
@@ -34,6 +35,7 @@ class ServiceNowConnectionManager:
     """Singleton connection manager for ServiceNow."""
     _instance = None
     _connection = None
+    _http = None
     
     def __new__(cls):
         if cls._instance is None:
@@ -47,6 +49,20 @@ class ServiceNowConnectionManager:
             self._connection = self._create_connection()
         return self._connection
     
+    @property
+    def http(self) -> PooledHTTPSession:
+        """Keep-alive HTTP session shared by all ServiceNow tools."""
+        if self._http is None:
+            connection = self.connection
+            self._http = PooledHTTPSession("servicenow", auth=connection["auth"],
+                                           headers=connection["headers"])
+        return self._http
+    
+    def close(self):
+        """Close pooled HTTP connections."""
+        if self._http is not None:
+            self._http.close()
+    
     def _create_connection(self) -> Dict[str, Any]:
         """Create ServiceNow connection configuration."""
         instance = os.environ.get('SERVICENOW_INSTANCE', '').rstrip('/')
@@ -229,8 +245,7 @@ class BaseServiceNowTool(BaseTool, ABC):
         if _has_event_forwarder:
             forwarder = get_event_forwarder()
             if forwarder:
-                import asyncio
-                asyncio.create_task(forwarder.queue_event(
+                forwarder.queue_event_threadsafe(
                     "agent_call_started",
                     {
                         "agent_name": f"servicenow_{self.name}",
@@ -242,7 +257,7 @@ class BaseServiceNowTool(BaseTool, ABC):
                             "tool_args": kwargs
                         }
                     }
-                ))
+                )
             else:
                 logger.debug("event_forwarder_not_initialized", tool_name=self.name)
         else:
@@ -273,7 +288,7 @@ class BaseServiceNowTool(BaseTool, ABC):
             if _has_event_forwarder:
                 forwarder = get_event_forwarder()
                 if forwarder:
-                    asyncio.create_task(forwarder.queue_event(
+                    forwarder.queue_event_threadsafe(
                         "agent_call_completed",
                         {
                             "agent_name": f"servicenow_{self.name}",
@@ -286,7 +301,7 @@ class BaseServiceNowTool(BaseTool, ABC):
                                 "result_preview": str(result)[:200] if result else ""
                             }
                         }
-                    ))
+                    )
             else:
                 # Fallback to direct event emission
                 emit_agent_call_event(
@@ -309,7 +324,7 @@ class BaseServiceNowTool(BaseTool, ABC):
             if _has_event_forwarder:
                 forwarder = get_event_forwarder()
                 if forwarder:
-                    asyncio.create_task(forwarder.queue_event(
+                    forwarder.queue_event_threadsafe(
                         "agent_call_failed",
                         {
                             "agent_name": f"servicenow_{self.name}",
@@ -322,7 +337,7 @@ class BaseServiceNowTool(BaseTool, ABC):
                                 "error_type": type(e).__name__
                             }
                         }
-                    ))
+                    )
             else:
                 # Fallback to direct event emission
                 emit_agent_call_event(
@@ -347,17 +362,12 @@ class BaseServiceNowTool(BaseTool, ABC):
     def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """Make HTTP request to ServiceNow API."""
         url = f"{self.servicenow['base_url']}{endpoint}"
-        
-        response = requests.request(
-            method=method,
-            url=url,
-            auth=self.servicenow['auth'],
-            headers=self.servicenow['headers'],
-            **kwargs
-        )
+
+        # Pooled keep-alive session carries auth and default headers
+        response = self._connection_manager.http.request(method, url, **kwargs)
         response.raise_for_status()
         return response
-    
+
     def _detect_table_from_number(self, number: str) -> Optional[str]:
         """Detect ServiceNow table from record number prefix."""
         prefix_map = {
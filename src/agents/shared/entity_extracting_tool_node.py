@@ -3,8 +3,10 @@
 from typing import Dict, Any, List
 from langchain_core.messages import ToolMessage
 import json
+from langgraph.errors import GraphInterrupt
 
 from src.agents.shared.memory_writer import write_tool_result_to_memory
+from src.utils.agents.tool_execution import execute_tool_calls, get_agent_limiter, invoke_tool
 from src.utils.thread_utils import create_thread_id
 from src.utils.logging.framework import SmartLogger
 
@@ -52,21 +54,21 @@ async def create_entity_extracting_tool_node(tools: List[Any], agent_name: str):
         
         # Create tools_by_name mapping
         tools_by_name = {tool.name: tool for tool in tools}
+        limiter = get_agent_limiter(agent_name)
         
-        outputs = []
-        for tool_call in last_message.tool_calls:
+        async def run_tool_call(tool_call: Dict[str, Any]) -> ToolMessage:
             try:
                 # Execute the tool
                 tool = tools_by_name[tool_call["name"]]
-                tool_result = tool.invoke(tool_call["args"])
-                
+                tool_result = await invoke_tool(tool, tool_call["args"], limiter=limiter)
+
                 # Write raw result to memory BEFORE formatting
                 logger.info(f"{agent_name}_tool_result_debug",
                            user_id=user_id,
                            tool_result_type=type(tool_result).__name__,
                            is_dict=isinstance(tool_result, dict),
                            has_success=tool_result.get('success') if isinstance(tool_result, dict) else False)
-                
+
                 if isinstance(tool_result, dict) and tool_result.get('success'):
                     try:
                         # Since we're in an async context, we can await directly
@@ -80,7 +82,7 @@ async def create_entity_extracting_tool_node(tools: List[Any], agent_name: str):
                             agent_name=agent_name,
                             user_id=user_id  # Can be None, entities will still be stored globally
                         )
-                        
+
                         logger.info(f"{agent_name}_tool_result_written_to_memory",
                                    tool_name=tool_call["name"],
                                    has_data=bool(tool_result.get('data')),
@@ -90,29 +92,30 @@ async def create_entity_extracting_tool_node(tools: List[Any], agent_name: str):
                         logger.warning(f"{agent_name}_failed_to_write_raw_tool_result",
                                      tool_name=tool_call["name"],
                                      error=str(e))
-                
+
                 # Create ToolMessage with JSON-serialized result
-                outputs.append(
-                    ToolMessage(
-                        content=json.dumps(tool_result),
-                        name=tool_call["name"],
-                        tool_call_id=tool_call["id"],
-                    )
+                return ToolMessage(
+                    content=json.dumps(tool_result),
+                    name=tool_call["name"],
+                    tool_call_id=tool_call["id"],
                 )
+            except GraphInterrupt:
+                raise
             except Exception as e:
                 # Handle tool execution errors
-                outputs.append(
-                    ToolMessage(
-                        content=f"Error executing tool: {str(e)}",
-                        name=tool_call["name"],
-                        tool_call_id=tool_call["id"],
-                        status="error"
-                    )
-                )
                 logger.error(f"{agent_name}_tool_execution_error",
                            tool_name=tool_call["name"],
                            error=str(e))
-        
+                return ToolMessage(
+                    content=f"Error executing tool: {str(e)}",
+                    name=tool_call["name"],
+                    tool_call_id=tool_call["id"],
+                    status="error"
+                )
+
+        # Independent tool calls run concurrently; messages keep call order
+        outputs = await execute_tool_calls(last_message.tool_calls, run_tool_call)
+
         return {"messages": outputs}
     
     return custom_tool_node
\ No newline at end of file
@@ -9,6 +9,7 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 from src.utils.logging.framework import SmartLogger
 from src.a2a.client import A2AClient
+from src.a2a.streaming import emit_task_event
 
 logger = SmartLogger("event_forwarder")
 
@@ -30,6 +31,7 @@ class EventForwarder:
         self.flush_interval = 0.5  # seconds
         self._running = False
         self._flush_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self.a2a_client = A2AClient(base_url=orchestrator_url)
         
     async def start(self):
@@ -38,6 +40,7 @@ class EventForwarder:
             return
             
         self._running = True
+        self._loop = asyncio.get_running_loop()
         self._flush_task = asyncio.create_task(self._periodic_flush())
         logger.info("event_forwarder_started", 
                    agent_name=self.agent_name,
@@ -79,6 +82,32 @@ class EventForwarder:
         if len(self.event_queue) >= self.batch_size:
             await self.flush()
     
+    def queue_event_threadsafe(self, event_type: str, event_data: Dict[str, Any]):
+        """Queue an event from synchronous code, on any thread.
+        
+        Synchronous tools run on worker threads, where asyncio.create_task
+        is unavailable; the event is handed to the forwarder's loop instead.
+        During a streamed A2A request the event goes to the requesting
+        client directly and is not forwarded.
+        """
+        if emit_task_event(event_type, event_data):
+            return
+        
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        
+        loop = self._loop or running_loop
+        if loop is None or loop.is_closed():
+            logger.debug("event_forwarder_no_loop", event_type=event_type)
+            return
+        
+        if loop is running_loop:
+            loop.create_task(self.queue_event(event_type, event_data))
+        else:
+            asyncio.run_coroutine_threadsafe(self.queue_event(event_type, event_data), loop)
+    
     async def flush(self):
         """Send all queued events to the orchestrator."""
         if not self.event_queue:
@@ -0,0 +1,101 @@
+"""Pooled keep-alive HTTP sessions for REST-based agent tools.
+
+Jira and ServiceNow tools issue several API calls per tool run (JiraUpdate
+does a PUT, a GET, a transitions lookup and comments). Calling the
+module-level ``requests.request`` for each of them opens a new TCP + TLS
+connection every time. A PooledHTTPSession is owned by the agent's
+connection manager singleton and keeps connections alive across calls:
+a shared ``requests.Session`` with a sized connection pool, a retry adapter
+and default timeouts. It is safe to use from the worker threads that tools
+run in (``src/utils/agents/tool_execution.py``).
+
+Settings come from the ``http_client`` section of system_config.json.
+"""
+
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.utils.config import config
+from src.utils.logging.framework import SmartLogger
+
+logger = SmartLogger("http_session")
+
+# Transient statuses worth retrying; urllib3 honors Retry-After on 429/503
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+
+class PooledHTTPSession:
+    """Keep-alive session for one API host."""
+
+    def __init__(self, name: str, auth: Optional[requests.auth.HTTPBasicAuth] = None,
+                 headers: Optional[Dict[str, str]] = None):
+        """Initialize the session holder.
+
+        Args:
+            name: Component name used in logs (e.g. "jira")
+            auth: Basic auth applied to every request
+            headers: Default headers applied to every request
+        """
+        self.name = name
+        self.auth = auth
+        self.headers = dict(headers or {})
+
+        self.pool_size = config.get('http_client.pool_size', 20)
+        self.max_retries = config.get('http_client.max_retries', 3)
+        self.retry_backoff = config.get('http_client.retry_backoff', 0.5)
+        self.connect_timeout = config.get('http_client.connect_timeout', 10)
+        self.read_timeout = config.get('http_client.read_timeout', 60)
+
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def timeout(self) -> tuple:
+        """Default (connect, read) timeout."""
+        return (self.connect_timeout, self.read_timeout)
+
+    @property
+    def session(self) -> requests.Session:
+        """Shared requests.Session, created on first use."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request over the pooled session (default timeout applied)."""
+        kwargs.setdefault('timeout', self.timeout)
+        return self.session.request(method=method, url=url, **kwargs)
+
+    def close(self):
+        """Close the session and its pooled connections."""
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def _create_session(self) -> requests.Session:
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=self.retry_backoff,
+            status_forcelist=RETRY_STATUS_CODES,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=retry)
+
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.auth = self.auth
+        session.headers.update(self.headers)
+
+        logger.info("http_session_created",
+                   component=self.name,
+                   pool_size=self.pool_size,
+                   max_retries=self.max_retries)
+        return session
@@ -10,12 +10,12 @@ from .core import (
 # Components
 from .components import (
     NodeManager, TextProcessor, ScoringEngine, 
-    QueryContext, ScoreComponents, InvertedIndex
+    QueryContext, ScoreComponents, InvertedIndex, EmbeddingIndex
 )
 
 # Algorithms
 from .algorithms import (
-    GraphAlgorithms, SemanticEmbeddings, get_embeddings,
+    GraphAlgorithms, IncrementalGraphMetrics, SemanticEmbeddings, get_embeddings,
     auto_generate_summary
 )
 
@@ -39,8 +39,10 @@ __all__ = [
     'QueryContext',
     'ScoreComponents',
     'InvertedIndex',
+    'EmbeddingIndex',
     # Algorithms
     'GraphAlgorithms',
+    'IncrementalGraphMetrics',
     'SemanticEmbeddings',
     'get_embeddings',
     'auto_generate_summary',
@@ -1,11 +1,13 @@
 """Memory system algorithms."""
 
 from .graph_algorithms import GraphAlgorithms
+from .incremental_metrics import IncrementalGraphMetrics
 from .semantic_embeddings import SemanticEmbeddings, get_embeddings
 from .summary_generator import auto_generate_summary
 
 __all__ = [
     'GraphAlgorithms',
+    'IncrementalGraphMetrics',
     'SemanticEmbeddings',
     'get_embeddings',
     'auto_generate_summary'
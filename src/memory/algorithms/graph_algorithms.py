@@ -24,7 +24,8 @@ class GraphAlgorithms:
     @staticmethod
     def calculate_pagerank(graph: nx.MultiDiGraph, 
                           personalization: Optional[Dict[str, float]] = None,
-                          damping: float = 0.85) -> Dict[str, float]:
+                          damping: float = 0.85,
+                          nstart: Optional[Dict[str, float]] = None) -> Dict[str, float]:
         """Calculate PageRank scores for nodes in the memory graph.
         
         PageRank identifies "important" memories based on their relationships.
@@ -35,6 +36,8 @@ class GraphAlgorithms:
             graph: The memory graph
             personalization: Optional bias towards specific nodes
             damping: PageRank damping factor (default 0.85)
+            nstart: Optional starting vector (e.g. the previous scores) used
+                to warm-start the power iteration
             
         Returns:
             Dict mapping node_id to PageRank score
@@ -44,19 +47,24 @@ class GraphAlgorithms:
             
         try:
             # Convert multi-edges to weighted edges for PageRank
-            simple_graph = nx.DiGraph()
-            for u, v, data in graph.edges(data=True):
-                if simple_graph.has_edge(u, v):
-                    # Increase weight for multiple relationships
-                    simple_graph[u][v]['weight'] += data.get('weight', 1.0)
-                else:
-                    simple_graph.add_edge(u, v, weight=data.get('weight', 1.0))
+            # (callers that already maintain a weighted DiGraph skip this)
+            if graph.is_multigraph():
+                simple_graph = nx.DiGraph()
+                for u, v, data in graph.edges(data=True):
+                    if simple_graph.has_edge(u, v):
+                        # Increase weight for multiple relationships
+                        simple_graph[u][v]['weight'] += data.get('weight', 1.0)
+                    else:
+                        simple_graph.add_edge(u, v, weight=data.get('weight', 1.0))
+            else:
+                simple_graph = graph
             
             # Calculate PageRank
             pagerank_scores = nx.pagerank(
                 simple_graph,
                 alpha=damping,
                 personalization=personalization,
+                nstart=nstart,
                 weight='weight'
             )
             
@@ -104,7 +112,9 @@ class GraphAlgorithms:
     
     @staticmethod
     def calculate_betweenness_centrality(graph: nx.MultiDiGraph,
-                                       normalized: bool = True) -> Dict[str, float]:
+                                       normalized: bool = True,
+                                       sample_size: Optional[int] = None,
+                                       seed: Optional[int] = None) -> Dict[str, float]:
         """Calculate betweenness centrality for nodes.
         
         Betweenness centrality identifies "bridge" memories that connect
@@ -114,6 +124,10 @@ class GraphAlgorithms:
         Args:
             graph: The memory graph
             normalized: Whether to normalize scores
+            sample_size: Number of source nodes to sample. When smaller than
+                the graph, an approximation is computed in O(k*E) instead
+                of the exact O(V*E)
+            seed: Random seed for pivot sampling (keeps results stable)
             
         Returns:
             Dict mapping node_id to betweenness centrality score
@@ -122,13 +136,17 @@ class GraphAlgorithms:
             return {}
             
         try:
+            k = sample_size if sample_size and sample_size < len(graph) else None
             centrality = nx.betweenness_centrality(
                 graph,
-                normalized=normalized
+                k=k,
+                normalized=normalized,
+                seed=seed
             )
             
             logger.debug("betweenness_calculated",
                         node_count=len(centrality),
+                        sampled=k is not None,
                         top_scores=sorted(centrality.values(), reverse=True)[:5])
             
             return centrality
@@ -14,6 +14,9 @@ except ImportError:
     EMBEDDINGS_AVAILABLE = False
     logger.warning("sentence-transformers not available - falling back to keyword matching")
 
+# Bump when MemoryNode.get_embedding_text() changes so persisted vectors are recomputed
+EMBEDDING_TEXT_VERSION = 1
+
 
 class SemanticEmbeddings:
     """Manages semantic embeddings for memory nodes."""
@@ -27,6 +30,7 @@ class SemanticEmbeddings:
         - 'paraphrase-MiniLM-L3-v2': 60MB, fastest, okay quality
         """
         self.model = None
+        self.model_name = model_name
         self.embeddings_cache: Dict[str, np.ndarray] = {}
         
         if EMBEDDINGS_AVAILABLE:
@@ -40,6 +44,27 @@ class SemanticEmbeddings:
         """Check if embeddings are available."""
         return self.model is not None
     
+    @property
+    def model_tag(self) -> str:
+        """Model name/version tag stored alongside persisted embeddings."""
+        return f"{self.model_name}:v{EMBEDDING_TEXT_VERSION}"
+    
+    def serialize_embedding(self, embedding: Optional[np.ndarray]) -> Tuple[Optional[bytes], Optional[str]]:
+        """Convert an embedding to (float32 bytes, model tag) for storage."""
+        if embedding is None:
+            return None, None
+        return np.asarray(embedding, dtype=np.float32).tobytes(), self.model_tag
+    
+    def deserialize_embedding(self, blob: Optional[bytes], model_tag: Optional[str]) -> Optional[np.ndarray]:
+        """Restore a stored embedding if it was produced by the current model.
+        
+        Embeddings tagged with a different model or text version are ignored
+        so they get recomputed lazily.
+        """
+        if not blob or model_tag != self.model_tag:
+            return None
+        return np.frombuffer(bytes(blob), dtype=np.float32).copy()
+    
     def encode_text(self, text: str) -> Optional[np.ndarray]:
         """Encode text to embedding vector."""
         if not self.model:
@@ -69,6 +94,26 @@ class SemanticEmbeddings:
             logger.error(f"Failed to encode text: {e}")
             return None
     
+    def encode_texts(self, texts: List[str], batch_size: int = 64) -> List[Optional[np.ndarray]]:
+        """Encode many texts in one batched model call.
+        
+        Blocks for the duration of the encode; async callers should run it
+        in an executor.
+        """
+        if not self.model or not texts:
+            return [None] * len(texts)
+        
+        missing = list(dict.fromkeys(text for text in texts if text not in self.embeddings_cache))
+        encoded: Dict[str, np.ndarray] = {}
+        if missing:
+            try:
+                vectors = self.model.encode(missing, batch_size=batch_size, convert_to_numpy=True)
+                encoded = dict(zip(missing, vectors))
+            except Exception as e:
+                logger.error(f"Failed to encode texts: {e}")
+        
+        return [self.embeddings_cache.get(text, encoded.get(text)) for text in texts]
+    
     def calculate_similarity(self, embedding1: np.ndarray, embedding2: np.ndarray) -> float:
         """Calculate cosine similarity between two embeddings."""
         if embedding1 is None or embedding2 is None:
@@ -91,20 +136,16 @@ class SemanticEmbeddings:
         Returns:
             List of (node_id, similarity_score) tuples
         """
-        if not query_embedding.any() or not candidate_embeddings:
+        if query_embedding is None or not query_embedding.any() or not candidate_embeddings:
             return []
         
-        similarities = []
-        
+        # Build one matrix so all similarities come from a single product
+        from ..components.embedding_index import EmbeddingIndex
+        index = EmbeddingIndex(initial_capacity=len(candidate_embeddings))
         for node_id, candidate_embedding in candidate_embeddings:
-            if candidate_embedding is not None:
-                similarity = self.calculate_similarity(query_embedding, candidate_embedding)
-                similarities.append((node_id, similarity))
-        
-        # Sort by similarity (highest first)
-        similarities.sort(key=lambda x: x[1], reverse=True)
+            index.add(node_id, candidate_embedding)
         
-        return similarities[:top_k]
+        return index.top_k(query_embedding, top_k)
 
 
 # Global instance (lazy loaded)
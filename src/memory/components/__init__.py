@@ -4,6 +4,7 @@ from .node_manager import NodeManager
 from .text_processor import TextProcessor
 from .scoring_engine import ScoringEngine, QueryContext, ScoreComponents
 from .inverted_index import InvertedIndex
+from .embedding_index import EmbeddingIndex
 
 __all__ = [
     'NodeManager',
@@ -11,5 +12,6 @@ __all__ = [
     'ScoringEngine',
     'QueryContext',
     'ScoreComponents',
-    'InvertedIndex'
+    'InvertedIndex',
+    'EmbeddingIndex'
 ]
\ No newline at end of file
@@ -0,0 +1,170 @@
+"""Contiguous embedding matrix for vectorized semantic scoring."""
+
+import numpy as np
+from typing import Dict, List, Optional, Tuple, Iterable
+
+from src.utils.logging.framework import SmartLogger
+
+logger = SmartLogger("memory.embeddings")
+
+
+class EmbeddingIndex:
+    """Pre-normalized float32 embedding matrix with a node-id row map.
+
+    Rows are L2-normalized on insert, so cosine similarity against every
+    indexed node is a single matrix-vector product. Removal swaps the last
+    row into the freed slot to keep the matrix dense.
+    """
+
+    def __init__(self, initial_capacity: int = 256):
+        self.initial_capacity = initial_capacity
+        self._matrix: Optional[np.ndarray] = None  # Allocated on first add
+        self._node_ids: List[str] = []
+        self._row_of: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._node_ids)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._row_of
+
+    @property
+    def dimension(self) -> Optional[int]:
+        """Embedding dimension, or None until the first vector is added."""
+        return self._matrix.shape[1] if self._matrix is not None else None
+
+    def add(self, node_id: str, embedding) -> bool:
+        """Add or replace the embedding for a node.
+
+        Returns:
+            True if the vector was indexed, False if it was rejected
+        """
+        vector = self._normalize(embedding)
+        if vector is None:
+            return False
+
+        if self._matrix is None:
+            self._matrix = np.zeros((self.initial_capacity, vector.shape[0]), dtype=np.float32)
+        elif vector.shape[0] != self._matrix.shape[1]:
+            logger.warning("embedding_dimension_mismatch",
+                         node_id=node_id,
+                         expected=self._matrix.shape[1],
+                         actual=vector.shape[0])
+            return False
+
+        row = self._row_of.get(node_id)
+        if row is None:
+            row = len(self._node_ids)
+            if row >= self._matrix.shape[0]:
+                self._grow()
+            self._node_ids.append(node_id)
+            self._row_of[node_id] = row
+
+        self._matrix[row] = vector
+        return True
+
+    def remove(self, node_id: str) -> bool:
+        """Remove a node's embedding, keeping the matrix dense."""
+        row = self._row_of.pop(node_id, None)
+        if row is None:
+            return False
+
+        last_row = len(self._node_ids) - 1
+        if row != last_row:
+            moved_id = self._node_ids[last_row]
+            self._matrix[row] = self._matrix[last_row]
+            self._node_ids[row] = moved_id
+            self._row_of[moved_id] = row
+
+        self._node_ids.pop()
+        return True
+
+    def similarities(self, query_embedding,
+                     node_ids: Optional[Iterable[str]] = None) -> Dict[str, float]:
+        """Cosine similarity of the query against indexed nodes.
+
+        Args:
+            query_embedding: Query vector (need not be normalized)
+            node_ids: Restrict the result to these nodes (default: all)
+
+        Returns:
+            Dict mapping node_id to similarity; nodes without an indexed
+            embedding are omitted
+        """
+        scores = self._score_all(query_embedding)
+        if scores is None:
+            return {}
+
+        if node_ids is None:
+            return dict(zip(self._node_ids, scores.tolist()))
+
+        result = {}
+        for node_id in node_ids:
+            row = self._row_of.get(node_id)
+            if row is not None:
+                result[node_id] = float(scores[row])
+        return result
+
+    def top_k(self, query_embedding, k: int,
+              node_ids: Optional[Iterable[str]] = None) -> List[Tuple[str, float]]:
+        """Most similar nodes to the query, highest first.
+
+        Uses argpartition so selection is O(n) rather than a full sort.
+        """
+        scores = self._score_all(query_embedding)
+        if scores is None or k <= 0:
+            return []
+
+        if node_ids is None:
+            ids = self._node_ids
+        else:
+            rows = [self._row_of[node_id] for node_id in node_ids if node_id in self._row_of]
+            if not rows:
+                return []
+            rows = np.asarray(rows, dtype=np.intp)
+            ids = [self._node_ids[row] for row in rows]
+            scores = scores[rows]
+
+        if k < len(scores):
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top])]
+
+        return [(ids[i], float(scores[i])) for i in top]
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Get index statistics."""
+        return {
+            'indexed_embeddings': len(self._node_ids),
+            'embedding_capacity': self._matrix.shape[0] if self._matrix is not None else 0,
+            'embedding_dimension': self.dimension or 0
+        }
+
+    def _score_all(self, query_embedding) -> Optional[np.ndarray]:
+        """One matrix-vector product over every populated row."""
+        if self._matrix is None or not self._node_ids:
+            return None
+
+        query = self._normalize(query_embedding)
+        if query is None or query.shape[0] != self._matrix.shape[1]:
+            return None
+
+        return self._matrix[:len(self._node_ids)] @ query
+
+    def _grow(self):
+        """Double the matrix capacity."""
+        capacity, dimension = self._matrix.shape
+        grown = np.zeros((capacity * 2, dimension), dtype=np.float32)
+        grown[:capacity] = self._matrix
+        self._matrix = grown
+
+    @staticmethod
+    def _normalize(embedding) -> Optional[np.ndarray]:
+        if embedding is None:
+            return None
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        if vector.size == 0 or norm == 0 or not np.isfinite(norm):
+            return None
+        return vector / norm
@@ -1,11 +1,13 @@
 """Node manager for memory framework - handles storage and indexing."""
 
+import asyncio
 from typing import Dict, Set, List, Optional, Tuple
 from datetime import datetime
 from collections import defaultdict, deque
 
 from ..core.memory_node import MemoryNode, ContextType
 from .inverted_index import InvertedIndex
+from .embedding_index import EmbeddingIndex
 from .text_processor import TextProcessor
 from ..config.memory_config import MEMORY_CONFIG
 from src.utils.logging.framework import SmartLogger
@@ -32,6 +34,8 @@ class NodeManager:
         # Components
         self.text_processor = TextProcessor(self.config)
         self.inverted_index = InvertedIndex(self.text_processor)
+        self.embedding_index = EmbeddingIndex()
+        self._unembedded: Set[str] = set()  # nodes awaiting backfill_embeddings()
         
         # Access tracking
         self.recent_accessed_nodes: deque = deque(maxlen=20)
@@ -61,6 +65,9 @@ class NodeManager:
         # Update inverted index
         self._update_inverted_index(node_id, node)
         
+        # Update embedding matrix
+        self._update_embedding_index(node_id, node)
+        
         logger.debug("node_added",
                     thread_id=self.thread_id,
                     node_id=node_id,
@@ -97,6 +104,10 @@ class NodeManager:
         # Remove from inverted index
         self.inverted_index.remove_document(node_id)
         
+        # Remove from embedding matrix
+        self.embedding_index.remove(node_id)
+        self._unembedded.discard(node_id)
+        
         # Remove from storage
         del self.nodes[node_id]
         
@@ -239,6 +250,58 @@ class NodeManager:
         # Add to inverted index
         self.inverted_index.add_document(node_id, text)
     
+    def _update_embedding_index(self, node_id: str, node: MemoryNode):
+        """Add the node's embedding to the embedding matrix.
+        
+        Only embeddings already computed or restored from storage are added;
+        encoding here would block the event loop once per node. Other nodes
+        wait for backfill_embeddings().
+        """
+        embedding = node.cached_embedding
+        if embedding is not None:
+            self.embedding_index.add(node_id, embedding)
+        else:
+            self._unembedded.add(node_id)
+    
+    @property
+    def pending_embedding_count(self) -> int:
+        """Number of nodes not yet in the embedding matrix."""
+        return len(self._unembedded)
+    
+    async def backfill_embeddings(self) -> int:
+        """Encode nodes added without an embedding, in one batch off the event loop.
+        
+        Returns:
+            Number of nodes added to the embedding matrix
+        """
+        if not self._unembedded:
+            return 0
+        
+        from ..algorithms.semantic_embeddings import get_embeddings
+        embeddings = get_embeddings()
+        node_ids = [node_id for node_id in self._unembedded if node_id in self.nodes]
+        self._unembedded.clear()
+        if not embeddings.is_available() or not node_ids:
+            return 0
+        
+        texts = [self.nodes[node_id].get_embedding_text() for node_id in node_ids]
+        vectors = await asyncio.get_running_loop().run_in_executor(None, embeddings.encode_texts, texts)
+        
+        added = 0
+        for node_id, vector in zip(node_ids, vectors):
+            node = self.nodes.get(node_id)
+            if node is None or vector is None:
+                continue
+            if node.cached_embedding is None:
+                node.set_embedding(vector)
+            self.embedding_index.add(node_id, node.cached_embedding)
+            added += 1
+        
+        logger.debug("embeddings_backfilled",
+                    thread_id=self.thread_id,
+                    node_count=added)
+        return added
+    
     def get_node_count(self) -> int:
         """Get the total number of nodes."""
         return len(self.nodes)
@@ -252,6 +315,8 @@ class NodeManager:
             'total_entities': len(self.entity_id_index),
             'nodes_created': self.total_nodes_created,
             'nodes_cleaned': self.total_nodes_cleaned,
-            'index_stats': self.inverted_index.get_statistics()
+            'index_stats': self.inverted_index.get_statistics(),
+            'embedding_stats': self.embedding_index.get_statistics(),
+            'pending_embeddings': len(self._unembedded)
         }
         return stats
\ No newline at end of file
@@ -22,6 +22,7 @@ class QueryContext:
     query_embedding: Optional[any] = None
     query_type: str = 'default'
     current_time: datetime = None
+    semantic_scores: Optional[Dict[str, float]] = None  # Precomputed by EmbeddingIndex
     
     def __post_init__(self):
         if self.current_time is None:
@@ -76,9 +77,11 @@ class ScoringEngine:
         components.tag_score = self._calculate_tag_score(node, context)
         
         # Semantic score (if embeddings available)
-        if context.query_embedding is not None and node.embedding is not None:
+        if context.semantic_scores is not None and node.node_id in context.semantic_scores:
+            components.semantic_score = context.semantic_scores[node.node_id]
+        elif context.query_embedding is not None and node.cached_embedding is not None:
             components.semantic_score = self._calculate_semantic_score(
-                context.query_embedding, node.embedding
+                context.query_embedding, node.cached_embedding
             )
         
         # Recency boost
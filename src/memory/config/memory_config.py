@@ -96,11 +96,30 @@ class MemoryConfig:
     MIN_NODES_TO_KEEP: int = 100
     CLEANUP_BATCH_SIZE: int = 100
     
+    # Hydration from PostgreSQL
+    HYDRATION_NODE_BATCH_SIZE: int = 500
+    HYDRATION_EDGE_BATCH_SIZE: int = 1000
+    
+    # Write-behind persistence to PostgreSQL
+    WRITE_BEHIND_ENABLED: bool = True
+    WRITE_BEHIND_BATCH_SIZE: int = 100       # Flush once this many writes are queued
+    WRITE_BEHIND_FLUSH_INTERVAL: float = 0.5  # ...or after this many seconds
+    WRITE_BEHIND_MAX_RETRIES: int = 3
+    WRITE_BEHIND_MAX_QUEUE_SIZE: int = 5000  # Callers wait for a flush beyond this
+    WRITE_BEHIND_ID_MAP_SIZE: int = 10000
+    
     # Graph algorithms
     PAGERANK_ALPHA: float = 0.85
     CENTRALITY_NORMALIZED: bool = True
     MAX_PATH_LENGTH: int = 3
     
+    # Incremental graph metrics
+    BETWEENNESS_SAMPLE_SIZE: int = 64   # Pivot nodes for approximate betweenness
+    BETWEENNESS_SAMPLE_SEED: int = 42
+    METRICS_MAX_PENDING_CHANGES: int = 200  # Local edits before a full recompute
+    METRICS_MAX_PENDING_RATIO: float = 0.2  # ...or this fraction of the graph
+    COMMUNITY_LOCAL_PASSES: int = 3     # Local-move passes over the affected neighborhood
+    
     # Retrieval settings
     DEFAULT_MAX_RESULTS: int = 10
     MAX_CANDIDATES_MULTIPLIER: int = 10  # Check 10x max_results candidates
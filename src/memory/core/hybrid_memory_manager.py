@@ -1,11 +1,14 @@
 """Hybrid memory manager using PostgreSQL for persistence and SQLite for processing."""
 
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 import threading
+import time
 
 from .memory_graph import MemoryGraph
 from .memory_node import MemoryNode, ContextType
-from ..storage.postgres_backend import get_postgres_backend, PostgresMemoryBackend
+from ..storage.postgres_backend import get_postgres_backend, close_postgres_backend, PostgresMemoryBackend
+from ..storage.write_behind import WriteBehindQueue
+from ..config.memory_config import MEMORY_CONFIG
 from src.utils.logging.framework import SmartLogger
 from src.utils.datetime_utils import utc_now
 
@@ -26,6 +29,11 @@ class HybridMemoryManager:
         # PostgreSQL backend initialized on first use
         self._postgres_backend: Optional[PostgresMemoryBackend] = None
         
+        # Batched PostgreSQL writes, flushed off the caller's critical path
+        self.write_queue: Optional[WriteBehindQueue] = None
+        if MEMORY_CONFIG.WRITE_BEHIND_ENABLED:
+            self.write_queue = WriteBehindQueue(self.get_postgres_backend)
+        
         logger.info("hybrid_memory_manager_initialized")
     
     async def get_postgres_backend(self) -> PostgresMemoryBackend:
@@ -72,45 +80,80 @@ class HybridMemoryManager:
         # Mark as loaded
         setattr(memory, postgres_loaded_marker, True)
     
-    async def load_user_memories(self, user_id: str) -> None:
-        """Load user's persistent memories from PostgreSQL into SQLite."""
+    async def load_user_memories(self, user_id: str,
+                                 progress_callback: Optional[Callable[[Dict[str, int]], None]] = None) -> None:
+        """Load user's persistent memories from PostgreSQL into SQLite.
+        
+        Nodes and relationships are streamed with one cursor each and paged
+        into the graph batch by batch, so there is no per-node round-trip and
+        no cap on the number of nodes loaded.
+        
+        Args:
+            user_id: User whose memories to load
+            progress_callback: Optional callable receiving progress dicts
+                (phase, nodes_loaded, edges_loaded, total_nodes)
+        """
         postgres = await self.get_postgres_backend()
         memory = self.get_memory(user_id)
+        config = memory.config
+        started = time.monotonic()
         
-        # Get all user nodes from PostgreSQL
-        nodes = await postgres.get_nodes_by_user(user_id, limit=1000)
+        total_nodes = await postgres.count_nodes_by_user(user_id)
+        progress = {'phase': 'nodes', 'nodes_loaded': 0, 'edges_loaded': 0, 'total_nodes': total_nodes}
         
         logger.info("loading_user_memories_from_postgres",
                    user_id=user_id,
-                   node_count=len(nodes))
+                   node_count=total_nodes)
+        
+        # Page nodes into the graph as they stream in
+        async for batch in postgres.iter_nodes_by_user(user_id, config.HYDRATION_NODE_BATCH_SIZE):
+            for node in batch:
+                memory.node_manager.add_node(node)
+                memory.graph.add_node(node.node_id)
+            progress['nodes_loaded'] += len(batch)
+            self._report_load_progress(user_id, progress, progress_callback)
+        
+        # Relationships for the whole user in one query
+        progress['phase'] = 'edges'
+        nodes = memory.node_manager.nodes
+        async for batch in postgres.iter_relationships_by_user(user_id, config.HYDRATION_EDGE_BATCH_SIZE):
+            for rel in batch:
+                from_id, to_id = rel['from_node_id'], rel['to_node_id']
+                if from_id in nodes and to_id in nodes:
+                    memory.graph.add_edge(
+                        from_id, to_id,
+                        type=rel['type'],
+                        strength=rel['strength'],
+                        metadata=rel['metadata']
+                    )
+                    progress['edges_loaded'] += 1
+            self._report_load_progress(user_id, progress, progress_callback)
         
-        # Store nodes in memory graph for fast local access
-        node_id_map = {}
-        for node in nodes:
-            # Add node directly to the memory graph's node manager
-            memory.node_manager.add_node(node)
-            node_id_map[node.node_id] = node.node_id
+        # Graph was bulk-modified; recompute metrics from scratch on next use
+        memory.metrics.invalidate()
         
-        # Load relationships
-        for node in nodes:
-            relationships = await postgres.get_relationships(node.node_id, user_id)
-            for rel in relationships:
-                if rel['direction'] == 'out':
-                    from_id = node_id_map.get(node.node_id, node.node_id)
-                    to_id = node_id_map.get(rel['node_id'], rel['node_id'])
-                    
-                    # Add relationship to the graph
-                    if from_id in memory.node_manager.nodes and to_id in memory.node_manager.nodes:
-                        memory.graph.add_edge(
-                            from_id, to_id,
-                            type=rel['type'],
-                            strength=rel['strength'],
-                            metadata=rel.get('metadata', {})
-                        )
+        # Nodes stored without an embedding are encoded in one batch
+        await memory.node_manager.backfill_embeddings()
+        
+        progress['phase'] = 'complete'
+        self._report_load_progress(user_id, progress, progress_callback)
         
         logger.info("user_memories_loaded",
                    user_id=user_id,
-                   nodes_loaded=len(nodes))
+                   nodes_loaded=progress['nodes_loaded'],
+                   edges_loaded=progress['edges_loaded'],
+                   duration_ms=round((time.monotonic() - started) * 1000, 1))
+    
+    @staticmethod
+    def _report_load_progress(user_id: str, progress: Dict[str, int],
+                              progress_callback: Optional[Callable[[Dict[str, int]], None]]) -> None:
+        """Log hydration progress and forward it to the caller's callback."""
+        logger.debug("user_memories_load_progress", user_id=user_id, **progress)
+        if progress_callback:
+            try:
+                progress_callback(dict(progress))
+            except Exception as e:
+                logger.warning("load_progress_callback_failed", user_id=user_id, error=str(e))
     
     async def persist_to_postgres(self, user_id: str, node: MemoryNode) -> str:
         """Persist a memory node to PostgreSQL for long-term storage."""
@@ -130,7 +173,8 @@ class HybridMemoryManager:
                                     **kwargs) -> str:
         """
         Store memory that should persist across sessions.
-        Writes to both SQLite (for immediate access) and PostgreSQL (for persistence).
+        Writes to SQLite (for immediate access) and queues the PostgreSQL
+        write (for persistence) when write-behind is enabled.
         """
         # Store in SQLite first for immediate access
         memory = self.get_memory(user_id)
@@ -141,7 +185,10 @@ class HybridMemoryManager:
         if node:
             # Persist to PostgreSQL asynchronously
             try:
-                await self.persist_to_postgres(user_id, node)
+                if self.write_queue:
+                    await self.write_queue.enqueue_node(user_id, node)
+                else:
+                    await self.persist_to_postgres(user_id, node)
             except Exception as e:
                 logger.error("failed_to_persist_to_postgres",
                            error=str(e),
@@ -175,6 +222,7 @@ class HybridMemoryManager:
             'user_id': user_id,
             'sqlite_stats': sqlite_stats,
             'postgres_stats': pg_stats,
+            'write_queue': self.get_write_queue_metrics(),
             'combined_node_count': sqlite_stats.get('node_count', 0) + pg_stats.get('node_count', 0)
         }
     
@@ -213,7 +261,6 @@ class HybridMemoryManager:
                                  relationship_type: str, strength: float = 1.0) -> None:
         """Persist a relationship to PostgreSQL."""
         try:
-            postgres = await self.get_postgres_backend()
             from src.memory.core.memory_graph import RelationshipType
             
             # Validate relationship type
@@ -238,6 +285,14 @@ class HybridMemoryManager:
             else:
                 rel_type = relationship_type
             
+            if self.write_queue:
+                await self.write_queue.enqueue_relationship(
+                    user_id, from_node_id, to_node_id,
+                    rel_type, strength
+                )
+                return
+            
+            postgres = await self.get_postgres_backend()
             await postgres.store_relationship(
                 user_id, from_node_id, to_node_id,
                 rel_type, strength
@@ -255,6 +310,26 @@ class HybridMemoryManager:
                        user_id=user_id,
                        from_node=from_node_id,
                        to_node=to_node_id)
+    
+    async def flush_pending_writes(self) -> None:
+        """Write all queued persistent memories to PostgreSQL now."""
+        if self.write_queue:
+            await self.write_queue.flush()
+    
+    def get_write_queue_metrics(self) -> Dict:
+        """Get write-behind queue depth and lag metrics."""
+        if not self.write_queue:
+            return {'enabled': False}
+        return {'enabled': True, **self.write_queue.get_metrics()}
+    
+    async def close(self) -> None:
+        """Drain queued writes and close the PostgreSQL backend."""
+        if self.write_queue:
+            await self.write_queue.stop()
+        if self._postgres_backend is not None:
+            await close_postgres_backend()
+            self._postgres_backend = None
+        logger.info("hybrid_memory_manager_closed")
 
 
 # Global hybrid manager instance
@@ -273,4 +348,16 @@ async def ensure_user_memories(user_id: str) -> MemoryGraph:
     """Convenience function to ensure user memories are loaded and return the graph."""
     manager = get_hybrid_memory_manager()
     await manager.ensure_user_memories_loaded(user_id)
-    return manager.get_memory(user_id)
\ No newline at end of file
+    return manager.get_memory(user_id)
+
+
+async def shutdown_hybrid_memory_manager() -> None:
+    """Flush pending memory writes and release storage on process shutdown."""
+    global _global_hybrid_manager
+    if _global_hybrid_manager is not None:
+        try:
+            await _global_hybrid_manager.close()
+        except Exception as e:
+            logger.error("hybrid_memory_manager_shutdown_failed", error=str(e))
+        # A later get_hybrid_memory_manager() starts a fresh manager
+        _global_hybrid_manager = None
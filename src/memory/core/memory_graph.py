@@ -1,7 +1,7 @@
 """Graph-based conversational memory using component-based architecture."""
 
 import networkx as nx
-from datetime import timedelta
+from itertools import islice
 from typing import Dict, List, Set, Optional, Any, Tuple
 
 from .memory_node import MemoryNode, ContextType, create_memory_node
@@ -9,7 +9,7 @@ from src.utils.datetime_utils import utc_now, ensure_utc
 from ..components.node_manager import NodeManager
 from ..components.text_processor import TextProcessor
 from ..components.scoring_engine import ScoringEngine, QueryContext
-from ..algorithms.graph_algorithms import GraphAlgorithms
+from ..algorithms.incremental_metrics import IncrementalGraphMetrics
 from ..config.memory_config import MEMORY_CONFIG
 from src.utils.logging.framework import SmartLogger
 
@@ -47,9 +47,8 @@ class MemoryGraph:
         # Graph for relationships
         self.graph = nx.MultiDiGraph()
         
-        # Cache for graph metrics
-        self._metrics_cache = None
-        self._cache_timestamp = None
+        # Graph metrics (PageRank, centrality, communities), updated incrementally
+        self.metrics = IncrementalGraphMetrics(self.graph, self.config)
     
     def store(self, content: Any, 
              context_type: ContextType,
@@ -80,6 +79,7 @@ class MemoryGraph:
         
         # Add to graph
         self.graph.add_node(node_id)
+        self.metrics.node_added(node_id)
         
         # Add relationships
         if relates_to:
@@ -95,9 +95,6 @@ class MemoryGraph:
         # Update activity timestamp
         self.last_activity = utc_now()
         
-        # Invalidate cache
-        self._invalidate_cache()
-        
         logger.info("memory_node_stored",
                    thread_id=self.thread_id,
                    node_id=node_id,
@@ -164,6 +161,14 @@ class MemoryGraph:
                                               max_age_hours, required_tags, 
                                               excluded_tags)
         
+        # Semantic similarity for all candidates in one matrix-vector product
+        if query_embedding is not None:
+            candidates = self._shortlist_candidates(query_text, query_embedding,
+                                                    candidates, max_results)
+            context.semantic_scores = self.node_manager.embedding_index.similarities(
+                query_embedding, candidates
+            )
+        
         # Score and rank candidates
         scored_candidates = []
         for node_id in candidates:
@@ -236,7 +241,7 @@ class MemoryGraph:
         if from_node_id in self.node_manager.nodes and to_node_id in self.node_manager.nodes:
             self.graph.add_edge(from_node_id, to_node_id, 
                               type=relationship_type, weight=weight)
-            self._invalidate_cache()
+            self.metrics.edge_added(from_node_id, to_node_id, weight)
     
     def get_related_nodes(self, node_id: str, relationship_types: Optional[Set[str]] = None,
                          max_distance: int = 2) -> List[MemoryNode]:
@@ -310,12 +315,10 @@ class MemoryGraph:
         removed = self.node_manager.cleanup_stale_nodes(max_age_hours)
         
         # Also remove from graph
-        for node_id in list(self.graph.nodes()):
-            if node_id not in self.node_manager.nodes:
-                self.graph.remove_node(node_id)
-        
-        if removed > 0:
-            self._invalidate_cache()
+        removed_ids = [node_id for node_id in self.graph.nodes()
+                       if node_id not in self.node_manager.nodes]
+        self.graph.remove_nodes_from(removed_ids)
+        self.metrics.nodes_removed(removed_ids)
         
         return removed
     
@@ -328,6 +331,7 @@ class MemoryGraph:
             'graph_density': nx.density(self.graph) if self.graph.number_of_nodes() > 1 else 0,
             'thread_age_hours': (utc_now() - ensure_utc(self.created_at)).total_seconds() / 3600
         })
+        stats.update(self.metrics.get_statistics())
         return stats
     
     def get_all_nodes(self) -> List[MemoryNode]:
@@ -378,6 +382,27 @@ class MemoryGraph:
         
         return filtered_ids
     
+    def _shortlist_candidates(self, query_text: str, query_embedding,
+                              candidates: List[str], max_results: int) -> List[str]:
+        """Trim a large candidate set before per-node scoring.
+        
+        Keeps the semantic top-k (argpartition over the embedding matrix),
+        every keyword hit and the most recently stored nodes, so that the
+        Python-level scoring loop no longer scales with the whole graph.
+        """
+        limit = max_results * self.config.MAX_CANDIDATES_MULTIPLIER
+        if len(candidates) <= limit:
+            return candidates
+        
+        shortlist = {node_id for node_id, _ in
+                     self.node_manager.embedding_index.top_k(query_embedding, limit, candidates)}
+        if query_text:
+            shortlist.update(self.node_manager.search_by_text(query_text))
+        shortlist.update(islice(reversed(self.node_manager.nodes), max_results))
+        
+        candidate_set = set(candidates)
+        return [node_id for node_id in shortlist if node_id in candidate_set]
+    
     def _calculate_graph_distance_score(self, node_id: str) -> float:
         """Calculate score based on graph distance from recently accessed nodes."""
         recent_nodes = self.node_manager.get_recent_accessed()
@@ -405,32 +430,16 @@ class MemoryGraph:
         return total_score
     
     def _invalidate_cache(self):
-        """Invalidate cached metrics."""
-        self._metrics_cache = None
-        self._cache_timestamp = None
-    
-    def _update_metrics_cache(self):
-        """Update cached graph metrics if needed."""
-        if (self._metrics_cache is None or 
-            self._cache_timestamp is None or
-            (utc_now() - ensure_utc(self._cache_timestamp)) > timedelta(minutes=5)):
-            
-            self._metrics_cache = {
-                'pagerank': GraphAlgorithms.calculate_pagerank(self.graph) if self.graph.number_of_nodes() > 0 else {},
-                'centrality': GraphAlgorithms.calculate_betweenness_centrality(self.graph) if self.graph.number_of_nodes() > 0 else {},
-                'communities': GraphAlgorithms.detect_communities(self.graph) if self.graph.number_of_nodes() > 1 else []
-            }
-            self._cache_timestamp = utc_now()
+        """Force a full recompute of graph metrics on next access."""
+        self.metrics.invalidate()
     
     def find_important_memories(self, top_n: int = 10) -> List[MemoryNode]:
         """Find the most important memories using PageRank algorithm."""
-        self._update_metrics_cache()
-        
-        if not self._metrics_cache or 'pagerank' not in self._metrics_cache:
+        pagerank_scores = self.metrics.pagerank()
+        if not pagerank_scores:
             return []
         
         # Sort nodes by PageRank score
-        pagerank_scores = self._metrics_cache['pagerank']
         sorted_nodes = sorted(pagerank_scores.items(), key=lambda x: x[1], reverse=True)
         
         # Return top N nodes
@@ -444,22 +453,15 @@ class MemoryGraph:
     
     def find_memory_clusters(self) -> List[Set[str]]:
         """Find memory clusters using community detection."""
-        self._update_metrics_cache()
-        
-        if not self._metrics_cache or 'communities' not in self._metrics_cache:
-            return []
-        
-        return self._metrics_cache['communities']
+        return self.metrics.communities()
     
     def find_bridge_memories(self, top_n: int = 5) -> List[MemoryNode]:
         """Find bridge memories that connect different clusters."""
-        self._update_metrics_cache()
-        
-        if not self._metrics_cache or 'centrality' not in self._metrics_cache:
+        centrality_scores = self.metrics.centrality()
+        if not centrality_scores:
             return []
         
         # Sort nodes by betweenness centrality
-        centrality_scores = self._metrics_cache['centrality']
         sorted_nodes = sorted(centrality_scores.items(), key=lambda x: x[1], reverse=True)
         
         # Return top N nodes
@@ -34,7 +34,10 @@ class ConversationalMemoryManager:
             # Ensure user memories are loaded from PostgreSQL
             await self.hybrid_manager.ensure_user_memories_loaded(memory_key)
         
-        return self.hybrid_manager.get_memory(memory_key)
+        memory = self.hybrid_manager.get_memory(memory_key)
+        # Index embeddings of nodes stored since the last call before they are searched
+        await memory.node_manager.backfill_embeddings()
+        return memory
     
     async def store_memory(self, memory_key: str, content, context_type: ContextType,
                           persist: bool = True, **kwargs) -> str:
@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 from typing import Any, Dict, Set, List, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from src.utils.datetime_utils import utc_now, ensure_utc
 
@@ -136,10 +136,55 @@ class MemoryNode:
                 pass
         return self._embedding
     
+    @property
+    def cached_embedding(self):
+        """The embedding if already computed or restored; never encodes."""
+        return self._embedding
+    
+    def set_embedding(self, embedding):
+        """Set an embedding computed elsewhere (e.g. in a batch)."""
+        self._embedding = embedding
+    
+    def stored_view(self, content: Any, summary: Optional[str]) -> "MemoryNode":
+        """The node as a stored row with this content and summary will read.
+        
+        Used to embed merged entity rows. Returns the node itself when the
+        row embeds to the same text, so its cached embedding is reused.
+        """
+        view = replace(self, content=content, summary=summary or "")
+        if view.get_embedding_text() == self.get_embedding_text():
+            return self
+        return view
+    
     def clear_embedding(self):
         """Clear cached embedding (useful if content changes)."""
         self._embedding = None
     
+    def get_stored_embedding(self):
+        """Get (embedding bytes, model tag) for persistence, computing if needed."""
+        try:
+            from ..algorithms.semantic_embeddings import get_embeddings
+            embeddings = get_embeddings()
+            if embeddings.is_available():
+                return embeddings.serialize_embedding(self.embedding)
+        except Exception:
+            pass
+        return None, None
+    
+    def load_stored_embedding(self, blob, model_tag):
+        """Restore a persisted embedding if it matches the current model."""
+        if not blob:
+            return
+        try:
+            from ..algorithms.semantic_embeddings import get_embeddings
+            embeddings = get_embeddings()
+            if embeddings.is_available():
+                embedding = embeddings.deserialize_embedding(blob, model_tag)
+                if embedding is not None:
+                    self._embedding = embedding
+        except Exception:
+            pass
+    
     def to_dict(self) -> Dict:
         """Serialize to dictionary for storage."""
         return {
@@ -1,15 +1,17 @@
 """PostgreSQL backend for persistent user memory storage."""
 
+import asyncio
 import json
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Set, AsyncIterator, Tuple
 from contextlib import asynccontextmanager
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import asyncpg
 from asyncpg.pool import Pool
 
 from src.memory.core.memory_node import MemoryNode, ContextType
 from src.memory.core.memory_graph import RelationshipType
+from src.memory.algorithms.semantic_embeddings import get_embeddings
 from src.utils.logging.framework import SmartLogger
 from src.utils.datetime_utils import utc_now, datetime_to_iso_utc
 
@@ -65,6 +67,15 @@ class PostgresMemoryBackend:
                     with open('src/memory/storage/postgres_schema.sql', 'r') as f:
                         await conn.execute(f.read())
                     logger.info("postgres_schema_created")
+                else:
+                    # Columns added after the initial schema
+                    await conn.execute(
+                        """
+                        ALTER TABLE memory.nodes
+                            ADD COLUMN IF NOT EXISTS embedding BYTEA,
+                            ADD COLUMN IF NOT EXISTS embedding_model TEXT
+                        """
+                    )
         except Exception as e:
             logger.warning("postgres_schema_check_failed", error=str(e))
         
@@ -84,72 +95,76 @@ class PostgresMemoryBackend:
     
     async def store_node(self, node: MemoryNode, user_id: str) -> str:
         """Store a memory node with entity deduplication at user scope."""
-        async with self.acquire() as conn:
-            # Check for existing entity within user scope
-            entity_id = node.content.get("entity_id") if isinstance(node.content, dict) else None
-            entity_system = node.content.get("entity_system") if isinstance(node.content, dict) else None
-            
-            if entity_id and entity_system:
-                # Check for existing entity for this user
+        # Check for existing entity within user scope
+        entity_id = node.content.get("entity_id") if isinstance(node.content, dict) else None
+        entity_system = node.content.get("entity_system") if isinstance(node.content, dict) else None
+        
+        existing = None
+        if entity_id and entity_system:
+            async with self.acquire() as conn:
                 existing = await conn.fetchrow(
                     """
-                    SELECT node_id, content 
+                    SELECT node_id, content, summary
                     FROM memory.nodes 
                     WHERE user_id = $1 AND entity_id = $2 AND entity_system = $3
                     """,
                     user_id, entity_id, entity_system
                 )
-                
-                if existing:
-                    # Update existing entity
-                    existing_content = json.loads(existing['content'])
-                    
-                    logger.info("updating_user_entity",
-                               user_id=user_id,
-                               entity_id=entity_id,
-                               existing_keys=list(existing_content.get('entity_data', {}).keys()),
-                               new_keys=list(node.content.get('entity_data', {}).keys()))
-                    
-                    # Merge content
-                    if isinstance(node.content, dict) and isinstance(existing_content, dict):
-                        if 'entity_data' in existing_content and 'entity_data' in node.content:
-                            existing_content['entity_data'].update(node.content.get('entity_data', {}))
-                        else:
-                            existing_content.update(node.content)
-                        
-                        existing_content['last_updated'] = datetime_to_iso_utc(utc_now())
-                        existing_content['update_count'] = existing_content.get('update_count', 0) + 1
-                    
-                    # Update the node
-                    await conn.execute(
-                        """
-                        UPDATE memory.nodes SET
-                            content = $1,
-                            tags = $2,
-                            last_accessed = NOW(),
-                            access_count = access_count + 1
-                        WHERE node_id = $3
-                        """,
-                        json.dumps(existing_content),
-                        list(node.tags) if node.tags else [],
-                        existing['node_id']
-                    )
-                    
-                    logger.info("user_entity_updated",
-                               node_id=str(existing['node_id']),
-                               user_id=user_id,
-                               entity_id=entity_id)
-                    
-                    return str(existing['node_id'])
+        
+        if existing:
+            # Update existing entity
+            existing_content = json.loads(existing['content'])
             
-            # Insert new node
+            logger.info("updating_user_entity",
+                       user_id=user_id,
+                       entity_id=entity_id,
+                       existing_keys=list(existing_content.get('entity_data', {}).keys()),
+                       new_keys=list(node.content.get('entity_data', {}).keys()))
+            
+            # Merge content
+            existing_content = self._merge_entity_content(existing_content, node.content)
+            
+            # Embedding of the row as updated: merged content, stored summary, new tags
+            [(embedding, embedding_model)] = await self._stored_embeddings(
+                [node.stored_view(existing_content, existing['summary'])]
+            )
+            async with self.acquire() as conn:
+                await conn.execute(
+                    """
+                    UPDATE memory.nodes SET
+                        content = $1,
+                        tags = $2,
+                        last_accessed = NOW(),
+                        access_count = access_count + 1,
+                        embedding = COALESCE($4, embedding),
+                        embedding_model = COALESCE($5, embedding_model)
+                    WHERE node_id = $3
+                    """,
+                    json.dumps(existing_content),
+                    list(node.tags) if node.tags else [],
+                    existing['node_id'],
+                    embedding,
+                    embedding_model
+                )
+            
+            logger.info("user_entity_updated",
+                       node_id=str(existing['node_id']),
+                       user_id=user_id,
+                       entity_id=entity_id)
+            
+            return str(existing['node_id'])
+        
+        # Insert new node
+        [(embedding, embedding_model)] = await self._stored_embeddings([node])
+        async with self.acquire() as conn:
             node_id = await conn.fetchval(
                 """
                 INSERT INTO memory.nodes (
                     user_id, content, context_type, summary,
                     base_relevance, tags, metadata,
-                    entity_id, entity_type, entity_system
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+                    entity_id, entity_type, entity_system,
+                    embedding, embedding_model
+                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
                 RETURNING node_id
                 """,
                 user_id,
@@ -161,15 +176,205 @@ class PostgresMemoryBackend:
                 '{}',  # MemoryNode doesn't have metadata field
                 entity_id,
                 node.content.get("entity_type") if isinstance(node.content, dict) else None,
-                entity_system
+                entity_system,
+                embedding,
+                embedding_model
             )
+        
+        logger.info("memory_node_stored",
+                   node_id=str(node_id),
+                   user_id=user_id,
+                   context_type=node.context_type.value)
+        
+        return str(node_id)
+    
+    async def store_nodes_batch(self, user_id: str, nodes: List[MemoryNode]) -> Dict[str, str]:
+        """Store many nodes for a user in one transaction.
+        
+        Plain nodes are written with a single executemany using their own
+        node_id, so relationships referencing them resolve. Entity nodes are
+        deduplicated against the database with one lookup query and merged
+        exactly as store_node would. Missing embeddings are encoded in one
+        batch before the transaction opens.
+        
+        Returns:
+            Dict mapping each input node_id to the node_id stored in PostgreSQL
+        """
+        id_map: Dict[str, str] = {}
+        inserts = []  # (node, content, row uuid)
+        entity_groups: Dict[tuple, List[MemoryNode]] = {}
+        
+        for node in nodes:
+            content = node.content if isinstance(node.content, dict) else {}
+            entity_key = (content.get("entity_id"), content.get("entity_system"))
+            if entity_key[0] and entity_key[1]:
+                entity_groups.setdefault(entity_key, []).append(node)
+            else:
+                node_uuid = self._node_uuid(node)
+                inserts.append((node, node.content, node_uuid))
+                id_map[node.node_id] = str(node_uuid)
+        
+        existing = {}
+        if entity_groups:
+            keys = list(entity_groups)
+            async with self.acquire() as conn:
+                rows = await conn.fetch(
+                    """
+                    SELECT node_id, entity_id, entity_system, content, summary
+                    FROM memory.nodes
+                    WHERE user_id = $1
+                      AND (entity_id, entity_system) IN (
+                          SELECT * FROM unnest($2::text[], $3::text[])
+                      )
+                    """,
+                    user_id,
+                    [key[0] for key in keys],
+                    [key[1] for key in keys]
+                )
+            existing = {(row['entity_id'], row['entity_system']): row for row in rows}
+        
+        updates = []  # (stored view, content, row, merged node count)
+        for key, group in entity_groups.items():
+            latest = group[-1]
+            if key in existing:
+                row = existing[key]
+                content = json.loads(row['content'])
+                for node in group:
+                    content = self._merge_entity_content(content, node.content)
+                updates.append((latest.stored_view(content, row['summary']), content, row, len(group)))
+                target_id = str(row['node_id'])
+            else:
+                # In-batch duplicates merge into the first occurrence
+                content = dict(group[0].content)
+                for node in group[1:]:
+                    content = self._merge_entity_content(content, node.content)
+                node_uuid = self._node_uuid(latest)
+                inserts.append((latest, content, node_uuid))
+                target_id = str(node_uuid)
             
-            logger.info("memory_node_stored",
-                       node_id=str(node_id),
-                       user_id=user_id,
-                       context_type=node.context_type.value)
+            for node in group:
+                id_map[node.node_id] = target_id
+        
+        stored = await self._stored_embeddings(
+            [node.stored_view(content, node.summary) for node, content, _ in inserts] +
+            [view for view, _, _, _ in updates]
+        )
+        plain_rows = [
+            self._node_insert_row(node_uuid, node, user_id, content, embedding)
+            for (node, content, node_uuid), embedding in zip(inserts, stored)
+        ]
+        update_rows = [
+            (
+                json.dumps(content),
+                list(view.tags) if view.tags else [],
+                row['node_id'],
+                embedding,
+                embedding_model,
+                count
+            )
+            for (view, content, row, count), (embedding, embedding_model) in zip(updates, stored[len(inserts):])
+        ]
+        
+        async with self.acquire() as conn:
+            async with conn.transaction():
+                if plain_rows:
+                    await conn.executemany(
+                        """
+                        INSERT INTO memory.nodes (
+                            node_id, user_id, content, context_type, summary,
+                            base_relevance, tags, metadata,
+                            entity_id, entity_type, entity_system,
+                            embedding, embedding_model
+                        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13)
+                        ON CONFLICT (node_id) DO NOTHING
+                        """,
+                        plain_rows
+                    )
+                
+                if update_rows:
+                    await conn.executemany(
+                        """
+                        UPDATE memory.nodes SET
+                            content = $1,
+                            tags = $2,
+                            last_accessed = NOW(),
+                            access_count = access_count + $6,
+                            embedding = COALESCE($4, embedding),
+                            embedding_model = COALESCE($5, embedding_model)
+                        WHERE node_id = $3
+                        """,
+                        update_rows
+                    )
+        
+        logger.info("memory_nodes_batch_stored",
+                   user_id=user_id,
+                   inserted=len(plain_rows),
+                   merged=len(update_rows),
+                   total=len(nodes))
+        
+        return id_map
+    
+    @staticmethod
+    def _node_uuid(node: MemoryNode) -> UUID:
+        """The node's own id as a UUID, or a new one if it is not a UUID."""
+        try:
+            return UUID(node.node_id)
+        except (ValueError, TypeError, AttributeError):
+            return uuid4()
+    
+    @staticmethod
+    def _node_insert_row(node_uuid: UUID, node: MemoryNode, user_id: str, content: Any,
+                         stored_embedding: Tuple[Optional[bytes], Optional[str]]) -> tuple:
+        """Build the positional parameters for a batched node INSERT."""
+        entity_fields = content if isinstance(content, dict) else {}
+        embedding, embedding_model = stored_embedding
+        return (
+            node_uuid,
+            user_id,
+            json.dumps(content),
+            node.context_type.value,
+            node.summary,
+            node.base_relevance,
+            list(node.tags) if node.tags else [],
+            '{}',
+            entity_fields.get("entity_id"),
+            entity_fields.get("entity_type"),
+            entity_fields.get("entity_system"),
+            embedding,
+            embedding_model
+        )
+    
+    @staticmethod
+    async def _stored_embeddings(nodes: List[MemoryNode]) -> List[Tuple[Optional[bytes], Optional[str]]]:
+        """(embedding bytes, model tag) per node for persistence.
+        
+        Embeddings not computed yet are encoded in one batch in an executor,
+        so neither the event loop nor an open transaction waits on the model.
+        """
+        embeddings = get_embeddings()
+        if not embeddings.is_available():
+            return [(None, None)] * len(nodes)
+        
+        missing = [node for node in nodes if node.cached_embedding is None]
+        if missing:
+            texts = [node.get_embedding_text() for node in missing]
+            vectors = await asyncio.get_running_loop().run_in_executor(None, embeddings.encode_texts, texts)
+            for node, vector in zip(missing, vectors):
+                node.set_embedding(vector)
+        return [embeddings.serialize_embedding(node.cached_embedding) for node in nodes]
+    
+    @staticmethod
+    def _merge_entity_content(existing_content: Any, new_content: Any) -> Any:
+        """Merge new entity content into existing content (entity_data is deep-merged)."""
+        if isinstance(new_content, dict) and isinstance(existing_content, dict):
+            if 'entity_data' in existing_content and 'entity_data' in new_content:
+                existing_content['entity_data'].update(new_content.get('entity_data', {}))
+            else:
+                existing_content.update(new_content)
             
-            return str(node_id)
+            existing_content['last_updated'] = datetime_to_iso_utc(utc_now())
+            existing_content['update_count'] = existing_content.get('update_count', 0) + 1
+        return existing_content
     
     async def get_node(self, node_id: str, user_id: str) -> Optional[MemoryNode]:
         """Get a specific node by ID within user scope."""
@@ -208,6 +413,65 @@ class PostgresMemoryBackend:
             rows = await conn.fetch(query, *params)
             return [self._row_to_memory_node(row) for row in rows]
     
+    async def count_nodes_by_user(self, user_id: str) -> int:
+        """Count all nodes for a user."""
+        async with self.acquire() as conn:
+            return await conn.fetchval(
+                "SELECT COUNT(*) FROM memory.nodes WHERE user_id = $1",
+                user_id
+            )
+    
+    async def iter_nodes_by_user(self, user_id: str,
+                                 batch_size: int = 500) -> AsyncIterator[List[MemoryNode]]:
+        """Stream all nodes for a user in batches using a server-side cursor.
+        
+        Unlike get_nodes_by_user this has no row cap and never materializes
+        the full result set; each batch is yielded as soon as it arrives.
+        """
+        async with self.acquire() as conn:
+            async with conn.transaction():
+                batch = []
+                async for row in conn.cursor(
+                    "SELECT * FROM memory.nodes WHERE user_id = $1 ORDER BY created_at DESC",
+                    user_id,
+                    prefetch=batch_size
+                ):
+                    batch.append(self._row_to_memory_node(row))
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+                if batch:
+                    yield batch
+    
+    async def iter_relationships_by_user(self, user_id: str,
+                                         batch_size: int = 1000) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream all relationships for a user in batches (one query, no N+1)."""
+        async with self.acquire() as conn:
+            async with conn.transaction():
+                batch = []
+                async for row in conn.cursor(
+                    """
+                    SELECT from_node_id, to_node_id, relationship_type as type,
+                           strength, metadata
+                    FROM memory.relationships
+                    WHERE user_id = $1
+                    """,
+                    user_id,
+                    prefetch=batch_size
+                ):
+                    batch.append({
+                        'from_node_id': str(row['from_node_id']),
+                        'to_node_id': str(row['to_node_id']),
+                        'type': row['type'],
+                        'strength': row['strength'],
+                        'metadata': json.loads(row['metadata']) if row['metadata'] else {}
+                    })
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+                if batch:
+                    yield batch
+    
     async def store_relationship(self,
                                user_id: str,
                                from_node_id: str,
@@ -234,6 +498,42 @@ class PostgresMemoryBackend:
                 json.dumps(metadata) if metadata else '{}'
             )
     
+    async def store_relationships_batch(self, user_id: str,
+                                        relationships: List[Dict[str, Any]]) -> None:
+        """Store many relationships for a user with a single executemany.
+        
+        Each relationship dict has from_node_id, to_node_id, relationship_type,
+        strength and optional metadata.
+        """
+        rows = [
+            (
+                user_id,
+                UUID(rel['from_node_id']),
+                UUID(rel['to_node_id']),
+                getattr(rel['relationship_type'], 'value', rel['relationship_type']),
+                rel.get('strength', 1.0),
+                json.dumps(rel['metadata']) if rel.get('metadata') else '{}'
+            )
+            for rel in relationships
+        ]
+        
+        async with self.acquire() as conn:
+            await conn.executemany(
+                """
+                INSERT INTO memory.relationships (
+                    user_id, from_node_id, to_node_id,
+                    relationship_type, strength, metadata
+                ) VALUES ($1, $2, $3, $4, $5, $6)
+                ON CONFLICT (user_id, from_node_id, to_node_id, relationship_type)
+                DO UPDATE SET strength = EXCLUDED.strength, metadata = EXCLUDED.metadata
+                """,
+                rows
+            )
+        
+        logger.info("memory_relationships_batch_stored",
+                   user_id=user_id,
+                   count=len(rows))
+    
     async def get_relationships(self, node_id: str, user_id: str) -> List[Dict[str, Any]]:
         """Get all relationships for a node within user scope."""
         async with self.acquire() as conn:
@@ -391,6 +691,10 @@ class PostgresMemoryBackend:
         )
         # Set access count separately as it's not in constructor
         node.access_count = row['access_count']
+        
+        # Restore persisted embedding so it isn't recomputed
+        if 'embedding' in row.keys():
+            node.load_stored_embedding(row['embedding'], row['embedding_model'])
         return node
 
 
@@ -28,6 +28,10 @@ CREATE TABLE IF NOT EXISTS memory.nodes (
     entity_type TEXT,
     entity_system TEXT,
     
+    -- Semantic embedding (float32 bytes) and the model/version that produced it
+    embedding BYTEA,
+    embedding_model TEXT,
+    
     -- Ensure entity uniqueness per user
     CONSTRAINT unique_user_entity UNIQUE (user_id, entity_id, entity_system),
     
@@ -146,5 +150,7 @@ COMMENT ON TABLE memory.nodes IS 'Stores memory nodes for each user with full co
 COMMENT ON TABLE memory.relationships IS 'Stores directed relationships between memory nodes';
 COMMENT ON TABLE memory.user_metadata IS 'Tracks user-level memory statistics and metadata';
 COMMENT ON COLUMN memory.nodes.context_type IS 'Type of memory node: entity, action, search_result, or plan';
+COMMENT ON COLUMN memory.nodes.embedding IS 'Sentence-transformer embedding as little-endian float32 bytes';
+COMMENT ON COLUMN memory.nodes.embedding_model IS 'Model name/version tag; embeddings with a stale tag are recomputed';
 COMMENT ON COLUMN memory.nodes.entity_id IS 'External system ID for deduplication (e.g., Salesforce ID, Jira key)';
 COMMENT ON COLUMN memory.relationships.relationship_type IS 'Type of relationship: led_to, relates_to, depends_on, produces, belongs_to';
\ No newline at end of file
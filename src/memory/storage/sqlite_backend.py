@@ -45,63 +45,79 @@ class SQLiteMemoryBackend:
             self._local.conn.commit()
     
     def store_node(self, node: MemoryNode, thread_id: str) -> str:
-        """Store a memory node, handling entity deduplication."""
-        with self._lock:
-            with self._get_connection() as conn:
-                # Check if this is an entity that already exists
-                entity_id = node.content.get("entity_id") if isinstance(node.content, dict) else None
-                entity_system = node.content.get("entity_system") if isinstance(node.content, dict) else None
-                
-                if entity_id and entity_system:
-                    # Check for existing entity
+        """Store a memory node, handling entity deduplication.
+        
+        Embeddings are computed before the write, outside the lock, and for
+        merged entities from the merged row.
+        """
+        # Check if this is an entity that already exists
+        entity_id = node.content.get("entity_id") if isinstance(node.content, dict) else None
+        entity_system = node.content.get("entity_system") if isinstance(node.content, dict) else None
+        
+        existing = None
+        if entity_id and entity_system:
+            with self._lock:
+                with self._get_connection() as conn:
                     existing = conn.execute(
-                        "SELECT node_id, content FROM memory_nodes WHERE entity_id = ? AND entity_system = ?",
+                        "SELECT node_id, content, summary FROM memory_nodes WHERE entity_id = ? AND entity_system = ?",
                         (entity_id, entity_system)
                     ).fetchone()
-                    
-                    if existing:
-                        # Update existing entity
-                        existing_content = json.loads(existing['content'])
-                        
-                        logger.info("updating_entity_data",
-                                   entity_id=entity_id,
-                                   existing_keys=list(existing_content.get('entity_data', {}).keys()),
-                                   new_keys=list(node.content.get('entity_data', {}).keys()))
-                        
-                        # Merge content
-                        if isinstance(node.content, dict) and isinstance(existing_content, dict):
-                            # Deep merge entity data
-                            if 'entity_data' in existing_content and 'entity_data' in node.content:
-                                existing_content['entity_data'].update(node.content.get('entity_data', {}))
-                            else:
-                                existing_content.update(node.content)
-                            
-                            # Update metadata
-                            existing_content['last_updated'] = datetime_to_iso_utc(utc_now())
-                            existing_content['update_count'] = existing_content.get('update_count', 0) + 1
-                            
-                            # Update the node
-                            conn.execute("""
-                                UPDATE memory_nodes SET
-                                    content = ?,
-                                    last_accessed = ?,
-                                    access_count = access_count + 1,
-                                    tags = ?
-                                WHERE node_id = ?
-                            """, (
-                                json.dumps(existing_content),
-                                datetime_to_iso_utc(utc_now()),
-                                json.dumps(list(node.tags)) if node.tags else "[]",
-                                existing['node_id']
-                            ))
-                            
-                            logger.info("entity_updated",
-                                       node_id=existing['node_id'],
-                                       entity_id=entity_id,
-                                       entity_system=entity_system)
-                            
-                            return existing['node_id']
+        
+        if existing:
+            # Update existing entity
+            existing_content = json.loads(existing['content'])
+            
+            logger.info("updating_entity_data",
+                       entity_id=entity_id,
+                       existing_keys=list(existing_content.get('entity_data', {}).keys()),
+                       new_keys=list(node.content.get('entity_data', {}).keys()))
+            
+            # Merge content
+            if isinstance(node.content, dict) and isinstance(existing_content, dict):
+                # Deep merge entity data
+                if 'entity_data' in existing_content and 'entity_data' in node.content:
+                    existing_content['entity_data'].update(node.content.get('entity_data', {}))
+                else:
+                    existing_content.update(node.content)
                 
+                # Update metadata
+                existing_content['last_updated'] = datetime_to_iso_utc(utc_now())
+                existing_content['update_count'] = existing_content.get('update_count', 0) + 1
+                
+                # The embedding follows the merged row, as it will read after the write
+                embedding, embedding_model = node.stored_view(existing_content, existing['summary']).get_stored_embedding()
+                with self._lock:
+                    with self._get_connection() as conn:
+                        conn.execute("""
+                            UPDATE memory_nodes SET
+                                content = ?,
+                                last_accessed = ?,
+                                access_count = access_count + 1,
+                                tags = ?,
+                                embedding = COALESCE(?, embedding),
+                                embedding_model = COALESCE(?, embedding_model)
+                            WHERE node_id = ?
+                        """, (
+                            json.dumps(existing_content),
+                            datetime_to_iso_utc(utc_now()),
+                            json.dumps(list(node.tags)) if node.tags else "[]",
+                            embedding,
+                            embedding_model,
+                            existing['node_id']
+                        ))
+                
+                logger.info("entity_updated",
+                           node_id=existing['node_id'],
+                           entity_id=entity_id,
+                           entity_system=entity_system)
+                
+                return existing['node_id']
+        
+        entity_type = node.content.get("entity_type") if isinstance(node.content, dict) else None
+        embedding, embedding_model = node.get_stored_embedding()
+        
+        with self._lock:
+            with self._get_connection() as conn:
                 # Check if node already exists by node_id
                 existing_by_id = conn.execute(
                     "SELECT node_id FROM memory_nodes WHERE node_id = ?",
@@ -114,14 +130,13 @@ class SQLiteMemoryBackend:
                     return existing_by_id['node_id']
                 
                 # Store new node
-                entity_type = node.content.get("entity_type") if isinstance(node.content, dict) else None
-                
                 conn.execute("""
                     INSERT INTO memory_nodes (
                         node_id, thread_id, content, context_type, summary,
                         created_at, last_accessed, access_count, base_relevance,
-                        tags, metadata, entity_id, entity_type, entity_system
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        tags, metadata, entity_id, entity_type, entity_system,
+                        embedding, embedding_model
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """, (
                     node.node_id,
                     thread_id,
@@ -136,7 +151,9 @@ class SQLiteMemoryBackend:
                     json.dumps(getattr(node, 'metadata', {})) if hasattr(node, 'metadata') else "{}",
                     entity_id,
                     entity_type,
-                    entity_system
+                    entity_system,
+                    embedding,
+                    embedding_model
                 ))
                 
                 logger.info("node_stored",
@@ -395,6 +412,10 @@ class SQLiteMemoryBackend:
         if hasattr(node, 'metadata') and metadata:
             node.metadata = metadata
         
+        # Restore persisted embedding so it isn't recomputed
+        if 'embedding' in row.keys():
+            node.load_stored_embedding(row['embedding'], row['embedding_model'])
+        
         return node
     
     def get_statistics(self) -> Dict[str, Any]:
@@ -20,6 +20,10 @@ CREATE TABLE IF NOT EXISTS memory_nodes (
     entity_type TEXT,  -- e.g., Account, Contact, Issue
     entity_system TEXT,  -- e.g., salesforce, jira, servicenow
     
+    -- Semantic embedding (float32 bytes) and the model/version that produced it
+    embedding BLOB,
+    embedding_model TEXT,
+    
     -- Prevent duplicate entities
     UNIQUE(entity_id, entity_system)
 );
@@ -92,11 +96,25 @@ AFTER DELETE ON memory_nodes BEGIN
 END;
 """
 
+# Columns added after the initial schema: (table, column, type)
+SCHEMA_MIGRATIONS = [
+    ("memory_nodes", "embedding", "BLOB"),
+    ("memory_nodes", "embedding_model", "TEXT"),
+]
+
+
 def init_database(db_path: str):
     """Initialize the database with the schema."""
     import sqlite3
     
     conn = sqlite3.connect(db_path)
     conn.executescript(MEMORY_SCHEMA)
+    
+    # Add columns missing from databases created with an older schema
+    for table, column, column_type in SCHEMA_MIGRATIONS:
+        existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if column not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+    
     conn.commit()
     conn.close()
\ No newline at end of file
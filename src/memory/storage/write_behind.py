@@ -0,0 +1,319 @@
+"""Write-behind queue for persistent memory writes.
+
+Tool nodes store a memory node (and several entity nodes and relationships)
+per tool result. Awaiting a PostgreSQL round-trip for each of those puts
+storage latency on the tool's critical path. The queue accepts writes
+immediately, coalesces repeated writes to the same node or relationship,
+and flushes them in batches when either the batch size or the flush
+interval is reached. Shutdown drains the queue.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config.memory_config import MEMORY_CONFIG
+from ..core.memory_node import MemoryNode
+from src.utils.logging.framework import SmartLogger
+
+logger = SmartLogger("memory.write_behind")
+
+
+class _PendingWrite:
+    """A queued write with its first enqueue time and retry count."""
+
+    __slots__ = ('payload', 'enqueued_at', 'attempts')
+
+    def __init__(self, payload: Any):
+        self.payload = payload
+        self.enqueued_at = time.monotonic()
+        self.attempts = 0
+
+
+class WriteBehindQueue:
+    """Coalescing, batching write-behind queue in front of PostgresMemoryBackend."""
+
+    def __init__(self, backend_factory, config=None):
+        """Initialize the queue.
+
+        Args:
+            backend_factory: Async callable returning the PostgresMemoryBackend
+            config: Memory configuration (defaults to MEMORY_CONFIG)
+        """
+        self.config = config or MEMORY_CONFIG
+        self._backend_factory = backend_factory
+        self.batch_size = self.config.WRITE_BEHIND_BATCH_SIZE
+        self.flush_interval = self.config.WRITE_BEHIND_FLUSH_INTERVAL
+        self.max_retries = self.config.WRITE_BEHIND_MAX_RETRIES
+        self.max_queue_size = self.config.WRITE_BEHIND_MAX_QUEUE_SIZE
+
+        # Keyed so a later write to the same node/edge replaces the earlier one
+        self._nodes: "OrderedDict[Tuple[str, str], _PendingWrite]" = OrderedDict()
+        self._relationships: "OrderedDict[Tuple[str, str, str, str], _PendingWrite]" = OrderedDict()
+
+        # In-memory node_id -> PostgreSQL node_id for entity nodes merged into
+        # existing rows, so later relationships point at the stored row
+        self._id_map: "OrderedDict[str, str]" = OrderedDict()
+
+        self._running = False
+        self._flush_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+
+        # Metrics
+        self.nodes_flushed = 0
+        self.relationships_flushed = 0
+        self.coalesced_writes = 0
+        self.failed_flushes = 0
+        self.dropped_writes = 0
+        self.last_flush_duration_ms = 0.0
+
+    @property
+    def depth(self) -> int:
+        """Number of writes waiting to be flushed."""
+        return len(self._nodes) + len(self._relationships)
+
+    async def start(self):
+        """Start the background flush task on the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._running and self._loop is loop and self._flush_task and not self._flush_task.done():
+            return
+
+        # Primitives are bound to the loop that first uses them
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._running = True
+        self._flush_task = loop.create_task(self._periodic_flush())
+        logger.info("write_behind_queue_started",
+                   batch_size=self.batch_size,
+                   flush_interval=self.flush_interval)
+
+    async def stop(self):
+        """Flush everything still queued and stop the background task."""
+        self._running = False
+
+        if self._flush_task:
+            if self._wakeup:
+                self._wakeup.set()
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except (asyncio.CancelledError, RuntimeError):
+                # RuntimeError: task belongs to a loop that has since closed
+                pass
+            self._flush_task = None
+
+        # Retries are bounded, so this terminates even if the database is down
+        while self.depth:
+            await self.flush()
+
+        logger.info("write_behind_queue_stopped",
+                   nodes_flushed=self.nodes_flushed,
+                   relationships_flushed=self.relationships_flushed,
+                   dropped_writes=self.dropped_writes)
+
+    async def enqueue_node(self, user_id: str, node: MemoryNode):
+        """Queue a node for persistence."""
+        key = (user_id, node.node_id)
+        pending = self._nodes.get(key)
+        if pending:
+            pending.payload = node
+            self.coalesced_writes += 1
+        else:
+            self._nodes[key] = _PendingWrite(node)
+        await self._after_enqueue()
+
+    async def enqueue_relationship(self, user_id: str, from_node_id: str, to_node_id: str,
+                                   relationship_type: Any, strength: float = 1.0,
+                                   metadata: Optional[Dict[str, Any]] = None):
+        """Queue a relationship for persistence."""
+        rel_type = getattr(relationship_type, 'value', relationship_type)
+        key = (user_id, from_node_id, to_node_id, rel_type)
+        payload = {
+            'from_node_id': from_node_id,
+            'to_node_id': to_node_id,
+            'relationship_type': rel_type,
+            'strength': strength,
+            'metadata': metadata
+        }
+        pending = self._relationships.get(key)
+        if pending:
+            pending.payload = payload
+            self.coalesced_writes += 1
+        else:
+            self._relationships[key] = _PendingWrite(payload)
+        await self._after_enqueue()
+
+    async def flush(self):
+        """Write all currently queued items to PostgreSQL."""
+        if not self.depth:
+            return
+
+        if self._flush_lock is None or self._loop is not asyncio.get_running_loop():
+            self._flush_lock = asyncio.Lock()
+
+        async with self._flush_lock:
+            nodes, self._nodes = self._nodes, OrderedDict()
+            relationships, self._relationships = self._relationships, OrderedDict()
+            if not nodes and not relationships:
+                return
+
+            started = time.monotonic()
+            backend = await self._backend_factory()
+
+            # Nodes first so relationships can reference them
+            for user_id, items in self._group_by_user(nodes).items():
+                await self._flush_nodes(backend, user_id, items)
+            for user_id, items in self._group_by_user(relationships).items():
+                await self._flush_relationships(backend, user_id, items)
+
+            self.last_flush_duration_ms = round((time.monotonic() - started) * 1000, 1)
+            logger.debug("write_behind_flushed",
+                        nodes=len(nodes),
+                        relationships=len(relationships),
+                        duration_ms=self.last_flush_duration_ms,
+                        remaining=self.depth)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Queue depth, lag and throughput metrics."""
+        oldest = min(
+            (pending.enqueued_at for queue in (self._nodes, self._relationships)
+             for pending in queue.values()),
+            default=None
+        )
+        return {
+            'queue_depth': self.depth,
+            'pending_nodes': len(self._nodes),
+            'pending_relationships': len(self._relationships),
+            'lag_ms': round((time.monotonic() - oldest) * 1000, 1) if oldest is not None else 0.0,
+            'last_flush_duration_ms': self.last_flush_duration_ms,
+            'nodes_flushed': self.nodes_flushed,
+            'relationships_flushed': self.relationships_flushed,
+            'coalesced_writes': self.coalesced_writes,
+            'failed_flushes': self.failed_flushes,
+            'dropped_writes': self.dropped_writes
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    async def _after_enqueue(self):
+        """Start the flusher if needed and apply size thresholds."""
+        if not self._running or self._loop is not asyncio.get_running_loop():
+            await self.start()
+
+        if self.depth >= self.max_queue_size:
+            # Backpressure: the caller waits for the queue to drain
+            logger.warning("write_behind_queue_full", queue_depth=self.depth)
+            await self.flush()
+        elif self.depth >= self.batch_size:
+            self._wakeup.set()
+
+    async def _periodic_flush(self):
+        """Flush when the batch size is reached or the interval elapses."""
+        while self._running:
+            try:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("write_behind_flush_error", error=str(e))
+
+    async def _flush_nodes(self, backend, user_id: str, items: List[Tuple[tuple, _PendingWrite]]):
+        try:
+            id_map = await backend.store_nodes_batch(user_id, [p.payload for _, p in items])
+        except Exception as e:
+            self.failed_flushes += 1
+            logger.warning("write_behind_node_batch_failed",
+                          user_id=user_id,
+                          count=len(items),
+                          error=str(e))
+            await self._retry_or_isolate(items, self._nodes, self._store_node_individually,
+                                         backend, user_id)
+            return
+
+        for node_id, pg_node_id in id_map.items():
+            self._remember_id(node_id, pg_node_id)
+        self.nodes_flushed += len(items)
+
+    async def _flush_relationships(self, backend, user_id: str, items: List[Tuple[tuple, _PendingWrite]]):
+        payloads = [self._resolve_relationship(p.payload) for _, p in items]
+        try:
+            await backend.store_relationships_batch(user_id, payloads)
+        except Exception as e:
+            self.failed_flushes += 1
+            logger.warning("write_behind_relationship_batch_failed",
+                          user_id=user_id,
+                          count=len(items),
+                          error=str(e))
+            await self._retry_or_isolate(items, self._relationships, self._store_relationship_individually,
+                                         backend, user_id)
+            return
+
+        self.relationships_flushed += len(items)
+
+    async def _retry_or_isolate(self, items, queue: OrderedDict, store_one, backend, user_id: str):
+        """Requeue a failed batch, or write it item by item once retries run out.
+
+        Item-by-item writes isolate the rows that cannot be stored (e.g. a
+        constraint violation) so they do not block the rest of the batch.
+        """
+        exhausted = []
+        for key, pending in items:
+            pending.attempts += 1
+            if pending.attempts < self.max_retries:
+                # A newer write for the same key supersedes the failed one
+                queue.setdefault(key, pending)
+            else:
+                exhausted.append(pending)
+
+        for pending in exhausted:
+            try:
+                await store_one(backend, user_id, pending.payload)
+            except Exception as e:
+                self.dropped_writes += 1
+                logger.error("write_behind_write_dropped",
+                           user_id=user_id,
+                           attempts=pending.attempts,
+                           error=str(e))
+
+    async def _store_node_individually(self, backend, user_id: str, node: MemoryNode):
+        id_map = await backend.store_nodes_batch(user_id, [node])
+        for node_id, pg_node_id in id_map.items():
+            self._remember_id(node_id, pg_node_id)
+        self.nodes_flushed += 1
+
+    async def _store_relationship_individually(self, backend, user_id: str, payload: Dict[str, Any]):
+        await backend.store_relationships_batch(user_id, [self._resolve_relationship(payload)])
+        self.relationships_flushed += 1
+
+    def _resolve_relationship(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Point relationship endpoints at the stored PostgreSQL node IDs."""
+        resolved = dict(payload)
+        resolved['from_node_id'] = self._id_map.get(payload['from_node_id'], payload['from_node_id'])
+        resolved['to_node_id'] = self._id_map.get(payload['to_node_id'], payload['to_node_id'])
+        return resolved
+
+    def _remember_id(self, node_id: str, pg_node_id: str):
+        if node_id == pg_node_id:
+            return
+        self._id_map[node_id] = pg_node_id
+        self._id_map.move_to_end(node_id)
+        while len(self._id_map) > self.config.WRITE_BEHIND_ID_MAP_SIZE:
+            self._id_map.popitem(last=False)
+
+    @staticmethod
+    def _group_by_user(queue: OrderedDict) -> Dict[str, List[Tuple[tuple, _PendingWrite]]]:
+        groups: Dict[str, List[Tuple[tuple, _PendingWrite]]] = {}
+        for key, pending in queue.items():
+            groups.setdefault(key[0], []).append((key, pending))
+        return groups
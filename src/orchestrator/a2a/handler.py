@@ -8,7 +8,8 @@ import asyncio
 from src.utils.logging.framework import SmartLogger, log_execution
 from src.utils.thread_validation import ThreadValidator
 from src.orchestrator.core.thread_context import set_thread_context, clear_thread_context
-from langchain_core.messages import HumanMessage, AIMessage, ToolMessage
+from langchain_core.messages import HumanMessage, AIMessage, ToolMessage, RemoveMessage
+from src.utils.agents.message_processing import ConversationHistory
 from src.orchestrator.observers.direct_call_events import (
     emit_direct_response_event
 )
@@ -23,16 +24,17 @@ class OrchestratorA2AHandler:
         """Initialize the A2A handler."""
         self.active_tasks = {}
         self._graph = None
+        self._llm = None
         self._checkpointer = None
+        self._history = ConversationHistory()
         self._initialize_checkpointer()
     
     def _initialize_checkpointer(self):
         """Initialize the checkpointer for interrupt support."""
-        # Use MemorySaver for in-memory checkpointing
-        from langgraph.checkpoint.memory import MemorySaver
-        self._checkpointer = MemorySaver()
+        from src.utils.storage.checkpointer import get_checkpointer
+        self._checkpointer = get_checkpointer("orchestrator")
         logger.info("checkpointer_initialized",
-                   type="MemorySaver")
+                   type=type(self._checkpointer).__name__)
     
     async def _ensure_graph_initialized(self) -> Any:
         """Ensure the orchestrator graph is initialized (thread-safe)."""
@@ -140,6 +142,7 @@ ORCHESTRATOR TOOLS:
                     
                     # Store tools reference
                     self._graph._tools = tools
+                    self._llm = llm
                     
                     logger.info("orchestrator_graph_initialized",
                                has_checkpointer=self._checkpointer is not None)
@@ -212,7 +215,7 @@ ORCHESTRATOR TOOLS:
             existing_state = None
             pending_tool_call_id = None
             try:
-                existing_state = graph.get_state(config)
+                existing_state = await graph.aget_state(config)
                 if existing_state and existing_state.values:
                     logger.info("loaded_existing_state",
                                thread_id=thread_id,
@@ -260,6 +263,11 @@ ORCHESTRATOR TOOLS:
                 # Start fresh conversation
                 messages = [HumanMessage(content=instruction)]
             
+            # Fold turns past the token budget into the thread's summary
+            summary = existing_state.values.get("summary") if existing_state and existing_state.values else None
+            evicted, new_summary = await self._history.compact(messages, summary, self._llm)
+            messages = [RemoveMessage(id=msg.id) for msg in messages[:evicted]] + messages[evicted:]
+            
             # Prepare input for graph - using new state schema
             graph_input = {
                 "messages": messages,
@@ -270,6 +278,8 @@ ORCHESTRATOR TOOLS:
                 "plan_execute_task": "",
                 "plan_execute_context": ""
             }
+            if new_summary != summary:
+                graph_input["summary"] = new_summary
             
             logger.info("invoking_graph",
                        thread_id=thread_id,
@@ -348,7 +358,7 @@ ORCHESTRATOR TOOLS:
             # Alternative: check graph state for pending interrupts
             if not interrupt_detected:
                 try:
-                    final_state = graph.get_state(config)
+                    final_state = await graph.aget_state(config)
                     if final_state and hasattr(final_state, 'next') and final_state.next:
                         logger.info("pending_interrupt_in_state",
                                    thread_id=thread_id,
@@ -779,28 +789,10 @@ ORCHESTRATOR TOOLS:
                        event_count=len(events),
                        batch_id=batch_id)
             
-            # Get SSE observer
-            from src.orchestrator.observers import get_observer_registry
-            registry = get_observer_registry()
-            sse_observer = registry.get_observer("SSEObserver")
-            
-            if sse_observer:
-                # Forward each event to SSE clients
-                for event in events:
-                    # Ensure event has proper structure
-                    if "event" in event and "data" in event:
-                        # Add agent context if not present
-                        if "agent_name" not in event["data"]:
-                            event["data"]["agent_name"] = agent_name
-                        
-                        sse_observer.notify(event)
-                    else:
-                        logger.warning("malformed_forwarded_event",
-                                     agent_name=agent_name,
-                                     event=event)
-            else:
-                logger.warning("sse_observer_not_found",
-                             agent_name=agent_name)
+            # Forward each event to SSE clients
+            from src.orchestrator.observers.direct_call_events import relay_agent_event
+            for event in events:
+                relay_agent_event(event, agent_name)
             
             return {
                 "success": True,
@@ -4,16 +4,11 @@ from typing import Annotated, Dict, Any, List, Literal
 from typing_extensions import TypedDict
 from langgraph.graph import StateGraph, END
 from langgraph.graph.message import add_messages
-from langgraph.checkpoint.memory import MemorySaver
 from langgraph.prebuilt import tools_condition
 from langchain_core.messages import HumanMessage
 from langchain_core.runnables import RunnableConfig
 from src.utils.logging.framework import SmartLogger, log_execution
-import asyncio
-import nest_asyncio
-
-# Allow nested event loops for sync/async compatibility
-nest_asyncio.apply()
+from src.utils.storage.checkpointer import get_checkpointer
 
 logger = SmartLogger("orchestrator")
 
@@ -24,6 +19,8 @@ class OrchestratorGraphState(TypedDict):
     thread_id: str
     task_id: str
     user_id: str
+    # Rolling summary of turns removed from messages
+    summary: str = ""
     # Routing fields for plan-execute
     needs_plan_execute: bool = False
     plan_execute_task: str = ""
@@ -41,7 +38,7 @@ def route_after_tools(state: OrchestratorGraphState) -> Literal["agent", "plan_e
 
 
 @log_execution("orchestrator", "orchestrator_agent", include_args=False, include_result=False)
-def orchestrator_agent(state: OrchestratorGraphState, config: RunnableConfig):
+async def orchestrator_agent(state: OrchestratorGraphState, config: RunnableConfig):
     """Orchestrator agent node - follows Salesforce pattern."""
     try:
         # Get LLM with tools from globals
@@ -53,20 +50,27 @@ def orchestrator_agent(state: OrchestratorGraphState, config: RunnableConfig):
         system_prompt = globals().get("system_prompt", "")
         
         # Format messages with system prompt
+        from langchain_core.messages import SystemMessage
         messages = state["messages"]
         
         # If first message, prepend system prompt
         if len(messages) == 1 and messages[0].type == "human":
-            from langchain_core.messages import SystemMessage
             formatted_messages = [
                 SystemMessage(content=system_prompt),
                 messages[0]
             ]
         else:
-            formatted_messages = messages
+            formatted_messages = list(messages)
+        
+        # Earlier turns were folded into the summary; it goes before them
+        if state.get("summary"):
+            position = 1 if len(formatted_messages) > len(messages) else 0
+            formatted_messages.insert(position, SystemMessage(
+                content=f"Summary of the earlier conversation:\n{state['summary']}"
+            ))
         
         # Invoke LLM with tools
-        response = llm_with_tools.invoke(formatted_messages)
+        response = await llm_with_tools.ainvoke(formatted_messages)
         
         return {"messages": [response]}
         
@@ -272,22 +276,13 @@ async def build_orchestrator_graph(tools, llm, system_prompt, plan_execute_subgr
     globals()["tools"] = tools
     globals()["system_prompt"] = system_prompt
     
-    # Create sync wrappers for async nodes
-    def sync_tools_node(state: OrchestratorGraphState) -> Dict[str, Any]:
-        """Sync wrapper for tools node."""
-        return asyncio.run(tools_node(state))
-    
-    def sync_plan_execute_node(state: OrchestratorGraphState) -> Dict[str, Any]:
-        """Sync wrapper for plan-execute node."""
-        return asyncio.run(plan_execute_node(state))
-    
     # Build graph following Salesforce pattern
     graph_builder = StateGraph(OrchestratorGraphState)
     
-    # Add nodes - agent is sync, others need sync wrappers
+    # Add nodes - all async, so concurrent tasks share the server's event loop
     graph_builder.add_node("agent", orchestrator_agent)
-    graph_builder.add_node("tools", sync_tools_node)
-    graph_builder.add_node("plan_execute", sync_plan_execute_node)
+    graph_builder.add_node("tools", tools_node)
+    graph_builder.add_node("plan_execute", plan_execute_node)
     
     # Set entry point
     graph_builder.set_entry_point("agent")
@@ -315,5 +310,5 @@ async def build_orchestrator_graph(tools, llm, system_prompt, plan_execute_subgr
     # Plan-execute goes to END
     graph_builder.add_edge("plan_execute", END)
     
-    # Compile with MemorySaver
-    return graph_builder.compile(checkpointer=MemorySaver())
\ No newline at end of file
+    # Compile with the persistent, pruned checkpointer
+    return graph_builder.compile(checkpointer=get_checkpointer("orchestrator"))
\ No newline at end of file
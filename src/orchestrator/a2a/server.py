@@ -269,7 +269,7 @@ async def handle_websocket(request: web.Request) -> web.WebSocketResponse:
                             try:
                                 # Check the interrupt type
                                 config = {"configurable": {"thread_id": thread_id}}
-                                current_state = orchestrator_handler.graph.get_state(config)
+                                current_state = await orchestrator_handler.graph.aget_state(config)
                                 
                                 # Use interrupt observer to get persistent interrupt context
                                 from src.orchestrator.observers.interrupt_observer import get_interrupt_observer
@@ -528,6 +528,16 @@ async def main(host: str = "0.0.0.0", port: int = 8000):
         except Exception as e:
             logger.warning("server_stop_error", error=str(e))
         
+        # Flush queued memory writes before the process exits
+        from src.memory.core.hybrid_memory_manager import shutdown_hybrid_memory_manager
+        await shutdown_hybrid_memory_manager()
+        
+        # Close pooled SQLite connections; their threads block exit
+        from src.utils.storage import close_checkpointers
+        await close_checkpointers()
+        from src.utils.llm_cache import close_llm_cache
+        await close_llm_cache()
+        
         # Clean up A2A connection pool
         from src.a2a.protocol import get_connection_pool
         try:
@@ -24,6 +24,7 @@ class PlanExecute(TypedDict):
     """State for plan-and-execute workflow."""
     input: str
     plan: List[str]
+    plan_dependencies: List[List[int]]  # Per-step 1-based numbers of steps each depends on
     past_steps: Annotated[List[StepExecution], operator.add]
     response: str
     user_visible_responses: Annotated[List[str], operator.add]  # Responses that should be shown to user immediately
@@ -32,6 +33,7 @@ class PlanExecute(TypedDict):
     task_id: str  # Task ID for SSE event correlation
     user_id: str  # User ID for memory namespace
     plan_step_offset: int  # Track where current plan starts in past_steps
+    sequential_only: bool  # Set once a parallel step asked the user; steps then run one at a time
 
 
 class OrchestratorState(AgentState):
@@ -12,6 +12,7 @@ from langgraph.graph import StateGraph, END
 from langgraph.graph.message import add_messages
 from langgraph.prebuilt import ToolNode, tools_condition
 from langgraph.errors import GraphInterrupt
+from src.utils.agents.tool_execution import execute_tool_calls, invoke_tool
 from src.utils.logging.framework import SmartLogger
 
 logger = SmartLogger("orchestrator")
@@ -48,7 +49,7 @@ def create_custom_react_agent(llm, tools: List[BaseTool], prompt: str = None):
     llm_with_tools = llm.bind_tools(tools)
     
     # Create custom tool execution function that handles interrupts
-    def execute_tools(state: Dict[str, Any]) -> Dict[str, Any]:
+    async def execute_tools(state: Dict[str, Any]) -> Dict[str, Any]:
         """Execute tools and handle interrupts properly.
         
         If a tool raises GraphInterrupt (like HumanInputTool),
@@ -61,18 +62,14 @@ def create_custom_react_agent(llm, tools: List[BaseTool], prompt: str = None):
         if not hasattr(last_message, "tool_calls") or not last_message.tool_calls:
             return {"messages": []}
             
-        # Execute each tool call
-        tool_messages = []
-        
-        for tool_call in last_message.tool_calls:
+        async def run_tool_call(tool_call: Dict[str, Any]) -> ToolMessage:
             # Find the tool
             tool = next((t for t in tools if t.name == tool_call["name"]), None)
             if not tool:
-                tool_messages.append(ToolMessage(
+                return ToolMessage(
                     content=f"Tool {tool_call['name']} not found",
                     tool_call_id=tool_call["id"]
-                ))
-                continue
+                )
                 
             try:
                 logger.info("executing_tool_in_custom_react",
@@ -82,13 +79,12 @@ def create_custom_react_agent(llm, tools: List[BaseTool], prompt: str = None):
                 # Execute tool - pass full state for InjectedState
                 # The tool expects state to be part of the args, not a separate parameter
                 tool_args = {**tool_call["args"], "state": state}
-                result = tool.invoke(tool_args)
+                result = await invoke_tool(tool, tool_args)
                     
-                # Add tool message
-                tool_messages.append(ToolMessage(
+                return ToolMessage(
                     content=str(result),
                     tool_call_id=tool_call["id"]
-                ))
+                )
                 
             except GraphInterrupt as e:
                 # This is expected - HumanInputTool raises this
@@ -108,15 +104,18 @@ def create_custom_react_agent(llm, tools: List[BaseTool], prompt: str = None):
                             tool_name=tool_call["name"],
                             error=str(e))
                 
-                tool_messages.append(ToolMessage(
+                return ToolMessage(
                     content=f"Error: {str(e)}",
                     tool_call_id=tool_call["id"]
-                ))
+                )
+        
+        # Independent tool calls run concurrently; messages keep call order
+        tool_messages = await execute_tool_calls(last_message.tool_calls, run_tool_call)
         
         return {"messages": tool_messages}
     
     # Create the agent node
-    def agent_node(state: ReactAgentState) -> Dict[str, Any]:
+    async def agent_node(state: ReactAgentState) -> Dict[str, Any]:
         """Agent node that calls LLM with tools."""
         messages = state["messages"]
         
@@ -130,7 +129,7 @@ def create_custom_react_agent(llm, tools: List[BaseTool], prompt: str = None):
                     has_system_prompt=prompt is not None)
         
         # Call LLM
-        response = llm_with_tools.invoke(messages)
+        response = await llm_with_tools.ainvoke(messages)
         
         # Log if the LLM decided to use tools
         has_tool_calls = hasattr(response, "tool_calls") and response.tool_calls
@@ -113,4 +113,38 @@ def emit_direct_response_event(
                 "data": event_data
             }
         }
-        sse_observer.notify(sse_event)
\ No newline at end of file
+        sse_observer.notify(sse_event)
+
+
+def relay_agent_event(event: Dict[str, Any], agent_name: str) -> bool:
+    """Pass an event produced inside an agent process on to SSE clients.
+    
+    Used for events streamed back with an A2A response and for batches
+    received through forward_events.
+    
+    Args:
+        event: Event with "event" and "data" keys
+        agent_name: Agent that produced the event
+        
+    Returns:
+        True if the event was delivered to the SSE observer
+    """
+    from src.orchestrator.observers import get_observer_registry
+    
+    if "event" not in event or not isinstance(event.get("data"), dict):
+        logger.warning("malformed_forwarded_event",
+                     agent_name=agent_name,
+                     event=event)
+        return False
+    
+    sse_observer = get_observer_registry().get_observer("SSEObserver")
+    if not sse_observer:
+        logger.warning("sse_observer_not_found", agent_name=agent_name)
+        return False
+    
+    # Add agent context if not present
+    if "agent_name" not in event["data"]:
+        event["data"]["agent_name"] = agent_name
+    
+    sse_observer.notify(event)
+    return True
@@ -10,12 +10,18 @@ from typing import List, Union
 from pydantic import BaseModel, Field, validator
 
 from langgraph.graph import StateGraph, START, END
-from langgraph.checkpoint.memory import MemorySaver
 
 from langchain_core.messages import HumanMessage, AIMessage
 from src.utils.logging.framework import SmartLogger, log_execution
+from src.utils.storage.checkpointer import get_checkpointer
 from src.orchestrator.workflow.event_decorators import emit_coordinated_events
 from src.orchestrator.workflow.memory_context_builder import MemoryContextBuilder
+from src.orchestrator.workflow.plan_cache import get_plan_cache
+from src.orchestrator.workflow.step_scheduler import (
+    normalize_dependencies,
+    select_ready_steps,
+    format_plan,
+)
 from src.orchestrator.core.state import PlanExecute, StepExecution
 
 # Initialize logger
@@ -33,6 +39,12 @@ class Plan(BaseModel):
     steps: List[str] = Field(
         description="different steps to follow, should be in sorted order"
     )
+    depends_on: List[List[int]] = Field(
+        default_factory=list,
+        description="Optional. One entry per step listing the 1-based numbers of earlier "
+        "steps it needs results from, e.g. [[], [], [1, 2]] when steps 1 and 2 are "
+        "independent and step 3 uses both. Omit for a strictly sequential plan."
+    )
 
     @validator("steps", each_item=True)
     def validate_steps(cls, v):
@@ -81,8 +93,6 @@ async def execute_step(state: PlanExecute):
                response_length=len(state.get("response", "")) if "response" in state else 0,
                plan_length=len(state.get("plan", [])),
                past_steps_length=len(state.get("past_steps", [])))
-    import asyncio
-    from src.orchestrator.observers import get_observer_registry, SearchResultsEvent
     from src.memory import (
         get_user_memory,
         get_memory_manager,
@@ -156,13 +166,207 @@ async def execute_step(state: PlanExecute):
         }
 
     plan_str = "\n".join(f"{i + 1}. {step}" for i, step in enumerate(plan))
-    task = plan[0]
 
     # Calculate current step number dynamically - relative to current plan
     plan_offset = state.get("plan_step_offset", 0)
     current_plan_steps = state.get("past_steps", [])[plan_offset:]
     current_step_num = len(current_plan_steps) + 1
 
+    # Independent steps (no unfinished dependencies) are dispatched together
+    from src.utils.config import config as app_config
+
+    max_parallel = 1
+    if app_config.get("orchestrator.parallel_steps_enabled", True) and not state.get("sequential_only"):
+        max_parallel = app_config.get("orchestrator.max_parallel_steps", 4)
+    ready = select_ready_steps(plan, state.get("plan_dependencies"), max_parallel)
+
+    if len(ready) == 1:
+        task = plan[0]
+        final_response, new_messages = await _execute_plan_step(
+            state, task, current_step_num, plan_str, current_plan_steps, thread_id
+        )
+
+        # Create StepExecution entry
+        step_executions: List[StepExecution] = [{
+            "step_seq_no": current_step_num,
+            "step_description": task,
+            "status": "completed",  # Will be updated by event decorators if failed
+            "result": final_response,
+        }]
+    else:
+        step_executions, new_messages, deferred = await _execute_parallel_steps(
+            state,
+            [(plan[index], current_step_num + offset) for offset, index in enumerate(ready)],
+            plan_str,
+            current_plan_steps,
+            thread_id,
+        )
+        if deferred:
+            # The deferred step asks the user; it and the rest of this request
+            # run one at a time on the parent thread, where an interrupt resumes
+            return {
+                "past_steps": step_executions,
+                "messages": new_messages,
+                "sequential_only": True,
+            }
+
+    # past_steps uses an operator.add reducer, so return only the new entries
+    return {
+        "past_steps": step_executions,
+        "messages": new_messages,  # Merge ReAct agent's new messages into conversation
+    }
+
+
+async def _execute_parallel_steps(state: PlanExecute, tasks, plan_str: str,
+                                  current_plan_steps, thread_id: str):
+    """Run independent plan steps concurrently and merge their results.
+
+    Each step gets its own ReAct agent invocation (with a per-step
+    checkpoint thread so the runs do not share agent state). Results are
+    merged in plan order before replanning. A failed step is recorded as
+    failed rather than discarding its siblings' results.
+
+    A step that interrupts (asks the user) is not propagated: its per-step
+    checkpoint cannot be resumed from the parent thread, and re-running the
+    node would repeat its siblings. It is left out of past_steps instead, so
+    the replanner keeps it, while the finished siblings' results are kept.
+
+    Returns:
+        Tuple of (step executions, new conversation messages, whether a
+        step was deferred)
+    """
+    from src.orchestrator.observers import (
+        get_observer_registry,
+        TaskStartedEvent,
+        TaskCompletedEvent,
+    )
+    from langgraph.errors import GraphInterrupt
+
+    registry = get_observer_registry()
+    task_id = state.get("task_id", thread_id)
+    total_steps = len(state.get("plan", []))
+
+    # The coordinated event decorator announces the first step; announce the rest
+    for task, step_num in tasks[1:]:
+        try:
+            registry.notify_task_started(TaskStartedEvent(
+                step_name="task_execution",
+                task_id=task_id,
+                task_description=task,
+                step_number=step_num,
+                total_steps=total_steps,
+            ))
+        except Exception as e:
+            logger.warning("parallel_task_started_event_failed", error=str(e))
+
+    logger.info(
+        "parallel_steps_dispatched",
+        operation="execute_step",
+        thread_id=thread_id,
+        step_numbers=[step_num for _, step_num in tasks],
+        step_count=len(tasks),
+    )
+    started = time.time()
+
+    results = await asyncio.gather(
+        *(
+            _execute_plan_step(
+                state, task, step_num, plan_str, current_plan_steps,
+                f"{thread_id}-step-{step_num}",
+            )
+            for task, step_num in tasks
+        ),
+        return_exceptions=True,
+    )
+
+    logger.info(
+        "parallel_steps_merged",
+        operation="execute_step",
+        thread_id=thread_id,
+        step_count=len(tasks),
+        failed_count=sum(isinstance(r, BaseException) for r in results),
+        duration_seconds=round(time.time() - started, 3),
+    )
+
+    for result in results:
+        # The user pressed escape before the steps ran; nothing to keep
+        if isinstance(result, GraphInterrupt) and result.args and \
+                isinstance(result.args[0], dict) and result.args[0].get("type") == "user_escape":
+            raise result
+
+    deferred = [step_num for (_, step_num), result in zip(tasks, results)
+                if isinstance(result, GraphInterrupt)]
+    if deferred:
+        logger.info(
+            "parallel_steps_deferred",
+            operation="execute_step",
+            thread_id=thread_id,
+            step_numbers=deferred,
+            note="Step asked for user input; it reruns alone after replanning",
+        )
+    failures = [r for r in results
+                if isinstance(r, BaseException) and not isinstance(r, GraphInterrupt)]
+    if failures and len(failures) == len(results):
+        raise failures[0]
+
+    step_executions: List[StepExecution] = []
+    new_messages = []
+    for (task, step_num), result in zip(tasks, results):
+        if isinstance(result, GraphInterrupt):
+            continue
+        if isinstance(result, BaseException):
+            step_executions.append({
+                "step_seq_no": step_num,
+                "step_description": task,
+                "status": "failed",
+                "result": f"Error: {result}",
+            })
+        else:
+            final_response, step_messages = result
+            step_executions.append({
+                "step_seq_no": step_num,
+                "step_description": task,
+                "status": "completed",
+                "result": final_response,
+            })
+            new_messages.extend(step_messages)
+
+    # The coordinated event decorator reports the first step's outcome
+    for execution in step_executions:
+        if execution["step_seq_no"] == tasks[0][1]:
+            continue
+        try:
+            registry.notify_task_completed(TaskCompletedEvent(
+                step_name="task_execution",
+                task_id=task_id,
+                task_description=execution["step_description"],
+                step_number=execution["step_seq_no"],
+                total_steps=total_steps,
+                result=execution["result"],
+                success=execution["status"] != "failed",
+            ))
+        except Exception as e:
+            logger.warning("parallel_task_completed_event_failed", error=str(e))
+
+    # Keep past_steps numbering contiguous around deferred steps
+    for offset, execution in enumerate(step_executions):
+        execution["step_seq_no"] = tasks[0][1] + offset
+
+    return step_executions, new_messages, bool(deferred)
+
+
+async def _execute_plan_step(state: PlanExecute, task: str, current_step_num: int,
+                             plan_str: str, current_plan_steps, checkpoint_thread_id: str):
+    """Execute one plan step with the ReAct agent.
+
+    Returns:
+        Tuple of (final response text, new conversation messages)
+    """
+    from src.orchestrator.observers import get_observer_registry, SearchResultsEvent
+    from langgraph.errors import GraphInterrupt
+
+    thread_id = state.get("thread_id", "default-thread")
+
     # Include past_steps context - only from current plan
     past_steps_context = ""
 
@@ -336,7 +540,7 @@ Remember: This context is for reference only. Focus on executing the specific ta
         # Create config for the ReAct agent's checkpointer
         config = {
             "configurable": {
-                "thread_id": thread_id
+                "thread_id": checkpoint_thread_id
             }
         }
         agent_response = await agent_executor.ainvoke(agent_input, config)
@@ -586,22 +790,7 @@ Remember: This context is for reference only. Focus on executing the specific ta
             final_response_preview=final_response[:100],
         )
 
-    # Create StepExecution entry
-    step_execution: StepExecution = {
-        "step_seq_no": current_step_num,
-        "step_description": task,
-        "status": "completed",  # Will be updated by event decorators if failed
-        "result": final_response,
-    }
-
-    # Append the current step execution to existing past_steps
-    existing_past_steps = state.get("past_steps", [])
-    updated_past_steps = existing_past_steps + [step_execution]
-    
-    return {
-        "past_steps": updated_past_steps,
-        "messages": new_messages,  # Merge ReAct agent's new messages into conversation
-    }
+    return final_response, new_messages
 
 
 @log_execution("orchestrator", "plan_step", include_args=True, include_result=True)
@@ -763,7 +952,17 @@ async def plan_step(state: PlanExecute):
     if not planner:
         raise RuntimeError("Planner not initialized")
 
-    plan = await planner.ainvoke({"messages": planning_messages})
+    # Recurring instructions reuse a stored plan with their own entities filled in
+    plan_cache = get_plan_cache()
+    agent_registry = globals().get("agent_registry")
+    online_agents = [agent.name for agent in agent_registry.get_online_agents()] if agent_registry else []
+    cached_plan = await plan_cache.lookup(planning_input, online_agents) if plan_cache else None
+    if cached_plan:
+        plan = Plan(steps=cached_plan["steps"], depends_on=cached_plan["depends_on"])
+    else:
+        plan = await planner.ainvoke({"messages": planning_messages})
+        if plan_cache and hasattr(plan, "steps"):
+            await plan_cache.store(planning_input, online_agents, plan.steps, plan.depends_on)
 
     # DEBUG: Log what the planner returned
     logger.info(
@@ -773,6 +972,7 @@ async def plan_step(state: PlanExecute):
         plan_type=type(plan).__name__,
         is_plan=hasattr(plan, "steps"),
         is_response=hasattr(plan, "response"),
+        from_cache=bool(cached_plan),
         plan_steps=plan.steps if hasattr(plan, "steps") else None,
         response_text=plan.response if hasattr(plan, "response") else None,
         input_preview=state["input"][:200],
@@ -831,16 +1031,25 @@ async def plan_step(state: PlanExecute):
         # After culling, the new plan starts at the current length
         return {
             "plan": plan.steps,
+            "plan_dependencies": normalize_dependencies(plan.steps, plan.depends_on),
             "plan_step_offset": len(past_steps),  # New plan starts after culled steps
             "past_steps": past_steps,
+            "sequential_only": False,
         }
 
     # No culling needed
+    plan_dependencies = normalize_dependencies(plan.steps, plan.depends_on)
     logger.info("DEBUG_plan_step_returning",
                plan_steps=plan.steps,
+               plan_dependencies=plan_dependencies,
                plan_step_offset=current_past_steps_length,
                returning_response=False)
-    return {"plan": plan.steps, "plan_step_offset": current_past_steps_length}
+    return {
+        "plan": plan.steps,
+        "plan_dependencies": plan_dependencies,
+        "plan_step_offset": current_past_steps_length,
+        "sequential_only": False,
+    }
 
 
 @log_execution("orchestrator", "replan_step", include_args=True, include_result=True)
@@ -937,7 +1146,7 @@ async def replan_step(state: PlanExecute):
     # Format the template variables WITHOUT context in input
     template_vars = {
         "input": state["input"],  # Clean input only
-        "plan": "\n".join(f"{i + 1}. {step}" for i, step in enumerate(state["plan"])),
+        "plan": format_plan(state["plan"], state.get("plan_dependencies")),
         "past_steps": past_steps_str.strip(),
         "context": full_context,  # Always provide context (may be empty string)
         "completed_steps_count": completed_steps_count,
@@ -1111,6 +1320,7 @@ async def replan_step(state: PlanExecute):
 
         state_updates = {
             "plan": new_plan,
+            "plan_dependencies": normalize_dependencies(new_plan, output.action.depends_on),
             "user_visible_responses": user_visible_responses,
         }
 
@@ -1158,25 +1368,21 @@ def create_graph(agent_executor, planner, replanner, use_checkpointer=True):
     globals()["planner"] = planner
     globals()["replanner"] = replanner
 
-    # Import sync wrappers for LangGraph compatibility
-    from src.orchestrator.workflow_sync_wrappers import (
-        plan_step as sync_plan_step,
-        execute_step as sync_execute_step,
-        replan_step as sync_replan_step,
-    )
-
     workflow = StateGraph(PlanExecute)
 
-    # Add the plan node - use sync wrapper
-    workflow.add_node("planner", sync_plan_step)
+    # Nodes are native coroutines, so the graph must be run with ainvoke/astream
+    # and concurrent tasks interleave on the server's event loop
+
+    # Add the plan node
+    workflow.add_node("planner", plan_step)
     logger.info("DEBUG_added_planner_node")
 
-    # Add the execution step - use sync wrapper
-    workflow.add_node("agent", sync_execute_step)
+    # Add the execution step
+    workflow.add_node("agent", execute_step)
     logger.info("DEBUG_added_agent_node")
 
-    # Add a replan node - use sync wrapper
-    workflow.add_node("replan", sync_replan_step)
+    # Add a replan node
+    workflow.add_node("replan", replan_step)
     logger.info("DEBUG_added_replan_node")
 
     workflow.add_edge(START, "planner")
@@ -1202,10 +1408,10 @@ def create_graph(agent_executor, planner, replanner, use_checkpointer=True):
     # This compiles it into a LangChain Runnable,
     # meaning you can use it as you would any other runnable
     if use_checkpointer:
-        # Use MemorySaver for in-memory checkpointing (default for backward compat)
+        # Persistent, pruned checkpointing (database.checkpointer)
         # We don't need interrupt_before since HumanInputTool handles interrupts internally
         app = workflow.compile(
-            checkpointer=MemorySaver()
+            checkpointer=get_checkpointer("plan_and_execute")
         )
     else:
         # Compile without checkpointer for subgraph usage
@@ -1286,35 +1492,12 @@ async def trigger_background_summary_if_needed(
             if existing_data:
                 existing_summary = existing_data.get("summary")
 
-        # Use the conversation summary prompt from our framework
-        from src.utils.prompt_templates import CONVERSATION_SUMMARY_PROMPT
-        from langchain_core.messages import HumanMessage
+        # Summarize only the recent messages on top of the existing summary
+        # This is more token-efficient than sending all messages
+        from src.utils.agents.message_processing import summarize_messages
 
-        # Format recent messages as text (matching old_main approach)
-        # Take last 10 messages for the prompt
         recent_messages = messages[-10:] if len(messages) > 10 else messages
-        formatted_messages = []
-        for msg in recent_messages:
-            role = "User" if msg.type == "human" else "Assistant"
-            content = str(msg.content)[:500]  # Truncate long messages
-            formatted_messages.append(f"{role}: {content}")
-
-        recent_conversation_text = "\n".join(formatted_messages)
-
-        # Create the summary prompt with formatted conversation text
-        summary_prompt = CONVERSATION_SUMMARY_PROMPT.format(
-            previous_summary=existing_summary if existing_summary else "None",
-            recent_conversation=recent_conversation_text,
-        )
-
-        # Generate summary using LLM with ONLY the summary prompt (matching old_main)
-        # This is more token-efficient than sending all messages
-        summary_response = await llm.ainvoke([HumanMessage(content=summary_prompt)])
-        summary_text = (
-            summary_response.content
-            if hasattr(summary_response, "content")
-            else str(summary_response)
-        )
+        summary_text = await summarize_messages(llm, recent_messages, existing_summary)
 
         # Store summary in SQLite for persistence across threads
         from src.utils.storage import get_global_sqlite_store
@@ -1426,14 +1609,13 @@ async def create_plan_execute_graph(use_checkpointer=True):
     # Use custom ReAct agent when in subgraph mode (no checkpointer)
     if use_checkpointer:
         # Standalone mode - use LangGraph's create_react_agent with checkpointer
-        from langgraph.checkpoint.memory import MemorySaver
         from langgraph.prebuilt import create_react_agent
         agent_executor = create_react_agent(
             llm, 
             tools, 
             prompt=orchestrator_prompt, 
             state_schema=OrchestratorState,
-            checkpointer=MemorySaver()
+            checkpointer=get_checkpointer("plan_and_execute_agent")
         )
     else:
         # Subgraph mode - use our custom ReAct agent without checkpointer
@@ -1501,6 +1683,9 @@ def setup_canonical_plan_execute(llm_with_tools, llm_for_planning, agent_registr
     # Agent executor is the LLM with tools
     agent_executor = llm_with_tools
 
+    # Online agents partition the plan cache
+    globals()["agent_registry"] = agent_registry
+
     # Create and return the graph
     return create_graph(agent_executor, planner, replanner, use_checkpointer)
 
@@ -24,7 +24,8 @@ from src.utils.config import (
 from src.utils.agents.message_processing.unified_serialization import serialize_messages_for_json
 from src.orchestrator.observers.direct_call_events import (
     emit_agent_call_event, 
-    DirectCallEventTypes
+    DirectCallEventTypes,
+    relay_agent_event
 )
 
 # Initialize structured logger
@@ -587,7 +588,12 @@ class SalesforceAgentTool(BaseAgentTool):
                     context_size=len(str(extracted_context))
                 )
                 
-                result = await client.process_task(endpoint=endpoint, task=task)
+                result = await client.process_task(
+                    endpoint=endpoint,
+                    task=task,
+                    # Stream tool progress to the UI while the agent works
+                    on_event=lambda event: relay_agent_event(event, "salesforce")
+                )
                 
                 # Log the raw A2A response
                 logger.info("a2a_raw_response",
@@ -1091,7 +1097,14 @@ class JiraAgentTool(BaseAgentTool):
                     context_size=len(str(extracted_context))
                 )
                 
-                result = await client.process_task(endpoint=endpoint, task=task)
+                # Long workflows run in the background on the agent and are
+                # long polled, so they outlive the request timeout
+                result = await client.run_task(
+                    endpoint=endpoint,
+                    task=task,
+                    # Relay tool progress to the UI while the agent works
+                    on_event=lambda event: relay_agent_event(event, "jira")
+                )
                 
                 # Log the raw A2A response
                 logger.info("a2a_raw_response",
@@ -1653,7 +1666,14 @@ class ServiceNowAgentTool(BaseAgentTool):
                     context_size=len(str(extracted_context))
                 )
                 
-                result = await client.process_task(endpoint=endpoint, task=task)
+                # Long workflows run in the background on the agent and are
+                # long polled, so they outlive the request timeout
+                result = await client.run_task(
+                    endpoint=endpoint,
+                    task=task,
+                    # Relay tool progress to the UI while the agent works
+                    on_event=lambda event: relay_agent_event(event, "servicenow")
+                )
                 
                 # Log the raw A2A response
                 logger.info("a2a_raw_response",
@@ -5,11 +5,18 @@ from .interrupt_handler import InterruptHandler
 from .entity_extractor import extract_entities_intelligently
 from .memory_context_builder import MemoryContextBuilder
 from .memory_analyzer import MemoryAnalyzer
+from .step_scheduler import normalize_dependencies, select_ready_steps, format_plan
+from .plan_cache import PlanCache, get_plan_cache
 
 __all__ = [
     'emit_coordinated_events',
     'InterruptHandler',
     'extract_entities_intelligently',
     'MemoryContextBuilder',
-    'MemoryAnalyzer'
+    'MemoryAnalyzer',
+    'normalize_dependencies',
+    'select_ready_steps',
+    'format_plan',
+    'PlanCache',
+    'get_plan_cache'
 ]
\ No newline at end of file
@@ -370,7 +370,12 @@ def emit_coordinated_events(event_types: List[str]) -> Callable:
                         if isinstance(result, dict) and "past_steps" in result:
                             new_past_steps = result["past_steps"]
                             if new_past_steps:
-                                last_step = new_past_steps[-1]
+                                # Parallel batches append several steps; report this step's own result
+                                last_step = next(
+                                    (step for step in reversed(new_past_steps)
+                                     if isinstance(step, dict) and step.get('step_description') == current_task),
+                                    new_past_steps[-1]
+                                )
                                 if isinstance(last_step, dict):
                                     result_content = str(last_step.get('result', ''))
                                     status = last_step.get('status', 'completed')
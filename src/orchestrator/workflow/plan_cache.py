@@ -0,0 +1,346 @@
+"""Semantic cache of plans for recurring instructions.
+
+Many instructions differ only in the record they name ("get all
+opportunities for Acme", "... for Globex"), yet each one costs a planner
+call. PlanCache stores the plans the planner produced as templates and
+reuses them for instructions of the same shape:
+
+- Entities in the instruction (quoted text, record ids and numbers,
+  emails, capitalized names) become slots. The rest, lowercased, is the
+  instruction's template text, e.g. ``get all opportunities for <entity>``.
+- A plan is stored only if every slot value appears in its steps, which
+  become templates with the values replaced by slot markers, and the steps
+  name no entity other than the instruction's. Plans that name ids, numbers
+  or names not in the instruction (taken from memory or the conversation,
+  or a longer name such as "Acme Corp" for the slot "Acme") are not stored.
+- A lookup with the exact template text hits. Otherwise an instruction with
+  one slot may match a stored template for the same online agents that
+  differs only in filler words (articles, "please", "can you"), if the
+  embeddings are at least ``orchestrator.plan_cache_similarity`` alike. The
+  stored steps are returned with the new instruction's entities filled into
+  the slots, in order. Every other word must match, so qualifiers such as
+  "open" or "high priority" are never dropped. Instructions without slots,
+  whose lowercase words may name the record, and instructions with several
+  slots, which a reordered sentence could swap, need the exact text.
+- Instructions that refer back to the conversation ("it", "that ticket",
+  "again") always go to the planner.
+
+Without sentence-transformers only exact template text matches.
+"""
+
+import asyncio
+import re
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from src.memory.algorithms.semantic_embeddings import get_embeddings
+from src.memory.components.embedding_index import EmbeddingIndex
+from src.utils.config import config
+from src.utils.logging.framework import SmartLogger
+
+logger = SmartLogger("orchestrator")
+
+ENTITY_PLACEHOLDER = "<entity>"
+
+# Values that identify a specific record; plans holding any the instruction
+# did not name depend on context and are not cached
+_IDENTIFIER_PATTERNS = [
+    r'\b[\w.+-]+@[\w-]+(?:\.[\w-]+)+\b',  # email
+    r'https?://\S+',  # URL
+    r'\b[a-f0-9]{32}\b',  # ServiceNow sys_id
+    r'\b(?:INC|CHG|PRB|REQ|RITM|TASK)\d{7,10}\b',  # ServiceNow numbers
+    r'\b[A-Z][A-Z0-9]{1,9}-\d+\b',  # Jira issue keys
+    r'\b(?=[a-zA-Z0-9]*\d)[a-zA-Z0-9]{15}(?:[a-zA-Z0-9]{3})?\b',  # Salesforce ids
+    r'\$?\b\d+(?:[.,]\d+)*\b',  # numbers and amounts
+]
+_IDENTIFIER_RE = re.compile("|".join(f"(?:{pattern})" for pattern in _IDENTIFIER_PATTERNS))
+_QUOTED_RE = re.compile(r'"([^"]+)"|“([^”]+)”')
+_NAME_RE = re.compile(r"\b[A-Z][\w&'.-]*(?:\s+[A-Z][\w&'.-]*)*")
+
+# Capitalized words that describe the request, not an entity
+_VOCABULARY = {
+    "i", "salesforce", "jira", "servicenow", "sla", "agent", "agents",
+    "account", "accounts", "contact", "contacts", "opportunity", "opportunities",
+    "lead", "leads", "case", "cases", "task", "tasks", "user", "users",
+    "issue", "issues", "project", "projects", "epic", "epics", "sprint", "sprints",
+    "incident", "incidents", "change", "changes", "problem", "problems", "request", "requests",
+}
+
+# References to earlier turns; the plan depends on the conversation
+_ANAPHORA_RE = re.compile(
+    r"\b(it|its|that|this|those|these|them|they|their|same|again|previous|above|earlier|"
+    r"latter|former)\b",
+    re.IGNORECASE
+)
+
+
+# Words a near match may add or drop; every other word of the template must match
+_FILLER_WORDS = frozenset({"a", "an", "the", "please", "can", "could", "would", "you", "me", "us"})
+
+
+def _slot_marker(index: int) -> str:
+    return f"{{{{slot:{index}}}}}"
+
+
+def extract_slots(instruction: str) -> Tuple[str, List[str]]:
+    """Split an instruction into template text and entity values.
+
+    Returns:
+        (lowercased text with each entity replaced by ``<entity>``,
+        entity values in order of appearance)
+    """
+    spans: List[Tuple[int, int, str]] = []
+
+    def overlaps(start: int, end: int) -> bool:
+        return any(start < taken_end and end > taken_start for taken_start, taken_end, _ in spans)
+
+    for match in _QUOTED_RE.finditer(instruction):
+        spans.append((match.start(), match.end(), match.group(1) or match.group(2)))
+    for match in _IDENTIFIER_RE.finditer(instruction):
+        if not overlaps(match.start(), match.end()):
+            spans.append((match.start(), match.end(), match.group(0)))
+    for match in _NAME_RE.finditer(instruction):
+        # Split capitalized runs at request vocabulary ("Acme Opportunities")
+        offset = match.start()
+        words = [(m.start() + offset, m.end() + offset, m.group(0))
+                 for m in re.finditer(r"\S+", match.group(0))]
+        if words and words[0][0] == 0:
+            words = words[1:]  # sentence-initial capital
+        run: List[Tuple[int, int, str]] = []
+        for word in words + [None]:
+            if word is not None and word[2].lower().strip(".,'") not in _VOCABULARY:
+                run.append(word)
+                continue
+            if run:
+                start, end = run[0][0], run[-1][1]
+                value = instruction[start:end].rstrip(".,")
+                end = start + len(value)
+                if value and not overlaps(start, end):
+                    spans.append((start, end, value))
+            run = []
+
+    spans.sort()
+    parts, slots, position = [], [], 0
+    for start, end, value in spans:
+        parts.append(instruction[position:start])
+        parts.append(ENTITY_PLACEHOLDER)
+        slots.append(value)
+        position = end
+    parts.append(instruction[position:])
+    text = " ".join("".join(parts).lower().split()).rstrip(" .?!")
+    return text, slots
+
+
+def _content_words(text: str) -> Tuple[str, ...]:
+    """Template text without punctuation and filler words"""
+    return tuple(word for word in re.findall(r"<entity>|[\w'-]+", text) if word not in _FILLER_WORDS)
+
+
+def _slot_pattern(value: str) -> "re.Pattern":
+    return re.compile(rf"(?<!\w){re.escape(value)}(?!\w)", re.IGNORECASE)
+
+
+@dataclass
+class PlanTemplate:
+    """A stored plan with slot markers in place of the instruction's entities"""
+    entry_id: str
+    text: str
+    agents: FrozenSet[str]
+    slot_count: int
+    steps: List[str]
+    depends_on: List[List[int]]
+    created_at: float = field(default_factory=time.monotonic)
+    hits: int = 0
+
+    def fill(self, slots: List[str]) -> List[str]:
+        steps = []
+        for step in self.steps:
+            for index, value in enumerate(slots):
+                step = step.replace(_slot_marker(index), value)
+            steps.append(step)
+        return steps
+
+
+class PlanCache:
+    """Plan templates by instruction shape and online agents."""
+
+    def __init__(self, similarity_threshold: Optional[float] = None,
+                 max_entries: Optional[int] = None, ttl: Optional[float] = None):
+        self.similarity_threshold = similarity_threshold or config.get('orchestrator.plan_cache_similarity', 0.95)
+        self.max_entries = max_entries or config.get('orchestrator.plan_cache_max_entries', 500)
+        self.ttl = ttl if ttl is not None else config.get('orchestrator.plan_cache_ttl', 86400)
+        self._templates: "OrderedDict[str, PlanTemplate]" = OrderedDict()
+        self._by_text: Dict[Tuple[str, FrozenSet[str]], str] = {}
+        self._index = EmbeddingIndex()
+        self._embeddings = None
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+
+    async def _encode(self, text: str):
+        """Embedding of template text, encoded off the event loop"""
+        if self._embeddings is None:
+            self._embeddings = get_embeddings()
+        if not self._embeddings.is_available():
+            return None
+        return await asyncio.get_running_loop().run_in_executor(None, self._embeddings.encode_text, text)
+
+    def _remove(self, entry_id: str):
+        template = self._templates.pop(entry_id, None)
+        if template is not None:
+            self._by_text.pop((template.text, template.agents), None)
+            self._index.remove(entry_id)
+
+    def _purge(self):
+        now = time.monotonic()
+        expired = [entry_id for entry_id, template in self._templates.items()
+                   if now - template.created_at > self.ttl]
+        for entry_id in expired:
+            self._remove(entry_id)
+
+    @staticmethod
+    def is_cacheable(instruction: str) -> bool:
+        """Whether the instruction stands on its own, without earlier turns"""
+        return bool(instruction.strip()) and not _ANAPHORA_RE.search(instruction)
+
+    async def lookup(self, instruction: str, agents: Iterable[str]) -> Optional[Dict[str, Any]]:
+        """Plan for the instruction from a stored template, or None.
+
+        Returns:
+            ``{"steps", "depends_on", "similarity"}`` on a hit
+        """
+        if not self.is_cacheable(instruction):
+            self.skipped += 1
+            return None
+        self._purge()
+        agents = frozenset(agents)
+        text, slots = extract_slots(instruction)
+
+        template, similarity = None, 0.0
+        entry_id = self._by_text.get((text, agents))
+        if entry_id is not None:
+            template, similarity = self._templates[entry_id], 1.0
+        elif len(slots) == 1:
+            # Near matches may only differ in filler words, never in the action or a qualifier
+            words = _content_words(text)
+            candidates = [entry_id for entry_id, stored in self._templates.items()
+                          if stored.agents == agents and stored.slot_count == 1
+                          and _content_words(stored.text) == words]
+            query = await self._encode(text) if candidates else None
+            if query is not None:
+                # Candidates evicted while encoding are no longer indexed
+                best = self._index.top_k(query, 1, node_ids=candidates)
+                if best and best[0][1] >= self.similarity_threshold:
+                    template, similarity = self._templates[best[0][0]], best[0][1]
+
+        if template is None:
+            self.misses += 1
+            logger.info("plan_cache_miss",
+                        operation="plan_step",
+                        template=text,
+                        slot_count=len(slots),
+                        hit_rate=self.hit_rate)
+            return None
+
+        self.hits += 1
+        template.hits += 1
+        self._templates.move_to_end(template.entry_id)
+        logger.info("plan_cache_hit",
+                    operation="plan_step",
+                    template=text,
+                    cached_template=template.text,
+                    similarity=round(similarity, 4),
+                    slot_count=len(slots),
+                    hit_rate=self.hit_rate)
+        return {
+            "steps": template.fill(slots),
+            "depends_on": [list(deps) for deps in template.depends_on],
+            "similarity": similarity
+        }
+
+    async def store(self, instruction: str, agents: Iterable[str], steps: List[str],
+              depends_on: Optional[List[List[int]]] = None) -> bool:
+        """Store the planner's plan for an instruction as a template.
+
+        Returns:
+            Whether the plan could be stored
+        """
+        if not steps or not self.is_cacheable(instruction):
+            return False
+        agents = frozenset(agents)
+        text, slots = extract_slots(instruction)
+
+        template_steps = list(steps)
+        for index, value in sorted(enumerate(slots), key=lambda item: -len(item[1])):
+            pattern = _slot_pattern(value)
+            if not any(pattern.search(step) for step in template_steps):
+                # The plan paraphrases an entity; refilling would leave the old one
+                return False
+            template_steps = [pattern.sub(lambda _: _slot_marker(index), step) for step in template_steps]
+
+        # Every entity in the steps must be one of the slots as a whole: a step
+        # naming "Acme Corp" for the slot "Acme" would be refilled as "Globex Corp"
+        slot_values = {value.lower() for value in slots}
+        unknown = [entity for step in steps for entity in extract_slots(step)[1]
+                   if entity.lower() not in slot_values]
+        if unknown:
+            logger.info("plan_cache_store_skipped",
+                        operation="plan_step",
+                        template=text,
+                        reason="unknown_entities",
+                        entities=unknown[:5])
+            return False
+
+        embedding = await self._encode(text)
+        previous = self._by_text.get((text, agents))
+        if previous is not None:
+            self._remove(previous)
+        template = PlanTemplate(
+            entry_id=uuid.uuid4().hex,
+            text=text,
+            agents=agents,
+            slot_count=len(slots),
+            steps=template_steps,
+            depends_on=[list(deps) for deps in (depends_on or [])]
+        )
+        self._templates[template.entry_id] = template
+        self._by_text[(text, agents)] = template.entry_id
+        if embedding is not None:
+            self._index.add(template.entry_id, embedding)
+
+        while len(self._templates) > self.max_entries:
+            self._remove(next(iter(self._templates)))
+        return True
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return round(self.hits / lookups, 3) if lookups else 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit rate and size of the cache"""
+        return {
+            "templates": len(self._templates),
+            "hits": self.hits,
+            "misses": self.misses,
+            "skipped": self.skipped,
+            "hit_rate": self.hit_rate,
+            "semantic": self._embeddings.is_available() if self._embeddings is not None else None
+        }
+
+
+# Global plan cache
+_plan_cache: Optional[PlanCache] = None
+
+
+def get_plan_cache() -> Optional[PlanCache]:
+    """Get the global plan cache, or None if ``orchestrator.plan_cache_enabled`` is off"""
+    global _plan_cache
+    if not config.get('orchestrator.plan_cache_enabled', True):
+        return None
+    if _plan_cache is None:
+        _plan_cache = PlanCache()
+    return _plan_cache
@@ -0,0 +1,126 @@
+"""Dependency-aware scheduling of plan steps.
+
+The planner may attach dependencies to a plan (``Plan.depends_on``), where
+entry ``i`` lists the 1-based numbers of earlier steps that step ``i + 1``
+needs. Steps without unmet dependencies can run at the same time, so a plan
+like "look up the account in Salesforce" + "find open incidents in
+ServiceNow" takes the longer of the two agent calls instead of their sum.
+
+Only lookups share a batch. A step that writes could be repeated if a
+sibling's interrupt made the node run again, and a step that asks the user
+needs the parent thread's checkpoint to resume.
+"""
+
+import re
+from typing import List, Optional
+
+from src.utils.logging.framework import SmartLogger
+
+logger = SmartLogger("orchestrator")
+
+# Steps that pause for the user must run alone: an interrupt re-runs the
+# whole node on resume, which would repeat any sibling steps
+_INTERACTIVE_RE = re.compile(
+    r"human_input|\bask(?:ing)? (?:the )?user\b|\bconfirm with\b|\bclarif",
+    re.IGNORECASE
+)
+
+# Steps that change records run alone, so nothing can be written twice
+_WRITE_RE = re.compile(
+    r"\b(?:create|update|add|delete|remove|close|assign|reassign|transition|change|set|"
+    r"modify|edit|insert|upsert|post|comment|log|submit|approve|reject|merge|move|link|"
+    r"attach|send|email|resolve|cancel|reopen|convert)\b",
+    re.IGNORECASE
+)
+
+
+def normalize_dependencies(steps: List[str],
+                           depends_on: Optional[List[List[int]]]) -> List[List[int]]:
+    """Validate planner-provided dependencies.
+
+    Missing or malformed dependencies fall back to a strictly sequential
+    chain (each step depends on the previous one), which is the behavior of
+    plans without dependency information. References to the step itself,
+    later steps or out-of-range numbers are dropped, so the result is
+    always acyclic.
+
+    Args:
+        steps: Plan step descriptions
+        depends_on: Per-step lists of 1-based step numbers, or None
+
+    Returns:
+        One list of 1-based dependency numbers per step
+    """
+    if not depends_on or len(depends_on) != len(steps):
+        if depends_on:
+            logger.warning("plan_dependencies_ignored",
+                          step_count=len(steps),
+                          dependency_count=len(depends_on))
+        return [[i] if i else [] for i in range(len(steps))]
+
+    normalized = []
+    for index, deps in enumerate(depends_on):
+        step_number = index + 1
+        valid = sorted({
+            dep for dep in (deps or [])
+            if isinstance(dep, int) and 1 <= dep < step_number
+        })
+        normalized.append(valid)
+    return normalized
+
+
+def select_ready_steps(plan: List[str], dependencies: Optional[List[List[int]]],
+                       max_parallel: int = 1) -> List[int]:
+    """Pick the steps to execute next.
+
+    The first step always runs. Further steps join it when none of their
+    dependencies are still in the plan (the plan only holds unfinished
+    steps) and both it and they only look records up.
+
+    Args:
+        plan: Remaining plan steps
+        dependencies: Output of normalize_dependencies for this plan
+        max_parallel: Upper bound on steps dispatched together
+
+    Returns:
+        0-based plan indices, in plan order
+    """
+    if not plan:
+        return []
+    if max_parallel <= 1 or not dependencies or len(dependencies) != len(plan):
+        return [0]
+
+    if not is_parallel_safe(plan[0]):
+        return [0]
+
+    ready = [0]
+    for index in range(1, len(plan)):
+        if len(ready) >= max_parallel:
+            break
+        if dependencies[index] or not is_parallel_safe(plan[index]):
+            continue
+        ready.append(index)
+    return ready
+
+
+def format_plan(plan: List[str], dependencies: Optional[List[List[int]]] = None) -> str:
+    """Render a numbered plan, annotating steps with their dependencies.
+
+    Strictly sequential plans are rendered without annotations.
+    """
+    if not dependencies or len(dependencies) != len(plan):
+        dependencies = None
+    elif dependencies == normalize_dependencies(plan, None):
+        dependencies = None
+
+    lines = []
+    for index, step in enumerate(plan):
+        deps = dependencies[index] if dependencies else []
+        suffix = f" (after step {', '.join(map(str, deps))})" if deps else ""
+        lines.append(f"{index + 1}. {step}{suffix}")
+    return "\n".join(lines)
+
+
+def is_parallel_safe(step: str) -> bool:
+    """Whether a step may run alongside others: it neither asks the user nor writes."""
+    return not _INTERACTIVE_RE.search(step) and not _WRITE_RE.search(step)
@@ -12,6 +12,17 @@ from .helpers import (
     format_message_for_display,
     smart_preserve_messages
 )
+from .token_budget import (
+    TokenCounter,
+    MessageTokenCache,
+    get_token_cache,
+    message_cache_key
+)
+from .history import (
+    ConversationHistory,
+    format_messages_for_summary,
+    summarize_messages
+)
 
 __all__ = [
     # Serialization
@@ -24,5 +35,16 @@ __all__ = [
     "extract_user_intent",
     "count_tool_calls",
     "format_message_for_display",
-    "smart_preserve_messages"
+    "smart_preserve_messages",
+
+    # Token budget
+    "TokenCounter",
+    "MessageTokenCache",
+    "get_token_cache",
+    "message_cache_key",
+
+    # History
+    "ConversationHistory",
+    "format_messages_for_summary",
+    "summarize_messages"
 ]
\ No newline at end of file
@@ -3,6 +3,8 @@
 from typing import List, Dict, Optional
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
 
+from .token_budget import TokenCounter
+
 
 def trim_messages_for_context(
     messages: List[BaseMessage],
@@ -119,6 +121,40 @@ def trim_messages_for_context(
     return result
 
 
+def _estimate_message_chars(msg: BaseMessage) -> float:
+    """Character-equivalent size of one message, including structure overhead."""
+    # Content tokens
+    content_str = str(msg.content)
+    total_chars = len(content_str)
+    
+    # Message structure overhead (role, type, etc.)
+    # Each message has ~20-30 tokens of overhead
+    total_chars += 100  # ~25 tokens * 4 chars
+    
+    # System messages have more overhead
+    if msg.__class__.__name__ == "SystemMessage":
+        total_chars += 100  # Extra overhead
+    
+    # Tool calls are expensive
+    if isinstance(msg, AIMessage) and hasattr(msg, 'tool_calls'):
+        for tool_call in (msg.tool_calls or []):
+            # Tool call structure + arguments
+            tool_str = str(tool_call)
+            total_chars += len(tool_str) + 200  # Extra for JSON structure
+    
+    # Tool messages (results) also have overhead
+    if hasattr(msg, 'name') and msg.name:
+        total_chars += 200  # Tool message structure
+        # Large tool results (like search results) are very expensive
+        if len(content_str) > 1000:
+            total_chars += len(content_str) * 0.2  # Add 20% for JSON escaping
+    
+    return total_chars
+
+
+_message_chars = TokenCounter("estimate_chars", _estimate_message_chars)
+
+
 def estimate_message_tokens(messages: List[BaseMessage]) -> int:
     """Estimate token count for messages.
     
@@ -127,41 +163,27 @@ def estimate_message_tokens(messages: List[BaseMessage]) -> int:
     - Account for message structure overhead
     - Tool calls and their results can be verbose
     
+    Each message's size is computed once and cached, so re-estimating a
+    growing conversation only sizes the new messages.
+    
     Args:
         messages: List of messages
         
     Returns:
         Estimated token count
     """
-    total_chars = 0
-    
-    for msg in messages:
-        # Content tokens
-        content_str = str(msg.content)
-        total_chars += len(content_str)
-        
-        # Message structure overhead (role, type, etc.)
-        # Each message has ~20-30 tokens of overhead
-        total_chars += 100  # ~25 tokens * 4 chars
-        
-        # System messages have more overhead
-        if msg.__class__.__name__ == "SystemMessage":
-            total_chars += 100  # Extra overhead
-        
-        # Tool calls are expensive
-        if isinstance(msg, AIMessage) and hasattr(msg, 'tool_calls'):
-            for tool_call in (msg.tool_calls or []):
-                # Tool call structure + arguments
-                tool_str = str(tool_call)
-                total_chars += len(tool_str) + 200  # Extra for JSON structure
-        
-        # Tool messages (results) also have overhead
-        if hasattr(msg, 'name') and msg.name:
-            total_chars += 200  # Tool message structure
-            # Large tool results (like search results) are very expensive
-            if len(content_str) > 1000:
-                total_chars += len(content_str) * 0.2  # Add 20% for JSON escaping
+    return _chars_to_tokens(_message_chars.total(messages))
+
+
+def estimate_suffix_tokens(messages: List[BaseMessage]) -> List[int]:
+    """Token estimates of every suffix: ``tokens[i]`` is ``estimate_message_tokens(messages[i:])``.
     
+    Sizes each message once, for callers searching for a cut point.
+    """
+    return [_chars_to_tokens(chars) for chars in _message_chars.suffix_totals(messages)]
+
+
+def _chars_to_tokens(total_chars: float) -> int:
     # Conservative estimate: ~3.5 characters per token for structured content
     estimated_tokens = int(total_chars / 3.5)
     
@@ -0,0 +1,139 @@
+"""Bounded conversation history with a rolling summary.
+
+A thread's message list grows by a turn on every request, and every turn
+was sent back to the LLM and stored in each checkpoint. ConversationHistory
+keeps the list to a token budget instead: once the messages exceed
+``conversation.history_max_tokens``, the oldest turns are folded into the
+thread's summary and removed, leaving about
+``conversation.history_target_tokens``. The gap between the two means the
+summary is updated once every few turns, not on every turn.
+
+Messages are only removed at the start of a user turn, so tool calls stay
+with their results, and the latest turn is always kept whole.
+"""
+
+from typing import List, Optional, Tuple
+
+from langchain_core.messages import BaseMessage, HumanMessage
+
+from src.utils.config import config
+from src.utils.logging import get_smart_logger
+from .helpers import estimate_message_tokens, estimate_suffix_tokens
+
+logger = get_smart_logger("utility")
+
+
+def format_messages_for_summary(messages: List[BaseMessage], max_chars: int = 500) -> str:
+    """Render messages as ``Role: content`` lines for a summary prompt.
+
+    Args:
+        messages: Messages to render
+        max_chars: Content characters kept per message
+
+    Returns:
+        One line per message
+    """
+    lines = []
+    for msg in messages:
+        if msg.type == "human":
+            role = "User"
+        elif msg.type == "tool":
+            role = f"Tool ({getattr(msg, 'name', None) or 'result'})"
+        else:
+            role = "Assistant"
+        content = str(msg.content)
+        if not content and getattr(msg, "tool_calls", None):
+            content = f"[called {', '.join(tc.get('name', 'unknown') for tc in msg.tool_calls)}]"
+        lines.append(f"{role}: {content[:max_chars]}")
+    return "\n".join(lines)
+
+
+async def summarize_messages(llm, messages: List[BaseMessage],
+                             previous_summary: Optional[str] = None) -> str:
+    """Fold messages into a conversation summary.
+
+    Args:
+        llm: Chat model used to write the summary
+        messages: Messages not yet covered by the summary
+        previous_summary: Summary of everything before ``messages``
+
+    Returns:
+        Summary covering the previous summary and the messages
+    """
+    from src.utils.prompt_templates import CONVERSATION_SUMMARY_PROMPT
+
+    prompt = CONVERSATION_SUMMARY_PROMPT.format(
+        previous_summary=previous_summary or "None",
+        conversation_messages=format_messages_for_summary(messages)
+    )
+    response = await llm.ainvoke([HumanMessage(content=prompt)])
+    return response.content if hasattr(response, "content") else str(response)
+
+
+class ConversationHistory:
+    """Token-budgeted message window with a rolling summary of older turns."""
+
+    def __init__(self, max_tokens: Optional[int] = None, target_tokens: Optional[int] = None):
+        self.max_tokens = max_tokens or config.get('conversation.history_max_tokens', 24000)
+        self.target_tokens = min(
+            target_tokens or config.get('conversation.history_target_tokens', 12000),
+            self.max_tokens
+        )
+
+    def eviction_count(self, messages: List[BaseMessage]) -> int:
+        """Number of leading messages to move into the summary.
+
+        Zero while the messages fit in ``max_tokens``. Otherwise the cut is
+        the earliest user turn from which the rest fits in ``target_tokens``,
+        or the latest user turn if no such turn exists.
+        """
+        suffix_tokens = estimate_suffix_tokens(messages)
+        if not suffix_tokens or suffix_tokens[0] <= self.max_tokens:
+            return 0
+        # (index of a user message, tokens from there to the end), latest first
+        boundaries = [(index, suffix_tokens[index]) for index in range(len(messages) - 1, -1, -1)
+                      if isinstance(messages[index], HumanMessage)]
+        if not boundaries:
+            return 0
+        cut = boundaries[0][0]
+        for index, tokens in boundaries:
+            if tokens > self.target_tokens:
+                break
+            cut = index
+        return cut
+
+    async def compact(self, messages: List[BaseMessage], summary: Optional[str],
+                      llm) -> Tuple[int, Optional[str]]:
+        """Summarize the messages that no longer fit.
+
+        Args:
+            messages: The thread's messages, oldest first
+            summary: The thread's current summary
+            llm: Chat model used to write the summary
+
+        Returns:
+            (number of leading messages to remove, summary including them).
+            Nothing is removed if summarizing fails; the next turn retries.
+        """
+        count = self.eviction_count(messages)
+        if not count:
+            return 0, summary
+
+        try:
+            new_summary = await summarize_messages(llm, messages[:count], summary)
+        except Exception as e:
+            logger.warning("conversation_summary_failed",
+                message_count=len(messages),
+                evicted_count=count,
+                error=str(e),
+                error_type=type(e).__name__
+            )
+            return 0, summary
+
+        logger.info("conversation_history_compacted",
+            message_count=len(messages),
+            evicted_count=count,
+            kept_tokens=estimate_message_tokens(messages[count:]),
+            summary_length=len(new_summary)
+        )
+        return count, new_summary
@@ -0,0 +1,128 @@
+"""Memoized per-message token counts.
+
+Counting a conversation's tokens encodes every message again, and trimming
+counts the same messages over and over while it searches for a cut. A
+message's count only depends on the message, so TokenCounter counts each
+message once and keeps the result in a bounded LRU shared by all counters
+(``llm.token_cache_size`` entries). Counting a list then sums cached
+values.
+
+Messages are keyed by type, id, name, a hash of their content and, for
+tool calls, a hash of the calls, so a message replaced under the same id
+with new content is counted again.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Union
+
+from langchain_core.messages import BaseMessage
+
+from src.utils.config import config
+
+Count = Union[int, float]
+
+
+def message_cache_key(message: BaseMessage) -> Hashable:
+    """Key identifying a message's token-relevant contents."""
+    content = message.content if isinstance(message.content, str) else str(message.content)
+    tool_calls = getattr(message, "tool_calls", None)
+    return (
+        message.type,
+        message.id,
+        getattr(message, "name", None),
+        hash(content),
+        hash(repr(tool_calls)) if tool_calls else None
+    )
+
+
+class MessageTokenCache:
+    """Bounded LRU of per-message counts"""
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries or config.get('llm.token_cache_size', 10000)
+        self._entries: "OrderedDict[Hashable, Count]" = OrderedDict()
+        self._lock = threading.Lock()  # cost tracking counts from worker threads
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Count]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Count):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, Count]:
+        """Size and hit rate of the cache"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0
+        }
+
+
+# Global cache shared by all counters
+_cache: Optional[MessageTokenCache] = None
+
+
+def get_token_cache() -> MessageTokenCache:
+    """Get the global per-message token cache"""
+    global _cache
+    if _cache is None:
+        _cache = MessageTokenCache()
+    return _cache
+
+
+class TokenCounter:
+    """Counts tokens message by message, memoizing each message's count.
+
+    Args:
+        name: Distinguishes this counter's entries in the shared cache;
+            counters with different counting rules need different names
+        count_message: Count for a single message
+    """
+
+    def __init__(self, name: str, count_message: Callable[[BaseMessage], Count]):
+        self.name = name
+        self.count_message = count_message
+
+    def count(self, message: BaseMessage) -> Count:
+        """Count for one message, computed once"""
+        cache = get_token_cache()
+        key = (self.name, message_cache_key(message))
+        value = cache.get(key)
+        if value is None:
+            value = self.count_message(message)
+            cache.put(key, value)
+        return value
+
+    def total(self, messages: Sequence[BaseMessage]) -> Count:
+        """Sum of the messages' counts"""
+        return sum(self.count(message) for message in messages)
+
+    def suffix_totals(self, messages: Sequence[BaseMessage]) -> List[Count]:
+        """``totals[i]`` is the count of ``messages[i:]``"""
+        totals = [0] * (len(messages) + 1)
+        for index in range(len(messages) - 1, -1, -1):
+            totals[index] = totals[index + 1] + self.count(messages[index])
+        return totals[:-1]
@@ -0,0 +1,157 @@
+"""Concurrent execution of the tool calls in a single LLM response.
+
+When the LLM emits several tool calls at once (e.g. fetch an account and
+its open opportunities), running them one after another makes the step
+take the sum of their latencies. These helpers run them concurrently while
+keeping the ToolMessages in the order of the original calls.
+
+Interactive tools (HumanInputTool) raise GraphInterrupt and are re-run on
+resume, so they are never batched with other calls: siblings dispatched
+with them would be executed twice.
+"""
+
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from langchain_core.tools import BaseTool, StructuredTool
+
+from src.utils.config.constants import (
+    AGENT_TOOL_MAX_CONCURRENCY,
+    TOOL_CALL_MAX_CONCURRENCY,
+    TOOL_EXECUTOR_MAX_WORKERS
+)
+from src.utils.logging.framework import SmartLogger
+
+logger = SmartLogger("tool_execution")
+
+# Tools that pause the graph for user input
+INTERACTIVE_TOOL_NAMES = frozenset({"human_input"})
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# Agent name -> (loop, semaphore); semaphores are bound to the loop using them
+_agent_limiters: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+
+
+def get_tool_executor() -> ThreadPoolExecutor:
+    """Bounded thread pool shared by synchronous tools."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=TOOL_EXECUTOR_MAX_WORKERS,
+                                               thread_name_prefix="tool-call")
+    return _executor
+
+
+def get_agent_limiter(agent_name: str,
+                      limit: int = AGENT_TOOL_MAX_CONCURRENCY) -> asyncio.Semaphore:
+    """Per-agent cap on tool executions in flight across all tasks.
+
+    An agent process serves many A2A tasks at once; the cap keeps one burst
+    of tool calls from occupying every executor thread and connection.
+    """
+    loop = asyncio.get_running_loop()
+    entry = _agent_limiters.get(agent_name)
+    if entry is None or entry[0] is not loop:
+        entry = (loop, asyncio.Semaphore(max(1, limit)))
+        _agent_limiters[agent_name] = entry
+    return entry[1]
+
+
+def _has_native_async(tool: BaseTool) -> bool:
+    if isinstance(tool, StructuredTool):
+        return tool.coroutine is not None
+    return type(tool)._arun is not BaseTool._arun
+
+
+async def invoke_tool(tool: BaseTool, args: Dict[str, Any],
+                      limiter: Optional[asyncio.Semaphore] = None) -> Any:
+    """Invoke a tool without blocking the event loop.
+
+    Async tools are awaited directly. Synchronous tools run on the bounded
+    tool executor with a copy of the current context, so logging context
+    and LangGraph's runnable config are visible inside the tool.
+
+    Args:
+        tool: Tool to invoke
+        args: Tool arguments
+        limiter: Optional semaphore bounding concurrent executions
+    """
+    if limiter is not None:
+        async with limiter:
+            return await invoke_tool(tool, args)
+
+    if _has_native_async(tool):
+        return await tool.ainvoke(args)
+
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        get_tool_executor(),
+        functools.partial(context.run, tool.invoke, args)
+    )
+
+
+async def execute_tool_calls(tool_calls: List[Dict[str, Any]],
+                             execute_one: Callable[[Dict[str, Any]], Awaitable[Any]],
+                             max_concurrency: int = TOOL_CALL_MAX_CONCURRENCY) -> List[Any]:
+    """Run tool calls concurrently and return their results in call order.
+
+    ``execute_one`` handles a single call and is expected to turn ordinary
+    tool errors into a result (an error ToolMessage). Anything it raises,
+    such as GraphInterrupt, propagates to the caller once the other calls of
+    the same batch have finished; the first exception in call order wins.
+
+    Interactive tool calls run on their own, after every earlier call has
+    completed and before any later one starts.
+
+    Args:
+        tool_calls: Tool calls from the LLM response
+        execute_one: Coroutine function executing one tool call
+        max_concurrency: Upper bound on calls in flight at once
+
+    Returns:
+        One result per tool call, in the same order
+    """
+    if len(tool_calls) <= 1:
+        return [await execute_one(tool_call) for tool_call in tool_calls]
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def bounded(tool_call: Dict[str, Any]) -> Any:
+        async with semaphore:
+            return await execute_one(tool_call)
+
+    async def run_batch(batch: List[Dict[str, Any]]) -> List[Any]:
+        if len(batch) == 1:
+            return [await execute_one(batch[0])]
+        outcomes = await asyncio.gather(*(bounded(tc) for tc in batch), return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        return list(outcomes)
+
+    logger.debug("tool_calls_dispatching",
+                 tool_count=len(tool_calls),
+                 tool_names=[tc.get("name") for tc in tool_calls],
+                 max_concurrency=max_concurrency)
+
+    results: List[Any] = []
+    batch: List[Dict[str, Any]] = []
+    for tool_call in tool_calls:
+        if tool_call.get("name") in INTERACTIVE_TOOL_NAMES:
+            if batch:
+                results.extend(await run_batch(batch))
+                batch = []
+            results.append(await execute_one(tool_call))
+        else:
+            batch.append(tool_call)
+    if batch:
+        results.extend(await run_batch(batch))
+    return results
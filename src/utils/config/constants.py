@@ -93,6 +93,11 @@ CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
 CIRCUIT_BREAKER_TIMEOUT = 30
 CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS = 3
 
+# Tool execution within a single agent step
+TOOL_CALL_MAX_CONCURRENCY = 8  # Parallel tool calls dispatched together
+TOOL_EXECUTOR_MAX_WORKERS = 16  # Threads shared by synchronous tools
+AGENT_TOOL_MAX_CONCURRENCY = 8  # In-flight tool executions per agent, across tasks
+
 # Deterministic LLM settings for background tasks
 DETERMINISTIC_TEMPERATURE = 0.0  # For summarization, memory extraction
 DETERMINISTIC_TOP_P = 0.1  # Focused sampling for consistency
@@ -102,4 +107,5 @@ JSONRPC_PARSE_ERROR = -32700       # Parse error
 JSONRPC_INVALID_REQUEST = -32600   # Invalid Request
 JSONRPC_METHOD_NOT_FOUND = -32601  # Method not found
 JSONRPC_INVALID_PARAMS = -32602    # Invalid params
-JSONRPC_INTERNAL_ERROR = -32603    # Internal error
\ No newline at end of file
+JSONRPC_INTERNAL_ERROR = -32603    # Internal error
+JSONRPC_STATE_CACHE_MISS = -32001  # Delta-encoded task references unknown state
@@ -59,7 +59,12 @@ class UnifiedConfig:
                 "pool_size": 5,
                 "auto_commit": True,
                 "thread_pool_size": 4,
-                "thread_prefix": "sqlite_"
+                "thread_prefix": "sqlite_",
+                "checkpointer": "sqlite",
+                "checkpoint_dir": "checkpoints",
+                "checkpoint_max_per_thread": 10,
+                "checkpoint_thread_ttl": 604800,
+                "checkpoint_prune_interval": 300
             },
             "logging": {
                 "level": "INFO",
@@ -77,7 +82,14 @@ class UnifiedConfig:
                 "timeout": 120,
                 "retry_attempts": 3,
                 "retry_delay": 1.0,
-                "recursion_limit": 15
+                "recursion_limit": 15,
+                "cache_enabled": True,
+                "cache_ttl": 3600,
+                "cache_max_temperature": 0.1,
+                "cache_max_entries": 1000,
+                "cache_backend": "sqlite",
+                "cache_path": "llm_cache.db",
+                "token_cache_size": 10000
             },
             "a2a": {
                 "timeout": 120,
@@ -86,15 +98,61 @@ class UnifiedConfig:
                 "sock_read_timeout": 120,
                 "health_check_timeout": 10,
                 "max_concurrent_calls": 10,
+                "adaptive_concurrency_enabled": True,
+                "concurrency_min_limit": 1,
+                "concurrency_max_limit": 20,
+                "concurrency_queue_timeout": 30,
+                "concurrency_backoff_ratio": 0.7,
+                "concurrency_latency_tolerance": 2.0,
+                "hedging_enabled": True,
+                "hedged_methods": ["get_agent_card"],
+                "hedge_percentile": 95.0,
+                "hedge_min_delay": 0.05,
+                "hedge_budget_ratio": 0.1,
+                "hedge_min_samples": 10,
                 "retry_attempts": 3,
                 "retry_delay": 1.0,
                 "circuit_breaker_threshold": 5,
                 "circuit_breaker_timeout": 30,
-                "connection_pool_size": 20
+                "circuit_breaker_window": 60,
+                "circuit_breaker_min_calls": 10,
+                "circuit_breaker_failure_rate": 0.5,
+                "circuit_breaker_slow_call_duration": 20,
+                "circuit_breaker_slow_call_rate": 0.8,
+                "connection_pool_size": 20,
+                "streaming_enabled": True,
+                "idempotency_enabled": True,
+                "async_tasks_enabled": True,
+                "async_task_timeout": 1800,
+                "task_poll_wait": 20,
+                "task_status_max_wait": 30,
+                "task_result_ttl": 600,
+                "task_store_max_tasks": 500,
+                "task_max_events": 1000,
+                "max_batch_size": 50,
+                "state_delta_enabled": True,
+                "state_delta_min_bytes": 256,
+                "state_cache_max_threads": 256,
+                "state_cache_max_entries": 128,
+                "compression_enabled": True,
+                "compression_min_bytes": 1024,
+                "compression_encodings": ["zstd", "gzip"],
+                "gzip_level": 6,
+                "zstd_level": 3,
+                "codecs": ["application/msgpack", "application/json"]
+            },
+            "http_client": {
+                "pool_size": 20,
+                "max_retries": 3,
+                "retry_backoff": 0.5,
+                "connect_timeout": 10,
+                "read_timeout": 60
             },
             "conversation": {
                 "summary_threshold": 5,
                 "max_conversation_length": 50,
+                "history_max_tokens": 24000,
+                "history_target_tokens": 12000,
                 "default_user_id": "user-1",
                 "memory_namespace_prefix": "memory",
                 "typing_effect_enabled": True,
@@ -103,6 +161,14 @@ class UnifiedConfig:
             "security": {
                 "input_validation_enabled": True,
                 "max_input_length": 50000
+            },
+            "orchestrator": {
+                "parallel_steps_enabled": True,
+                "max_parallel_steps": 4,
+                "plan_cache_enabled": True,
+                "plan_cache_similarity": 0.95,
+                "plan_cache_max_entries": 500,
+                "plan_cache_ttl": 86400
             }
         }
     
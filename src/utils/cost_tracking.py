@@ -4,11 +4,13 @@ This module provides utilities to track token usage and calculate costs
 for various LLM models used in the system.
 """
 
+import functools
 import tiktoken
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage, ToolMessage
 
+from src.utils.agents.message_processing.token_budget import TokenCounter
 from src.utils.logging.framework import SmartLogger
 
 logger = SmartLogger("cost_tracking")
@@ -45,6 +47,9 @@ class CostTracker:
     # Token encoding cache for performance
     _encoders = {}
     
+    # Memoized per-message counters, one per model
+    _message_counters: Dict[str, TokenCounter] = {}
+    
     @classmethod
     def get_encoder(cls, model: str) -> tiktoken.Encoding:
         """Get cached token encoder for a model."""
@@ -67,8 +72,20 @@ class CostTracker:
     def count_message_tokens(cls, messages: List[BaseMessage], model: str = "gpt-4o-mini") -> int:
         """Count tokens in a list of messages.
         
-        Based on OpenAI's token counting guide for chat models.
+        Based on OpenAI's token counting guide for chat models. Each
+        message is encoded once; its count is cached for later calls.
         """
+        counter = cls._message_counters.get(model)
+        if counter is None:
+            counter = TokenCounter(f"tiktoken:{model}", functools.partial(cls._encode_message_tokens, model=model))
+            cls._message_counters[model] = counter
+        
+        # Every reply is primed with <|im_start|>assistant<|im_sep|>
+        return counter.total(messages) + 3
+    
+    @classmethod
+    def _encode_message_tokens(cls, message: BaseMessage, model: str) -> int:
+        """Count tokens in one message, including its per-message overhead."""
         encoder = cls.get_encoder(model)
         
         # Token overhead per message
@@ -80,39 +97,34 @@ class CostTracker:
             tokens_per_message = 3
             tokens_per_name = 1
         
-        num_tokens = 0
-        for message in messages:
-            num_tokens += tokens_per_message
-            
-            # Count role/type tokens
-            if isinstance(message, SystemMessage):
-                num_tokens += len(encoder.encode("system"))
-            elif isinstance(message, HumanMessage):
-                num_tokens += len(encoder.encode("user"))
-            elif isinstance(message, AIMessage):
-                num_tokens += len(encoder.encode("assistant"))
-            elif isinstance(message, ToolMessage):
-                num_tokens += len(encoder.encode("tool"))
-            
-            # Count content tokens
-            if hasattr(message, 'content') and message.content:
-                num_tokens += len(encoder.encode(str(message.content)))
-            
-            # Count tool calls if present
-            if hasattr(message, 'tool_calls') and message.tool_calls:
-                for tool_call in message.tool_calls:
-                    # Tool name and arguments
-                    num_tokens += len(encoder.encode(tool_call.get('name', '')))
-                    args_str = str(tool_call.get('args', {}))
-                    num_tokens += len(encoder.encode(args_str))
-            
-            # Count name if present
-            if hasattr(message, 'name') and message.name:
-                num_tokens += tokens_per_name
-                num_tokens += len(encoder.encode(message.name))
-        
-        # Every reply is primed with <|im_start|>assistant<|im_sep|>
-        num_tokens += 3
+        num_tokens = tokens_per_message
+        
+        # Count role/type tokens
+        if isinstance(message, SystemMessage):
+            num_tokens += len(encoder.encode("system"))
+        elif isinstance(message, HumanMessage):
+            num_tokens += len(encoder.encode("user"))
+        elif isinstance(message, AIMessage):
+            num_tokens += len(encoder.encode("assistant"))
+        elif isinstance(message, ToolMessage):
+            num_tokens += len(encoder.encode("tool"))
+        
+        # Count content tokens
+        if hasattr(message, 'content') and message.content:
+            num_tokens += len(encoder.encode(str(message.content)))
+        
+        # Count tool calls if present
+        if hasattr(message, 'tool_calls') and message.tool_calls:
+            for tool_call in message.tool_calls:
+                # Tool name and arguments
+                num_tokens += len(encoder.encode(tool_call.get('name', '')))
+                args_str = str(tool_call.get('args', {}))
+                num_tokens += len(encoder.encode(args_str))
+        
+        # Count name if present
+        if hasattr(message, 'name') and message.name:
+            num_tokens += tokens_per_name
+            num_tokens += len(encoder.encode(message.name))
         
         return num_tokens
     
@@ -1,14 +1,17 @@
 """Decorator-based cost tracking for LLM instances.
 
 This module provides decorators that can wrap any LLM instance to add
-cost tracking without inheritance issues.
+cost tracking without inheritance issues. The wrapper also answers
+repeated low-temperature calls from the LLM response cache
+(``llm.cache_enabled``, see src/utils/llm_cache.py).
 """
 
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 from langchain_core.messages import BaseMessage
 from langchain_core.outputs import ChatResult
 
 from src.utils.cost_tracking import CostTracker
+from src.utils.llm_cache import get_llm_cache, is_cacheable, make_cache_key
 from src.utils.logging.framework import SmartLogger
 
 logger = SmartLogger("cost_tracking_decorator")
@@ -32,14 +35,19 @@ def with_cost_tracking(component: str):
         # Get deployment name from the instance
         deployment_name = getattr(llm_instance, 'deployment_name', 'unknown')
         
-        def _generate_with_tracking(messages: List[BaseMessage], 
-                                   stop: Optional[List[str]] = None,
-                                   run_manager: Optional[Any] = None,
-                                   **kwargs: Any) -> ChatResult:
-            """Wrap _generate with cost tracking."""
-            # Call original method
-            result = original_generate(messages, stop, run_manager, **kwargs)
-            
+        def _cache_key(messages: List[BaseMessage], stop: Optional[List[str]],
+                       kwargs: Dict[str, Any]) -> Optional[str]:
+            """Response cache key, or None if this call is not cached."""
+            if get_llm_cache() is None or not is_cacheable(getattr(llm_instance, 'temperature', None)):
+                return None
+            params = dict(getattr(llm_instance, '_default_params', {}) or {})
+            params["deployment"] = deployment_name
+            params["top_p"] = getattr(llm_instance, 'top_p', None)
+            return make_cache_key(messages, params, stop, kwargs)
+        
+        def _track(messages: List[BaseMessage], result: ChatResult,
+                   run_manager: Optional[Any], cache_status: Optional[str] = None):
+            """Log token usage and cost for a response."""
             # Extract operation and thread_id from run_manager if available
             operation = "unknown"
             thread_id = None
@@ -56,25 +64,69 @@ def with_cost_tracking(component: str):
                 metadata = {
                     "thread_id": thread_id,
                     "deployment": deployment_name,
+                    "cache": cache_status,
                 }
                 
                 # Remove None values from metadata
                 metadata = {k: v for k, v in metadata.items() if v is not None}
                 
                 try:
-                    CostTracker.track_messages(
-                        messages=messages,
-                        response=response_message,
-                        model=deployment_name,
-                        component=component,
-                        operation=operation,
-                        metadata=metadata
-                    )
+                    if cache_status == "hit":
+                        # Nothing was sent; record what the call would have cost
+                        input_tokens = CostTracker.count_message_tokens(messages, deployment_name)
+                        output_tokens = CostTracker.count_message_tokens([response_message], deployment_name)
+                        metadata["saved_cost_usd"] = round(
+                            CostTracker.calculate_cost(input_tokens, output_tokens, deployment_name), 6
+                        )
+                        CostTracker.log_llm_usage(
+                            component=component,
+                            operation=operation,
+                            model=deployment_name,
+                            input_tokens=0,
+                            output_tokens=0,
+                            cost=0.0,
+                            metadata=metadata
+                        )
+                    else:
+                        CostTracker.track_messages(
+                            messages=messages,
+                            response=response_message,
+                            model=deployment_name,
+                            component=component,
+                            operation=operation,
+                            metadata=metadata
+                        )
                 except Exception as e:
                     logger.error("cost_tracking_failed",
                                 error=str(e),
                                 component=component,
                                 operation=operation)
+        
+        def _generate_with_tracking(messages: List[BaseMessage], 
+                                   stop: Optional[List[str]] = None,
+                                   run_manager: Optional[Any] = None,
+                                   **kwargs: Any) -> ChatResult:
+            """Wrap _generate with response caching and cost tracking."""
+            key = _cache_key(messages, stop, kwargs)
+            if key is not None:
+                try:
+                    cached = get_llm_cache().lookup(key)
+                except Exception as e:
+                    logger.warning("llm_cache_lookup_failed", error=str(e), component=component)
+                    cached = None
+                if cached is not None:
+                    _track(messages, cached, run_manager, "hit")
+                    return cached
+            
+            # Call original method
+            result = original_generate(messages, stop, run_manager, **kwargs)
+            _track(messages, result, run_manager, "miss" if key is not None else None)
+            
+            if key is not None:
+                try:
+                    get_llm_cache().update(key, result)
+                except Exception as e:
+                    logger.warning("llm_cache_update_failed", error=str(e), component=component)
             
             return result
         
@@ -82,45 +134,27 @@ def with_cost_tracking(component: str):
                                           stop: Optional[List[str]] = None,
                                           run_manager: Optional[Any] = None,
                                           **kwargs: Any) -> ChatResult:
-            """Wrap _agenerate with cost tracking."""
+            """Wrap _agenerate with response caching and cost tracking."""
+            key = _cache_key(messages, stop, kwargs)
+            if key is not None:
+                try:
+                    cached = await get_llm_cache().alookup(key)
+                except Exception as e:
+                    logger.warning("llm_cache_lookup_failed", error=str(e), component=component)
+                    cached = None
+                if cached is not None:
+                    _track(messages, cached, run_manager, "hit")
+                    return cached
+            
             # Call original method
             result = await original_agenerate(messages, stop, run_manager, **kwargs)
+            _track(messages, result, run_manager, "miss" if key is not None else None)
             
-            # Extract operation and thread_id from run_manager if available
-            operation = "unknown"
-            thread_id = None
-            
-            if run_manager and hasattr(run_manager, 'extra'):
-                extra = run_manager.extra or {}
-                operation = extra.get("operation", operation)
-                thread_id = extra.get("thread_id", thread_id)
-                
-            # Track the cost using the result
-            if result.generations and len(result.generations) > 0:
-                response_message = result.generations[0].message
-                
-                metadata = {
-                    "thread_id": thread_id,
-                    "deployment": deployment_name,
-                }
-                
-                # Remove None values from metadata
-                metadata = {k: v for k, v in metadata.items() if v is not None}
-                
+            if key is not None:
                 try:
-                    CostTracker.track_messages(
-                        messages=messages,
-                        response=response_message,
-                        model=deployment_name,
-                        component=component,
-                        operation=operation,
-                        metadata=metadata
-                    )
+                    await get_llm_cache().aupdate(key, result)
                 except Exception as e:
-                    logger.error("cost_tracking_failed",
-                                error=str(e),
-                                component=component,
-                                operation=operation)
+                    logger.warning("llm_cache_update_failed", error=str(e), component=component)
             
             return result
         
@@ -0,0 +1,278 @@
+"""Response cache for LLM calls.
+
+Summaries, memory extraction and replans are often sent with exactly the
+same messages and parameters more than once. With ``llm.cache_enabled``,
+the cost-tracking wrapper looks such calls up here before calling Azure
+OpenAI, and stores the response afterwards.
+
+A call is cached only if its temperature is at most
+``llm.cache_max_temperature``, so creative calls are always answered
+fresh. The key covers the normalized messages (type, content, name and
+tool call names and arguments; message and tool call ids are left out),
+the deployment, the model parameters, stop words and the bound tool
+schema. Tool results are part of the messages, so a cached tool call is
+still executed against live data.
+
+Entries live for ``llm.cache_ttl`` seconds in an in-memory LRU of
+``llm.cache_max_entries`` responses, backed by a SQLite table
+(``llm.cache_path``) shared by every process on the host. Set
+``llm.cache_backend`` to ``memory`` to skip the table. Processes close the
+table's pooled connections with close_llm_cache() on shutdown.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from src.utils.config import config
+from src.utils.logging import get_smart_logger
+from src.utils.storage.async_sqlite import AsyncSQLitePool, ConnectionConfig
+
+logger = get_smart_logger("storage")
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL
+)
+"""
+_SELECT = "SELECT value, created_at FROM llm_cache WHERE key = ? AND created_at >= ?"
+_UPSERT = "INSERT OR REPLACE INTO llm_cache (key, value, created_at) VALUES (?, ?, ?)"
+_PURGE = "DELETE FROM llm_cache WHERE created_at < ?"
+
+
+def _normalize_message(message: BaseMessage) -> Dict[str, Any]:
+    normalized = {"type": message.type, "content": message.content}
+    if getattr(message, "name", None):
+        normalized["name"] = message.name
+    tool_calls = getattr(message, "tool_calls", None)
+    if tool_calls:
+        normalized["tool_calls"] = [[call.get("name"), call.get("args")] for call in tool_calls]
+    return normalized
+
+
+def make_cache_key(messages: List[BaseMessage], params: Dict[str, Any],
+                   stop: Optional[List[str]], kwargs: Dict[str, Any]) -> str:
+    """Cache key for a call: hash of its messages, parameters and tools."""
+    payload = {
+        "messages": [_normalize_message(message) for message in messages],
+        "params": params,
+        "stop": stop,
+        "kwargs": kwargs
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _dump_result(result: ChatResult) -> str:
+    return json.dumps({
+        "generations": [
+            {"message": message_to_dict(generation.message), "generation_info": generation.generation_info}
+            for generation in result.generations
+        ],
+        "llm_output": result.llm_output
+    }, default=str)
+
+
+def _load_result(value: str) -> ChatResult:
+    data = json.loads(value)
+    generations = []
+    for generation in data["generations"]:
+        message = messages_from_dict([generation["message"]])[0]
+        # The caller assigns a fresh run id, as for a live response
+        message.id = None
+        generations.append(ChatGeneration(message=message, generation_info=generation["generation_info"]))
+    return ChatResult(generations=generations, llm_output=data["llm_output"])
+
+
+class LLMResponseCache:
+    """In-memory LRU of LLM responses in front of a SQLite table, with a TTL."""
+
+    def __init__(self, ttl: Optional[float] = None, max_entries: Optional[int] = None,
+                 database_path: Optional[str] = None, prune_interval: float = 300.0):
+        self.ttl = ttl if ttl is not None else config.get('llm.cache_ttl', 3600)
+        self.max_entries = max_entries or config.get('llm.cache_max_entries', 1000)
+        self.database_path = database_path
+        self.prune_interval = prune_interval
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()  # sync LLM calls may run in worker threads
+        self._last_prune = 0.0
+        self._table_ready = False
+        self.pool = AsyncSQLitePool(ConnectionConfig(database_path=database_path)) if database_path else None
+
+    # In-memory front
+
+    def _get_local(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _put_local(self, key: str, value: str, created_at: float):
+        with self._lock:
+            self._entries[key] = (created_at + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _should_prune(self, now: float) -> bool:
+        if now - self._last_prune < self.prune_interval:
+            return False
+        self._last_prune = now
+        return True
+
+    # Sync path
+
+    def _connect(self) -> sqlite3.Connection:
+        Path(self.database_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.database_path, timeout=self.pool.config.timeout)
+        if not self._table_ready:
+            conn.execute(_CREATE_TABLE)
+            self._table_ready = True
+        return conn
+
+    def lookup(self, key: str) -> Optional[ChatResult]:
+        """Cached response for a key, or None"""
+        value = self._get_local(key)
+        if value is None and self.pool is not None:
+            now = time.time()
+            conn = self._connect()
+            try:
+                row = conn.execute(_SELECT, (key, now - self.ttl)).fetchone()
+            finally:
+                conn.close()
+            if row is not None:
+                value = row[0]
+                self._put_local(key, value, row[1])
+        return _load_result(value) if value is not None else None
+
+    def update(self, key: str, result: ChatResult):
+        """Store a response"""
+        value = _dump_result(result)
+        now = time.time()
+        self._put_local(key, value, now)
+        if self.pool is None:
+            return
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(_UPSERT, (key, value, now))
+                if self._should_prune(now):
+                    conn.execute(_PURGE, (now - self.ttl,))
+        finally:
+            conn.close()
+
+    # Async path
+
+    async def _ensure_table(self, conn):
+        if not self._table_ready:
+            await conn.execute(_CREATE_TABLE)
+            await conn.commit()
+            self._table_ready = True
+
+    async def alookup(self, key: str) -> Optional[ChatResult]:
+        """Cached response for a key, or None"""
+        value = self._get_local(key)
+        if value is None and self.pool is not None:
+            now = time.time()
+            async with self.pool.get_connection() as conn:
+                await self._ensure_table(conn)
+                async with conn.execute(_SELECT, (key, now - self.ttl)) as cursor:
+                    row = await cursor.fetchone()
+            if row is not None:
+                value = row[0]
+                self._put_local(key, value, row[1])
+        return _load_result(value) if value is not None else None
+
+    async def aupdate(self, key: str, result: ChatResult):
+        """Store a response"""
+        value = _dump_result(result)
+        now = time.time()
+        self._put_local(key, value, now)
+        if self.pool is None:
+            return
+        async with self.pool.get_connection() as conn:
+            await self._ensure_table(conn)
+            await conn.execute(_UPSERT, (key, value, now))
+            if self._should_prune(now):
+                await conn.execute(_PURGE, (now - self.ttl,))
+            await conn.commit()
+
+    def clear(self):
+        """Drop all cached responses"""
+        with self._lock:
+            self._entries.clear()
+        if self.pool is not None and Path(self.database_path).exists():
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute("DELETE FROM llm_cache")
+            finally:
+                conn.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Size and settings of the cache"""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "database_path": self.database_path
+        }
+
+
+# Global response cache
+_llm_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """Get the global response cache, or None if ``llm.cache_enabled`` is off"""
+    global _llm_cache
+    if not config.get('llm.cache_enabled', False):
+        return None
+    if _llm_cache is None:
+        backend = config.get('llm.cache_backend', 'sqlite')
+        _llm_cache = LLMResponseCache(
+            database_path=config.get('llm.cache_path', 'llm_cache.db') if backend == "sqlite" else None
+        )
+        logger.info("llm_cache_created",
+            operation="init",
+            backend=backend,
+            ttl=_llm_cache.ttl,
+            max_entries=_llm_cache.max_entries
+        )
+    return _llm_cache
+
+
+async def close_llm_cache():
+    """Close the global cache's pooled SQLite connections
+
+    Idle aiosqlite connections keep non-daemon worker threads running, so
+    components call this from their shutdown hooks.
+    """
+    global _llm_cache
+    if _llm_cache is not None and _llm_cache.pool is not None:
+        await _llm_cache.pool.close_all()
+    _llm_cache = None
+
+
+def is_cacheable(temperature: Optional[float]) -> bool:
+    """Whether calls at this temperature may be answered from the cache
+
+    An unset temperature means the service default, which is not low.
+    """
+    return temperature is not None and temperature <= config.get('llm.cache_max_temperature', 0.1)
@@ -195,9 +195,12 @@ def log_execution(func_or_component: Union[Callable, str, None] = None, operatio
 
 def _create_wrapper(func: Callable, component: Optional[str], operation: Optional[str], 
                    include_args: bool, include_result: bool, log_errors: bool) -> Callable:
-    """Create the actual wrapper function for logging."""
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
+    """Create the actual wrapper function for logging.
+    
+    Coroutine functions get a coroutine wrapper so that callers (e.g. LangGraph)
+    still detect them as async and timings cover the awaited execution.
+    """
+    def _start(args, kwargs):
         # Auto-detect component if not provided
         func_component = component
         if not func_component:
@@ -229,64 +232,88 @@ def _create_wrapper(func: Callable, component: Optional[str], operation: Optiona
                        execution_id=exec_id,
                        **log_args)
         
-        start_time = time.time()
+        return func_logger, op_name, exec_id, time.time()
+    
+    def _complete(ctx, result):
+        func_logger, op_name, exec_id, start_time = ctx
+        
+        # Calculate duration
+        duration = time.time() - start_time
+        
+        # Prepare result for logging
+        log_result = {}
+        if include_result:
+            # Be careful with large results
+            result_str = str(result)
+            if len(result_str) > 1000:
+                log_result['result_preview'] = result_str[:500] + '...'
+                log_result['result_size'] = len(result_str)
+            else:
+                log_result['result'] = result
+        
+        # Log successful completion
+        func_logger.info(f"function_complete_{op_name}",
+                       operation=op_name,
+                       function=func.__name__,
+                       execution_id=exec_id,
+                       duration_seconds=round(duration, 3),
+                       success=True,
+                       **log_result)
+    
+    def _fail(ctx, e):
+        func_logger, op_name, exec_id, start_time = ctx
         
+        # Calculate duration
+        duration = time.time() - start_time
+        
+        if log_errors:
+            # Check if this is a GraphInterrupt (expected behavior)
+            from langgraph.errors import GraphInterrupt
+            if isinstance(e, GraphInterrupt):
+                # Log as INFO, not ERROR - this is expected behavior
+                func_logger.info(f"function_interrupt_{op_name}",
+                               operation=op_name,
+                               function=func.__name__,
+                               execution_id=exec_id,
+                               duration_seconds=round(duration, 3),
+                               interrupt_type="GraphInterrupt",
+                               interrupt_value=str(e.args[0]) if e.args else "")
+            else:
+                # Log actual error
+                func_logger.error(f"function_error_{op_name}",
+                                operation=op_name,
+                                function=func.__name__,
+                                execution_id=exec_id,
+                                duration_seconds=round(duration, 3),
+                                success=False,
+                                error=str(e),
+                                error_type=type(e).__name__)
+    
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            ctx = _start(args, kwargs)
+            try:
+                result = await func(*args, **kwargs)
+                _complete(ctx, result)
+                return result
+            except Exception as e:
+                _fail(ctx, e)
+                # Re-raise the exception
+                raise
+        
+        return async_wrapper
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        ctx = _start(args, kwargs)
         try:
             # Execute function
             result = func(*args, **kwargs)
-            
-            # Calculate duration
-            duration = time.time() - start_time
-            
-            # Prepare result for logging
-            log_result = {}
-            if include_result:
-                # Be careful with large results
-                result_str = str(result)
-                if len(result_str) > 1000:
-                    log_result['result_preview'] = result_str[:500] + '...'
-                    log_result['result_size'] = len(result_str)
-                else:
-                    log_result['result'] = result
-            
-            # Log successful completion
-            func_logger.info(f"function_complete_{op_name}",
-                           operation=op_name,
-                           function=func.__name__,
-                           execution_id=exec_id,
-                           duration_seconds=round(duration, 3),
-                           success=True,
-                           **log_result)
-            
+            _complete(ctx, result)
             return result
-            
         except Exception as e:
-            # Calculate duration
-            duration = time.time() - start_time
-            
-            if log_errors:
-                # Check if this is a GraphInterrupt (expected behavior)
-                from langgraph.errors import GraphInterrupt
-                if isinstance(e, GraphInterrupt):
-                    # Log as INFO, not ERROR - this is expected behavior
-                    func_logger.info(f"function_interrupt_{op_name}",
-                                   operation=op_name,
-                                   function=func.__name__,
-                                   execution_id=exec_id,
-                                   duration_seconds=round(duration, 3),
-                                   interrupt_type="GraphInterrupt",
-                                   interrupt_value=str(e.args[0]) if e.args else "")
-                else:
-                    # Log actual error
-                    func_logger.error(f"function_error_{op_name}",
-                                    operation=op_name,
-                                    function=func.__name__,
-                                    execution_id=exec_id,
-                                    duration_seconds=round(duration, 3),
-                                    success=False,
-                                    error=str(e),
-                                    error_type=type(e).__name__)
-            
+            _fail(ctx, e)
             # Re-raise the exception
             raise
     
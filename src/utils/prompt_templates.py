@@ -1434,6 +1434,13 @@ PLANNING PRINCIPLES:
 - Analysis + action → Separate steps when analysis informs the action
 - Cross-system workflows → Steps for each system involved
 
+STEP DEPENDENCIES (depends_on):
+- For each step, list the numbers of earlier steps whose results it needs
+- Steps with no dependencies run at the same time, so only list genuine data dependencies
+- Example: "1. Look up the account in Salesforce", "2. Find open incidents in ServiceNow", "3. Summarize the account and its incidents" → depends_on: [[], [], [1, 2]]
+- Steps that use human_input always run on their own
+- Omit depends_on when every step needs the one before it
+
 EXAMPLE PATTERNS:
 - Greetings → "Greet the user and ask how you can help"
 - Data retrieval → "Retrieve the [entity] from [system]"  
@@ -1466,6 +1473,11 @@ CRITICAL DECISION RULE:
 - If remaining_steps_count = 0: You MAY return Response with final answer
 - NEVER return Response when there are unfinished steps!
 
+STEP DEPENDENCIES:
+- Several independent steps may have run at the same time - remove EVERY step that appears in past steps
+- Plan steps shown as "(after step N)" depend on step N
+- Return depends_on for the remaining steps, numbered by their new positions; leave it empty for a strictly sequential plan
+
 CRITICAL RULES:
 1. NO META-OPERATIONS: Never add verification, review, or confirmation steps
 2. COMPLETE ALL STEPS: Return Response ONLY when ALL {total_steps_count} planned steps are executed
@@ -3,6 +3,7 @@
 from .sqlite_store import SQLiteStore
 from .async_sqlite import AsyncSQLiteStore
 from .async_store_adapter import get_async_store_adapter
+from .checkpointer import PrunedSQLiteSaver, close_checkpointers, get_checkpointer
 
 # Global SQLite store instance
 global_sqlite_store = None
@@ -18,6 +19,9 @@ __all__ = [
     "SQLiteStore",
     "AsyncSQLiteStore", 
     "get_async_store_adapter",
+    "PrunedSQLiteSaver",
+    "get_checkpointer",
+    "close_checkpointers",
     "global_sqlite_store",
     "get_global_sqlite_store"
 ]
\ No newline at end of file
@@ -93,14 +93,26 @@ class AsyncSQLitePool:
         if not self._initialized:
             await self.initialize()
         
-        # For simplicity, always create a new connection
-        # In production, you'd want proper pooling
-        conn = await self._create_connection()
+        # Reuse an idle connection; opening one costs a round of PRAGMAs.
+        # Idle connections keep their worker threads alive: owners must
+        # call close_all() on shutdown or the process cannot exit
+        try:
+            conn = self._pool.get_nowait()
+        except asyncio.QueueEmpty:
+            conn = await self._create_connection()
         
         try:
             yield conn
         finally:
-            await conn.close()
+            try:
+                if conn.in_transaction:
+                    # Never hand out a connection with someone else's open transaction
+                    await conn.rollback()
+                self._pool.put_nowait(conn)
+            except asyncio.QueueFull:
+                await conn.close()
+            except Exception:
+                await conn.close()
     
     async def close_all(self):
         """Close all connections in the pool"""
@@ -0,0 +1,494 @@
+"""
+Persistent LangGraph checkpointer with bounded history
+
+Graphs compiled with MemorySaver keep every checkpoint of every thread in
+process memory for the life of the process, and lose them all on restart.
+PrunedSQLiteSaver stores checkpoints in SQLite through AsyncSQLitePool and
+bounds what it keeps:
+
+- Only the newest ``max_checkpoints`` checkpoints per thread and namespace.
+  Older ones, their pending writes and the channel values no other
+  checkpoint references are deleted whenever a checkpoint is saved.
+- Threads without a new checkpoint for ``thread_ttl`` seconds are deleted,
+  checked at most every ``prune_interval`` seconds.
+
+Channel values are stored once per version, as in MemorySaver, so a
+checkpoint only writes the channels that changed. The latest checkpoint and
+its pending writes are always kept, so get_state and resuming interrupted
+threads work as before. Async methods (ainvoke, aget_state) go through the
+pool; sync methods use a short-lived sqlite3 connection. Processes close the
+pooled connections with close_checkpointers() on shutdown.
+"""
+
+import json
+import random
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata
+)
+
+from ..config import config
+from ..logging import get_smart_logger
+from .async_sqlite import AsyncSQLitePool, ConnectionConfig
+
+logger = get_smart_logger("storage")
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS checkpoints (
+        thread_id TEXT NOT NULL,
+        checkpoint_ns TEXT NOT NULL DEFAULT '',
+        checkpoint_id TEXT NOT NULL,
+        parent_checkpoint_id TEXT,
+        type TEXT,
+        checkpoint BLOB,
+        metadata_type TEXT,
+        metadata BLOB,
+        channel_versions TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS checkpoint_blobs (
+        thread_id TEXT NOT NULL,
+        checkpoint_ns TEXT NOT NULL DEFAULT '',
+        channel TEXT NOT NULL,
+        version TEXT NOT NULL,
+        type TEXT NOT NULL,
+        blob BLOB,
+        PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS checkpoint_writes (
+        thread_id TEXT NOT NULL,
+        checkpoint_ns TEXT NOT NULL DEFAULT '',
+        checkpoint_id TEXT NOT NULL,
+        task_id TEXT NOT NULL,
+        idx INTEGER NOT NULL,
+        channel TEXT NOT NULL,
+        type TEXT,
+        value BLOB,
+        task_path TEXT NOT NULL DEFAULT '',
+        PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_checkpoints_thread_created ON checkpoints(thread_id, created_at)"
+]
+
+_SELECT_CHECKPOINT = """
+    SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id,
+           type, checkpoint, metadata_type, metadata, channel_versions
+    FROM checkpoints
+"""
+
+_SELECT_BLOBS = """
+    SELECT b.channel, b.type, b.blob
+    FROM checkpoint_blobs b
+    JOIN json_each(?) v ON b.channel = v.key AND b.version = CAST(v.value AS TEXT)
+    WHERE b.thread_id = ? AND b.checkpoint_ns = ?
+"""
+
+_SELECT_WRITES = """
+    SELECT task_id, channel, type, value
+    FROM checkpoint_writes
+    WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?
+    ORDER BY task_id, idx
+"""
+
+_INSERT_CHECKPOINT = """
+    INSERT OR REPLACE INTO checkpoints
+        (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint,
+         metadata_type, metadata, channel_versions, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_BLOB = """
+    INSERT OR IGNORE INTO checkpoint_blobs (thread_id, checkpoint_ns, channel, version, type, blob)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_UPSERT_WRITE = """
+    INSERT OR REPLACE INTO checkpoint_writes
+        (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value, task_path)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_WRITE = _UPSERT_WRITE.replace("INSERT OR REPLACE", "INSERT OR IGNORE")
+
+# Run after each put with (thread_id, checkpoint_ns, max_checkpoints)
+_PRUNE_CHECKPOINTS = """
+    DELETE FROM checkpoints
+    WHERE thread_id = ?1 AND checkpoint_ns = ?2 AND checkpoint_id NOT IN (
+        SELECT checkpoint_id FROM checkpoints
+        WHERE thread_id = ?1 AND checkpoint_ns = ?2
+        ORDER BY checkpoint_id DESC LIMIT ?3
+    )
+"""
+
+# Run with (thread_id, checkpoint_ns) once checkpoints were pruned. Writes
+# are only dropped for checkpoints older than every kept one: LangGraph saves
+# a step's pending writes (including interrupts) before its checkpoint, so
+# writes of a checkpoint not stored yet must survive a concurrent prune
+_PRUNE_ORPHANS = [
+    """
+    DELETE FROM checkpoint_writes
+    WHERE thread_id = ?1 AND checkpoint_ns = ?2 AND checkpoint_id < (
+        SELECT MIN(checkpoint_id) FROM checkpoints WHERE thread_id = ?1 AND checkpoint_ns = ?2
+    )
+    """,
+    """
+    DELETE FROM checkpoint_blobs
+    WHERE thread_id = ?1 AND checkpoint_ns = ?2 AND NOT EXISTS (
+        SELECT 1 FROM checkpoints c, json_each(c.channel_versions) v
+        WHERE c.thread_id = ?1 AND c.checkpoint_ns = ?2
+          AND v.key = checkpoint_blobs.channel
+          AND CAST(v.value AS TEXT) = checkpoint_blobs.version
+    )
+    """
+]
+
+_SELECT_IDLE_THREADS = """
+    SELECT thread_id FROM checkpoints GROUP BY thread_id HAVING MAX(created_at) < ?
+"""
+
+_DELETE_THREAD = [
+    "DELETE FROM checkpoints WHERE thread_id = ?",
+    "DELETE FROM checkpoint_blobs WHERE thread_id = ?",
+    "DELETE FROM checkpoint_writes WHERE thread_id = ?"
+]
+
+
+class PrunedSQLiteSaver(BaseCheckpointSaver[str]):
+    """SQLite checkpointer keeping the last K checkpoints per thread"""
+
+    def __init__(self, database_path: str, max_checkpoints: int = 10,
+                 thread_ttl: float = 7 * 24 * 3600, prune_interval: float = 300, **kwargs):
+        super().__init__(**kwargs)
+        self.database_path = database_path
+        self.max_checkpoints = max(1, max_checkpoints)
+        self.thread_ttl = thread_ttl
+        self.prune_interval = prune_interval
+        self.pool = AsyncSQLitePool(ConnectionConfig(database_path=database_path))
+        self._schema_ready = False
+        self._last_idle_prune = time.monotonic()
+
+    # -- helpers shared by the sync and async paths --
+
+    @staticmethod
+    def _key(config: RunnableConfig) -> Tuple[str, str]:
+        configurable = config["configurable"]
+        return configurable["thread_id"], configurable.get("checkpoint_ns", "")
+
+    def _checkpoint_query(self, config: Optional[RunnableConfig], filter_before: Optional[RunnableConfig] = None,
+                          latest_only: bool = False) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        if config is not None:
+            configurable = config["configurable"]
+            clauses.append("thread_id = ?")
+            params.append(configurable["thread_id"])
+            if configurable.get("checkpoint_ns") is not None:
+                clauses.append("checkpoint_ns = ?")
+                params.append(configurable["checkpoint_ns"])
+            if checkpoint_id := get_checkpoint_id(config):
+                clauses.append("checkpoint_id = ?")
+                params.append(checkpoint_id)
+        if filter_before is not None and (before_id := get_checkpoint_id(filter_before)):
+            clauses.append("checkpoint_id < ?")
+            params.append(before_id)
+        sql = _SELECT_CHECKPOINT
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY checkpoint_id DESC"
+        if latest_only:
+            sql += " LIMIT 1"
+        return sql, params
+
+    def _to_tuple(self, row: Sequence[Any], blobs: List[Sequence[Any]],
+                  writes: List[Sequence[Any]]) -> CheckpointTuple:
+        thread_id, checkpoint_ns, checkpoint_id, parent_id, type_, checkpoint, metadata_type, metadata, _ = row
+        checkpoint_: Checkpoint = self.serde.loads_typed((type_, checkpoint))
+        channel_values = {
+            channel: self.serde.loads_typed((blob_type, blob))
+            for channel, blob_type, blob in blobs if blob_type != "empty"
+        }
+        return CheckpointTuple(
+            config={"configurable": {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns,
+                                     "checkpoint_id": checkpoint_id}},
+            checkpoint={**checkpoint_, "channel_values": channel_values},
+            metadata=self.serde.loads_typed((metadata_type, metadata)),
+            parent_config=(
+                {"configurable": {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns,
+                                  "checkpoint_id": parent_id}}
+                if parent_id else None
+            ),
+            pending_writes=[
+                (task_id, channel, self.serde.loads_typed((value_type, value)))
+                for task_id, channel, value_type, value in writes
+            ]
+        )
+
+    def _matches(self, row: Sequence[Any], filter: Optional[Dict[str, Any]]) -> bool:
+        if not filter:
+            return True
+        metadata = self.serde.loads_typed((row[6], row[7]))
+        return all(metadata.get(key) == value for key, value in filter.items())
+
+    def _put_rows(self, config: RunnableConfig, checkpoint: Checkpoint, metadata: CheckpointMetadata,
+                  new_versions: ChannelVersions) -> Tuple[Tuple[Any, ...], List[Tuple[Any, ...]]]:
+        thread_id, checkpoint_ns = self._key(config)
+        stored = checkpoint.copy()
+        values: Dict[str, Any] = stored.pop("channel_values")
+        blob_rows = [
+            (thread_id, checkpoint_ns, channel, str(version),
+             *(self.serde.dumps_typed(values[channel]) if channel in values else ("empty", None)))
+            for channel, version in new_versions.items()
+        ]
+        type_, payload = self.serde.dumps_typed(stored)
+        metadata_type, metadata_payload = self.serde.dumps_typed(get_checkpoint_metadata(config, metadata))
+        versions = json.dumps({channel: str(version) for channel, version in checkpoint["channel_versions"].items()})
+        checkpoint_row = (thread_id, checkpoint_ns, checkpoint["id"], config["configurable"].get("checkpoint_id"),
+                          type_, payload, metadata_type, metadata_payload, versions, time.time())
+        return checkpoint_row, blob_rows
+
+    def _write_rows(self, config: RunnableConfig, writes: Sequence[Tuple[str, Any]], task_id: str,
+                    task_path: str) -> Tuple[str, List[Tuple[Any, ...]]]:
+        thread_id, checkpoint_ns = self._key(config)
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        rows = [
+            (thread_id, checkpoint_ns, checkpoint_id, task_id, WRITES_IDX_MAP.get(channel, idx), channel,
+             *self.serde.dumps_typed(value), task_path)
+            for idx, (channel, value) in enumerate(writes)
+        ]
+        # Special writes (errors, interrupts) replace earlier ones; regular writes are kept once
+        statement = _UPSERT_WRITE if all(channel in WRITES_IDX_MAP for channel, _ in writes) else _INSERT_WRITE
+        return statement, rows
+
+    @staticmethod
+    def _saved_config(checkpoint_row: Tuple[Any, ...]) -> RunnableConfig:
+        return {"configurable": {"thread_id": checkpoint_row[0], "checkpoint_ns": checkpoint_row[1],
+                                 "checkpoint_id": checkpoint_row[2]}}
+
+    def _idle_prune_due(self) -> bool:
+        now = time.monotonic()
+        if self.thread_ttl <= 0 or now - self._last_idle_prune < self.prune_interval:
+            return False
+        self._last_idle_prune = now
+        return True
+
+    def get_next_version(self, current: Optional[str], channel: None) -> str:
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+    # -- sync API --
+
+    @contextmanager
+    def _sync_connection(self) -> Iterator[sqlite3.Connection]:
+        Path(self.database_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.database_path, timeout=self.pool.config.timeout)
+        try:
+            if not self._schema_ready:
+                for statement in _SCHEMA:
+                    conn.execute(statement)
+                self._schema_ready = True
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _load_sync(self, conn: sqlite3.Connection, row: Sequence[Any]) -> CheckpointTuple:
+        blobs = conn.execute(_SELECT_BLOBS, (row[8], row[0], row[1])).fetchall()
+        writes = conn.execute(_SELECT_WRITES, (row[0], row[1], row[2])).fetchall()
+        return self._to_tuple(row, blobs, writes)
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        sql, params = self._checkpoint_query({"configurable": {"checkpoint_ns": "", **config["configurable"]}},
+                                             latest_only=True)
+        with self._sync_connection() as conn:
+            row = conn.execute(sql, params).fetchone()
+            return self._load_sync(conn, row) if row else None
+
+    def list(self, config: Optional[RunnableConfig], *, filter: Optional[Dict[str, Any]] = None,
+             before: Optional[RunnableConfig] = None, limit: Optional[int] = None) -> Iterator[CheckpointTuple]:
+        sql, params = self._checkpoint_query(config, before)
+        with self._sync_connection() as conn:
+            rows = conn.execute(sql, params).fetchall()
+            results = []
+            for row in rows:
+                if limit is not None and len(results) >= limit:
+                    break
+                if self._matches(row, filter):
+                    results.append(self._load_sync(conn, row))
+        yield from results
+
+    def put(self, config: RunnableConfig, checkpoint: Checkpoint, metadata: CheckpointMetadata,
+            new_versions: ChannelVersions) -> RunnableConfig:
+        checkpoint_row, blob_rows = self._put_rows(config, checkpoint, metadata, new_versions)
+        with self._sync_connection() as conn:
+            conn.executemany(_INSERT_BLOB, blob_rows)
+            conn.execute(_INSERT_CHECKPOINT, checkpoint_row)
+            if conn.execute(_PRUNE_CHECKPOINTS, (*checkpoint_row[:2], self.max_checkpoints)).rowcount:
+                for statement in _PRUNE_ORPHANS:
+                    conn.execute(statement, checkpoint_row[:2])
+            if self._idle_prune_due():
+                cutoff = time.time() - self.thread_ttl
+                for (thread_id,) in conn.execute(_SELECT_IDLE_THREADS, (cutoff,)).fetchall():
+                    for statement in _DELETE_THREAD:
+                        conn.execute(statement, (thread_id,))
+        return self._saved_config(checkpoint_row)
+
+    def put_writes(self, config: RunnableConfig, writes: Sequence[Tuple[str, Any]], task_id: str,
+                   task_path: str = "") -> None:
+        statement, rows = self._write_rows(config, writes, task_id, task_path)
+        with self._sync_connection() as conn:
+            conn.executemany(statement, rows)
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._sync_connection() as conn:
+            for statement in _DELETE_THREAD:
+                conn.execute(statement, (thread_id,))
+
+    # -- async API --
+
+    async def _ensure_schema(self, conn):
+        if not self._schema_ready:
+            for statement in _SCHEMA:
+                await conn.execute(statement)
+            await conn.commit()
+            self._schema_ready = True
+
+    async def _fetchall(self, conn, sql: str, params: Sequence[Any]) -> List[Any]:
+        async with conn.execute(sql, params) as cursor:
+            return list(await cursor.fetchall())
+
+    async def _load(self, conn, row: Sequence[Any]) -> CheckpointTuple:
+        blobs = await self._fetchall(conn, _SELECT_BLOBS, (row[8], row[0], row[1]))
+        writes = await self._fetchall(conn, _SELECT_WRITES, (row[0], row[1], row[2]))
+        return self._to_tuple(row, blobs, writes)
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        sql, params = self._checkpoint_query({"configurable": {"checkpoint_ns": "", **config["configurable"]}},
+                                             latest_only=True)
+        async with self.pool.get_connection() as conn:
+            await self._ensure_schema(conn)
+            rows = await self._fetchall(conn, sql, params)
+            return await self._load(conn, rows[0]) if rows else None
+
+    async def alist(self, config: Optional[RunnableConfig], *, filter: Optional[Dict[str, Any]] = None,
+                    before: Optional[RunnableConfig] = None,
+                    limit: Optional[int] = None) -> AsyncIterator[CheckpointTuple]:
+        sql, params = self._checkpoint_query(config, before)
+        async with self.pool.get_connection() as conn:
+            await self._ensure_schema(conn)
+            results = []
+            for row in await self._fetchall(conn, sql, params):
+                if limit is not None and len(results) >= limit:
+                    break
+                if self._matches(row, filter):
+                    results.append(await self._load(conn, row))
+        for result in results:
+            yield result
+
+    async def aput(self, config: RunnableConfig, checkpoint: Checkpoint, metadata: CheckpointMetadata,
+                   new_versions: ChannelVersions) -> RunnableConfig:
+        checkpoint_row, blob_rows = self._put_rows(config, checkpoint, metadata, new_versions)
+        async with self.pool.get_connection() as conn:
+            await self._ensure_schema(conn)
+            await conn.executemany(_INSERT_BLOB, blob_rows)
+            await conn.execute(_INSERT_CHECKPOINT, checkpoint_row)
+            pruned = await conn.execute(_PRUNE_CHECKPOINTS, (*checkpoint_row[:2], self.max_checkpoints))
+            if pruned.rowcount:
+                for statement in _PRUNE_ORPHANS:
+                    await conn.execute(statement, checkpoint_row[:2])
+            idle_threads = []
+            if self._idle_prune_due():
+                idle_threads = await self._fetchall(conn, _SELECT_IDLE_THREADS, (time.time() - self.thread_ttl,))
+                for (thread_id,) in idle_threads:
+                    for statement in _DELETE_THREAD:
+                        await conn.execute(statement, (thread_id,))
+            await conn.commit()
+        if idle_threads:
+            logger.info("checkpoint_idle_threads_pruned",
+                operation="prune",
+                thread_count=len(idle_threads),
+                thread_ttl=self.thread_ttl
+            )
+        return self._saved_config(checkpoint_row)
+
+    async def aput_writes(self, config: RunnableConfig, writes: Sequence[Tuple[str, Any]], task_id: str,
+                          task_path: str = "") -> None:
+        statement, rows = self._write_rows(config, writes, task_id, task_path)
+        async with self.pool.get_connection() as conn:
+            await self._ensure_schema(conn)
+            await conn.executemany(statement, rows)
+            await conn.commit()
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        async with self.pool.get_connection() as conn:
+            await self._ensure_schema(conn)
+            for statement in _DELETE_THREAD:
+                await conn.execute(statement, (thread_id,))
+            await conn.commit()
+
+
+# One checkpointer per component (orchestrator, salesforce, ...) and process
+_checkpointers: Dict[str, BaseCheckpointSaver] = {}
+
+
+def get_checkpointer(component: str) -> BaseCheckpointSaver:
+    """Checkpointer for a component's graphs, as configured under ``database``
+
+    ``database.checkpointer`` selects ``sqlite`` (PrunedSQLiteSaver, one
+    database file per component under ``database.checkpoint_dir``) or
+    ``memory`` (MemorySaver, unbounded and lost on restart).
+    """
+    if component not in _checkpointers:
+        backend = config.get('database.checkpointer', 'sqlite')
+        if backend == "memory":
+            from langgraph.checkpoint.memory import MemorySaver
+            _checkpointers[component] = MemorySaver()
+        else:
+            checkpoint_dir = config.get('database.checkpoint_dir', 'checkpoints')
+            _checkpointers[component] = PrunedSQLiteSaver(
+                f"{checkpoint_dir}/{component}.db",
+                max_checkpoints=config.get('database.checkpoint_max_per_thread', 10),
+                thread_ttl=config.get('database.checkpoint_thread_ttl', 7 * 24 * 3600),
+                prune_interval=config.get('database.checkpoint_prune_interval', 300)
+            )
+        logger.info("checkpointer_created",
+            operation="init",
+            component_name=component,
+            backend=backend
+        )
+    return _checkpointers[component]
+
+
+async def close_checkpointers():
+    """Close the pooled connections of all SQLite checkpointers
+
+    Idle aiosqlite connections keep non-daemon worker threads running, so
+    components call this from their shutdown hooks.
+    """
+    for component, checkpointer in list(_checkpointers.items()):
+        if isinstance(checkpointer, PrunedSQLiteSaver):
+            await checkpointer.pool.close_all()
+        del _checkpointers[component]